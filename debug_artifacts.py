@@ -0,0 +1,108 @@
+# debug_artifacts.py
+#
+# Background writer for debug screenshots and HTML dumps, shared by script4_hcad_enrichment.py and the RP scraper
+# (scripts/harris_property_scraper v3 phase 2 & 3.py). Captures are taken on the calling thread (a Playwright page
+# only works there); compressing and writing happen on a daemon thread fed by a bounded queue, so a slow disk
+# never holds up a search. When the queue is full the capture is dropped and counted.
+#
+# Modes:
+#   "off"       nothing is captured
+#   "on_error"  error captures only
+#   "sampled"   every error capture, plus sample_percent % of the routine (non-error) captures
+#   "always"    every capture
+#
+# HTML is saved as .html.zst when the optional zstandard package is installed, else as .html.gz. Only the newest
+# max_files files in the folder are kept (counting files from earlier runs); older ones are deleted as new ones land.
+
+import contextlib
+import gzip
+import os
+import queue
+import random
+import threading
+from collections import deque
+
+try:
+    import zstandard # Optional: HTML dumps fall back to gzip without it
+except ImportError:
+    zstandard = None
+
+
+class DebugArtifactWriter:
+    """
+    Callers ask should_capture(is_error) first; save_screenshot/save_html then hand the captured bytes
+    to the writer thread. log is the owning script's print function for warnings.
+    """
+
+    def __init__(self, folder, mode, sample_percent, max_files, queue_size, log=print):
+        self.folder = str(folder)
+        self.mode = mode
+        self.sample_percent = sample_percent
+        self.max_files = max_files
+        self.log = log
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._retained = None # Paths on disk, oldest first
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def should_capture(self, is_error):
+        if self.mode == "always": return True
+        if self.mode == "on_error": return is_error
+        if self.mode == "sampled": return is_error or random.random() * 100 < self.sample_percent
+        return False
+
+    def save_screenshot(self, page, file_stem):
+        self._submit(f"{file_stem}.png", page.screenshot(), compress=False)
+
+    def save_html(self, html, file_stem):
+        self._submit(f"{file_stem}.html", html.encode("utf-8"), compress=True)
+
+    def _count(self, counter_name):
+        with self._lock:
+            setattr(self, counter_name, getattr(self, counter_name) + 1)
+
+    def _submit(self, filename, data, compress):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name="debug-artifact-writer", daemon=True)
+                self._thread.start()
+        try:
+            self._queue.put_nowait((filename, data, compress))
+        except queue.Full:
+            self._count("dropped")
+
+    def _write_loop(self):
+        while True:
+            filename, data, compress = self._queue.get()
+            try:
+                if compress and zstandard is not None: data = zstandard.ZstdCompressor(level=10).compress(data); filename += ".zst"
+                elif compress: data = gzip.compress(data, compresslevel=6); filename += ".gz"
+                self._write_file(filename, data)
+                self._count("written")
+            except Exception as e:
+                self._count("failed")
+                self.log(f"WARN: Could not write debug artifact {filename}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write_file(self, filename, data):
+        if self._retained is None:
+            os.makedirs(self.folder, exist_ok=True)
+            existing = [os.path.join(self.folder, name) for name in os.listdir(self.folder)]
+            self._retained = deque(sorted((path for path in existing if os.path.isfile(path)), key=os.path.getmtime))
+        path = os.path.join(self.folder, filename)
+        with open(path, "wb") as f: f.write(data)
+        self._retained.append(path)
+        while len(self._retained) > self.max_files:
+            with contextlib.suppress(FileNotFoundError): os.remove(self._retained.popleft())
+
+    def flush(self):
+        """Blocks until every queued artifact has been written."""
+        if self._thread is not None: self._queue.join()
+
+    def stats_line(self):
+        with self._lock:
+            return f"written={self.written}, dropped (queue full)={self.dropped}, failed={self.failed}"
@@ -11,6 +11,20 @@ from rapidfuzz import fuzz, process
 import traceback
 import datetime
 import json
+import sqlite3
+import csv
+import threading
+import queue
+import contextlib
+import io
+import lxml.html
+import ast
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, Future
+from debug_artifacts import DebugArtifactWriter
 
 # from rapidfuzz import fuzz # For later stages (fuzzy matching)
 
@@ -23,6 +37,7 @@ LEGAL_DESC_INPUT_SELECTOR = 'input[name="desc"]'
 OWNER_NAME_INPUT_SELECTOR = 'input[name="name"]'
 SEARCH_BUTTON_SELECTOR = 'input#Search'
 RECORD_COUNT_TEXT_SELECTOR = 'p.justcenter'
+HCAD_SEARCH_IFRAME_SELECTOR = 'iframe[src*="public.hcad.org/records/Real/Advanced.asp"]'
 
 # NEW and MUCH BETTER selector for result rows based on your provided table HTML:
 RESULTS_TABLE_ROWS_SELECTOR = 'table.bgcolor_1 > tbody > tr[bgcolor="ffffff"]'
@@ -42,7 +57,53 @@ COMMON_SURNAMES = {
 } # Add more if needed
 
 HCAD_RESULTS_PER_PAGE = 20 # Or whatever you observe HCAD's typical first page limit to be (e.g., 20, 25, 50)
-HCAD_DETAIL_CACHE = {}
+# Pagination harvest: when a search reports more than HCAD_RESULTS_PER_PAGE records but no more than
+# HCAD_PAGINATION_HARVEST_MAX_RECORDS, the remaining result pages are walked with the results-page "Next"
+# control and each page's rows are scored with _score_summary_candidates as they arrive. The walk stops early
+# once a clear summary winner stands out (the thresholds choose_best_from_multiple uses), and the harvested
+# rows are returned as MULTIPLE_HITS. 0 = off: PAGINATION_TOO_LARGE keeps only the first page (e.g. try 100).
+HCAD_PAGINATION_HARVEST_MAX_RECORDS = 0
+HCAD_PAGINATION_HARVEST_MAX_PAGES = 10
+RESULTS_NEXT_PAGE_SELECTOR = 'a:has-text("Next"), input[type="submit"][value*="Next"]'
+# Persistent account-detail store (see HcadDetailStore). Entries older than the TTL are re-scraped,
+# and once the store holds more than MAX_ENTRIES accounts the least recently used ones are evicted.
+HCAD_CACHE_DB_PATH = os.path.join("hcad_cache", "hcad_cache.sqlite3")
+HCAD_DETAIL_CACHE_TTL_DAYS = 30
+HCAD_DETAIL_CACHE_MAX_ENTRIES = 50000
+# Search outcomes keyed by the normalized (legal_desc_query, owner_name_query) pair, kept in the same SQLite file.
+HCAD_QUERY_CACHE_TTL_DAYS = 7
+HCAD_QUERY_CACHE_STATUSES = ("NO_HITS", "MULTIPLE_HITS", "SINGLE_ITEM_IN_LIST", "UNIQUE_HIT", "PAGINATION_TOO_LARGE")
+
+# --- Tier Planner ---
+# For each query shape (which of lot/block/tract/section/subdivision/grantee/decedent a row has) the
+# planner records how often each tier was searched and how often it produced the match. Once a shape
+# has enough history, the tiers after T0 are tried in order of historical success, and tiers that have
+# never matched that shape are dropped. T0 always runs first so its name-confirmation flow is unchanged, and the
+# legal-only tiers (HCAD_LEGAL_ONLY_TIERS) keep their narrow-to-broad order among themselves, which the
+# pagination skip relies on.
+HCAD_TIER_PLANNER_ENABLED = True
+HCAD_TIER_PLANNER_MIN_SHAPE_ROWS = 20 # Rows of history for a shape before its tiers are reordered
+HCAD_TIER_PLANNER_SKIP_AFTER_ATTEMPTS = 50 # A tier searched this often for a shape without a single match is skipped
+
+# --- Broad Subdivision Registry ---
+# Legal-only queries (T2/T3/T4) that came back PAGINATION_TOO_LARGE, shared by all rows and runs. When one of
+# a row's own legal-only queries is registered, that tier and the legal-only tiers broader than it are skipped
+# up front, just as they would be after the row hit the pagination limit itself; narrower tiers still run.
+# Owner-name tiers are never recorded. Entries older than the TTL are ignored.
+HCAD_BROAD_SUBDIVISION_TTL_DAYS = 90
+HCAD_LEGAL_ONLY_TIERS = ("T2_ExactLegal", "T3_DropSec", "T4_Subdivision_Block") # Narrowest first
+
+# --- Offline Bulk Extract Mode ---
+# HCAD publishes its certified roll as tab-delimited text files (real_acct.txt: one line per account with
+# mailing/site address, values and legal lines lgl_1..lgl_4; owners.txt: one line per owner). Load them once
+# with scripts/load_hcad_bulk_extract.py; with HCAD_BULK_EXTRACT_MODE on, every tier query and detail lookup is
+# answered from that store and no browser is started. The extract has no land/building tables or value history;
+# with HCAD_BULK_EXTRACT_SITE_BACKFILL on, those fields are filled from the account's detail page over HTTP.
+HCAD_BULK_EXTRACT_MODE = False
+HCAD_BULK_EXTRACT_DIR = os.path.join("data", "hcad_bulk_extract")
+HCAD_BULK_EXTRACT_DB_PATH = os.path.join("hcad_cache", "hcad_bulk_extract.sqlite3")
+HCAD_BULK_EXTRACT_SITE_BACKFILL = False
+HCAD_BULK_DETAIL_URL_TEMPLATE = "https://public.hcad.org/records/details.asp?cap=1&acct={acct}"
 # Thresholds and limits for choose_best_from_multiple (Task 6)
 SUMMARY_SCORE_ABSOLUTE_THRESHOLD = 60 # Min summary score for a candidate to be considered a 'good' pick
 SUMMARY_SCORE_DIFFERENCE_THRESHOLD = 20 # Min difference between top 1 and top 2 summary scores for a clear pick
@@ -55,11 +116,898 @@ DETAILED_SCORE_DIFFERENCE_THRESHOLD_HIGH_CONF = 15
 DETAILED_SCORE_DIFFERENCE_THRESHOLD_LOW_CONF = 10
 # If a single detailed candidate scores above this, it's an auto-winner (after detail fetch)
 AUTO_WINNER_DETAIL_SCORE_THRESHOLD = 90 
+# "DEBUG" also prints per-tier scoring detail (e.g. the top 5 summary candidates of every results list).
+HCAD_LOG_LEVEL = "INFO"
+
+# --- Local Candidate Index ---
+# Every account in HCAD_DETAIL_CACHE is indexed by its LT/BLK/TR/SEC values, subdivision trigrams and owner
+# name words. Before any tier is searched, the accounts sharing the most tokens with the row are scored with
+# _score_detailed_candidate; if exactly one clears AUTO_WINNER_DETAIL_SCORE_THRESHOLD it is taken and no remote
+# search runs. Otherwise these candidates are always detail-scored by choose_best_from_multiple when a tier lists them.
+# Off by default: a row with only a subdivision can score 100 on legal alone, so an auto-win rests on the owner
+# surname check. Turn it on once its matches have been reviewed against searched results.
+HCAD_LOCAL_INDEX_ENABLED = False
+HCAD_LOCAL_INDEX_MAX_CANDIDATES = 25
+HCAD_LOCAL_INDEX_TIER_NAME = "L0_LocalCandidateIndex"
+
+# --- Concurrency & Pacing ---
+# HCAD_NUM_WORKERS > 1 runs main_hcad_processing_loop_concurrent: every worker thread owns its own browser
+# and page and pulls rows from a shared queue. The delays below are per worker; HCAD_MAX_REQUESTS_PER_MINUTE
+# is a ceiling on searches, resets and detail fetches across all workers combined. It only applies when more
+# than one worker runs; a single page is paced by the delays alone.
+HCAD_NUM_WORKERS = 1
+HCAD_ROW_DELAY_S = 1.0
+HCAD_TIER_DELAY_S = 0.75
+HCAD_DETAIL_FETCH_DELAY_S = 0.75
+HCAD_MAX_REQUESTS_PER_MINUTE = 60
+# With HCAD_SPECULATIVE_TIER_K > 1, each row submits its first K searchable, uncached tiers from
+# HCAD_SPECULATIVE_TIER_NAMES to a pool of K extra browser pages before the tier loop starts. The loop still
+# evaluates tiers in priority order and accepts the first acceptable winner; it takes each tier's already
+# running search instead of issuing it, and the remaining speculative searches are cancelled or discarded.
+HCAD_SPECULATIVE_TIER_K = 0 # 0/1 = off
+HCAD_SPECULATIVE_TIER_NAMES = ("T0_ExactLotBlockSubdivision", "T2_ExactLegal", "T1_GrantorLastName_Subdivision", "T1_GranteeLastName_Subdivision")
+# The Advanced search iframe returns to its form after every search (via its own Change Criteria button),
+# so with HCAD_RESET_ONLY_ON_ERROR the page is only reloaded before a search when that form is not showing
+# (first use, or an error left the page elsewhere). False restores a forced reload before every tier.
+HCAD_RESET_ONLY_ON_ERROR = True
+HCAD_BROWSER_LAUNCH_OPTIONS = {"headless": True, "slow_mo": 100}
+HCAD_BROWSER_CONTEXT_OPTIONS = {
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
+    "viewport": {'width': 1280, 'height': 1024}, "locale": 'en-US',
+    "timezone_id": 'America/Chicago', "java_script_enabled": True,
+}
+
+# --- Detail Page Parsing ---
+# "snapshot" reads each detail page with one p_page.content() call and parses it with lxml;
+# "locator" is the original per-field Playwright locator engine.
+HCAD_DETAIL_PARSE_ENGINE = "snapshot"
+# The browser path reads the 5-year history URL from the link instead of clicking it into a new tab.
+# "http" downloads that page on the detail thread pool while the detail page is being parsed (falling back to
+# "page" if the download fails); "page" navigates the detail page's own tab to it.
+HCAD_HISTORY_FETCH_MODE = "http"
+# "http" fetches detail and 5-year history pages over a pooled keep-alive requests session and parses
+# them with the snapshot engine, so Playwright is only needed for the iframe search form. If an HTTP
+# fetch fails (or yields no account) and a browser page is available, the browser path is used instead.
+HCAD_DETAIL_FETCH_MODE = "http"
+HCAD_HTTP_TIMEOUT_S = 30
+HCAD_HTTP_POOL_SIZE = 10
+HCAD_HTTP_MAX_RETRIES = 2
+HCAD_HTTP_MAX_WORKERS = 4 # Threads used by fetch_hcad_details_concurrent
+# When choose_best_from_multiple has a clear summary winner, take it with its results-list fields right away and
+# fetch its detail page in the background (over HTTP, on the same thread pool). The remaining detail fields are
+# filled in when the run's rows are collected; hcad_detail_backfill_status records PENDING -> DONE/FAILED.
+HCAD_DEFER_SUMMARY_WINNER_DETAILS = False
+
+# --- Two-Phase Enrichment ---
+# Phase 1 resolves every row from the detail page's core fields only (account, owner, mailing/site address, legal
+# description, land/improvement/total market value), without the 5-year history page. Phase 2 then fetches the full
+# record (land, building and building area tables, characteristics, appraised value and history) over HTTP, only
+# for rows whose match_score_total is at least HCAD_HEAVY_DETAIL_MIN_MATCH_SCORE or whose match_confidence_level
+# is in HCAD_HEAVY_DETAIL_CONFIDENCE_LEVELS (e.g. ("High",)). hcad_detail_level records CORE or FULL per row.
+HCAD_TWO_PHASE_ENRICHMENT = False
+HCAD_HEAVY_DETAIL_MIN_MATCH_SCORE = 80
+HCAD_HEAVY_DETAIL_CONFIDENCE_LEVELS = ()
+
+# --- Debug Artifacts ---
+# When parse_hcad_detail_page fails, its screenshot and page HTML go to HCAD_ARTIFACT_DIR through the background
+# writer in debug_artifacts.py (modes, compression and retention are described there). Only error captures exist
+# here, so "on_error", "sampled" and "always" behave the same; "off" disables them.
+HCAD_ARTIFACT_MODE = "on_error"
+HCAD_ARTIFACT_SAMPLE_PERCENT = 5
+HCAD_ARTIFACT_DIR = "hcad_error_screenshots"
+HCAD_ARTIFACT_MAX_FILES = 200
+HCAD_ARTIFACT_QUEUE_SIZE = 32
+
+# --- Persistent Detail Cache ---
+
+class HcadDetailStore:
+    """
+    SQLite-backed store for parsed HCAD detail pages that survives between runs.
+    Each account is stored once under its canonical hcad_account; the other keys we see for the
+    same account (the acct= value from the detail URL, hcad_account_summary from the results list)
+    are kept in an alias table. Entries expire after their TTL, and the least recently used
+    accounts are evicted once the store grows past max_entries. Every stored account is also indexed
+    by hcad_candidate_tokens of its legal description and owner, for candidates().
+    """
 
-# --- Helper Functions ---
+    def __init__(self, db_path, ttl_days, max_entries):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_key(key):
+        if key is None: return None
+        normalized = re.sub(r"\s+", "", str(key))
+        return normalized if normalized and normalized.upper() != 'NAN' else None
+
+    def _connection(self):
+        # Opened lazily so importing the script never touches the disk.
+        if self._conn is None:
+            db_folder = os.path.dirname(self.db_path)
+            if db_folder: os.makedirs(db_folder, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS hcad_detail (
+                    account TEXT PRIMARY KEY,
+                    detail_json TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS hcad_detail_alias (
+                    alias TEXT PRIMARY KEY,
+                    account TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_hcad_detail_last_access ON hcad_detail(last_access);
+                CREATE INDEX IF NOT EXISTS idx_hcad_detail_alias_account ON hcad_detail_alias(account);
+                CREATE TABLE IF NOT EXISTS hcad_detail_token (
+                    token TEXT NOT NULL,
+                    account TEXT NOT NULL,
+                    PRIMARY KEY (token, account)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_hcad_detail_token_account ON hcad_detail_token(account);
+            """)
+            # Stores created before the token index existed are indexed once here.
+            if not self._conn.execute("SELECT 1 FROM hcad_detail_token LIMIT 1").fetchone():
+                for account, detail_json in self._conn.execute("SELECT account, detail_json FROM hcad_detail").fetchall():
+                    self._index_account(self._conn, account, json.loads(detail_json))
+                self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _index_account(conn, account, detail_data):
+        conn.execute("DELETE FROM hcad_detail_token WHERE account = ?", (account,))
+        tokens = hcad_candidate_tokens(detail_data.get('hcad_legal_desc_detail'), [detail_data.get('hcad_owner_full_name')])
+        conn.executemany("INSERT OR IGNORE INTO hcad_detail_token (token, account) VALUES (?, ?)", [(token, account) for token in tokens])
+
+    def _delete_accounts(self, conn, accounts):
+        for account in accounts:
+            conn.execute("DELETE FROM hcad_detail WHERE account = ?", (account,))
+            conn.execute("DELETE FROM hcad_detail_alias WHERE account = ?", (account,))
+            conn.execute("DELETE FROM hcad_detail_token WHERE account = ?", (account,))
+
+    def get(self, *keys):
+        """Returns the cached detail dict for the first key (canonical or alias) that resolves, else None."""
+        lookup_keys = [k for k in (self._normalize_key(key) for key in keys) if k]
+        if not lookup_keys:
+            return None
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            for key in lookup_keys:
+                alias_row = conn.execute("SELECT account FROM hcad_detail_alias WHERE alias = ?", (key,)).fetchone()
+                account = alias_row[0] if alias_row else key
+                row = conn.execute("SELECT detail_json, expires_at FROM hcad_detail WHERE account = ?", (account,)).fetchone()
+                if not row:
+                    continue
+                if row[1] < now:
+                    self._delete_accounts(conn, [account])
+                    conn.commit()
+                    self.expirations += 1
+                    continue
+                conn.execute("UPDATE hcad_detail SET last_access = ? WHERE account = ?", (now, account))
+                conn.commit()
+                self.hits += 1
+                return json.loads(row[0])
+            self.misses += 1
+            return None
+
+    def put(self, detail_data, *alias_keys, ttl_days=None):
+        """Stores detail_data under its hcad_account and records any differing alias keys."""
+        account = self._normalize_key(detail_data.get('hcad_account')) if detail_data else None
+        if not account:
+            return
+        now = time.time()
+        ttl_seconds = self.ttl_seconds if ttl_days is None else ttl_days * 86400
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO hcad_detail (account, detail_json, stored_at, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (account, json.dumps(detail_data), now, now + ttl_seconds, now)
+            )
+            self._index_account(conn, account, detail_data)
+            for alias in (self._normalize_key(key) for key in alias_keys):
+                if alias and alias != account:
+                    conn.execute("INSERT OR REPLACE INTO hcad_detail_alias (alias, account) VALUES (?, ?)", (alias, account))
+            self._evict_if_needed(conn)
+            conn.commit()
+
+    def _evict_if_needed(self, conn):
+        entry_count = conn.execute("SELECT COUNT(*) FROM hcad_detail").fetchone()[0]
+        overflow = entry_count - self.max_entries
+        if overflow <= 0:
+            return
+        lru_accounts = [r[0] for r in conn.execute(
+            "SELECT account FROM hcad_detail ORDER BY last_access ASC LIMIT ?", (overflow,)
+        ).fetchall()]
+        self._delete_accounts(conn, lru_accounts)
+        self.evictions += len(lru_accounts)
+
+    def candidates(self, tokens, limit):
+        """Unexpired detail dicts of the (up to) limit accounts sharing the most of tokens, most shared first."""
+        tokens = list(tokens)
+        if not tokens:
+            return []
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT d.detail_json FROM (SELECT account, COUNT(*) AS shared FROM hcad_detail_token WHERE token IN ({', '.join('?' * len(tokens))}) "
+                "GROUP BY account ORDER BY shared DESC LIMIT ?) t JOIN hcad_detail d ON d.account = t.account "
+                "WHERE d.expires_at >= ? ORDER BY t.shared DESC",
+                (*tokens, limit, time.time())).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def stats_line(self):
+        return f"hits={self.hits}, misses={self.misses}, evictions={self.evictions}, expired={self.expirations}"
+
+
+HCAD_DETAIL_CACHE = HcadDetailStore(HCAD_CACHE_DB_PATH, HCAD_DETAIL_CACHE_TTL_DAYS, HCAD_DETAIL_CACHE_MAX_ENTRIES)
+
+
+class HcadQueryStore:
+    """
+    SQLite-backed store of search_hcad_and_get_results outcomes, so a (legal, owner) query that was
+    already answered in this or an earlier run is served without touching the browser. Only the
+    statuses in cacheable_statuses are stored; errors and unknown page states are always retried.
+    """
+
+    def __init__(self, db_path, ttl_days, cacheable_statuses):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.cacheable_statuses = set(cacheable_statuses)
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def query_key(legal_desc_query, owner_name_query):
+        def _normalize(part):
+            return " ".join(str(part).upper().split()) if part is not None else ""
+        # "v2": outcomes stored before every search cleared both form inputs may carry a stale owner name.
+        return f"v2|{_normalize(legal_desc_query)}|{_normalize(owner_name_query)}"
+
+    def _connection(self):
+        if self._conn is None:
+            db_folder = os.path.dirname(self.db_path)
+            if db_folder: os.makedirs(db_folder, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS hcad_query_result (
+                    query_key TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    data_json TEXT,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+        return self._conn
+
+    def get(self, legal_desc_query, owner_name_query):
+        """Returns (status, data) for a cached query, or (None, None)."""
+        key = self.query_key(legal_desc_query, owner_name_query)
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT status, data_json, expires_at FROM hcad_query_result WHERE query_key = ?", (key,)).fetchone()
+            if row and row[2] < time.time():
+                conn.execute("DELETE FROM hcad_query_result WHERE query_key = ?", (key,))
+                conn.commit()
+                self.expirations += 1
+                row = None
+            if not row:
+                self.misses += 1
+                return None, None
+            self.hits += 1
+            return row[0], json.loads(row[1]) if row[1] is not None else None
+
+    def contains(self, legal_desc_query, owner_name_query):
+        """True if an unexpired outcome is cached for the query. Does not count as a hit or miss."""
+        key = self.query_key(legal_desc_query, owner_name_query)
+        with self._lock:
+            row = self._connection().execute("SELECT expires_at FROM hcad_query_result WHERE query_key = ?", (key,)).fetchone()
+        return bool(row) and row[0] >= time.time()
+
+    def put(self, legal_desc_query, owner_name_query, status, data):
+        if status not in self.cacheable_statuses:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO hcad_query_result (query_key, status, data_json, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (self.query_key(legal_desc_query, owner_name_query), status,
+                 json.dumps(data) if data is not None else None, now, now + self.ttl_seconds)
+            )
+            conn.commit()
+
+    def stats_line(self):
+        return f"hits={self.hits}, misses={self.misses}, expired={self.expirations}"
+
+
+HCAD_QUERY_CACHE = HcadQueryStore(HCAD_CACHE_DB_PATH, HCAD_QUERY_CACHE_TTL_DAYS, HCAD_QUERY_CACHE_STATUSES)
+
+
+
+class HcadTierPlanner:
+    """
+    Orders HCAD_SEARCH_TIERS_CONFIG per query shape from persisted tier attempt/success counts,
+    and keeps run counters for tiers searched per row.
+    """
+
+    ANCHOR_TIER = "T0_ExactLotBlockSubdivision"
+
+    def __init__(self, db_path, enabled, min_shape_rows, skip_after_attempts):
+        self.db_path = db_path
+        self.enabled = enabled
+        self.min_shape_rows = min_shape_rows
+        self.skip_after_attempts = skip_after_attempts
+        self.rows = 0
+        self.tiers_searched = 0
+        self.successful_rows = 0
+        self.tiers_searched_for_successes = 0
+        self.expected_tiers_default = 0.0
+        self.expected_tiers_planned = 0.0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None:
+            db_folder = os.path.dirname(self.db_path)
+            if db_folder: os.makedirs(db_folder, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS hcad_tier_stats (
+                    query_shape TEXT NOT NULL,
+                    tier_name TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    successes INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (query_shape, tier_name)
+                );
+                CREATE TABLE IF NOT EXISTS hcad_tier_shape (
+                    query_shape TEXT PRIMARY KEY,
+                    rows INTEGER NOT NULL DEFAULT 0
+                );
+            """)
+        return self._conn
+
+    def _load(self, query_shape):
+        conn = self._connection()
+        shape_row = conn.execute("SELECT rows FROM hcad_tier_shape WHERE query_shape = ?", (query_shape,)).fetchone()
+        tier_stats = {name: (attempts, successes) for name, attempts, successes in conn.execute(
+            "SELECT tier_name, attempts, successes FROM hcad_tier_stats WHERE query_shape = ?", (query_shape,))}
+        return (shape_row[0] if shape_row else 0), tier_stats
+
+    @staticmethod
+    def _success_rate(tier_stats, tier_name):
+        attempts, successes = tier_stats.get(tier_name, (0, 0))
+        return (successes + 1) / (attempts + 2)
+
+    @classmethod
+    def _expected_tiers(cls, tier_order, tier_stats):
+        """Expected number of searches until a match, over the tiers this shape has actually searched before."""
+        expected, p_still_searching = 0.0, 1.0
+        for tier_info in tier_order:
+            if tier_info["name"] not in tier_stats: continue
+            expected += p_still_searching
+            p_still_searching *= 1 - cls._success_rate(tier_stats, tier_info["name"])
+        return expected
+
+    def plan(self, query_shape, tiers_config):
+        """Returns the tiers to try for a row of this shape, in order."""
+        with self._lock:
+            shape_rows, tier_stats = self._load(query_shape)
+        planned = list(tiers_config)
+        if self.enabled and shape_rows >= self.min_shape_rows:
+            anchor = [t for t in tiers_config if t["name"] == self.ANCHOR_TIER]
+            rest = [t for t in tiers_config if t["name"] != self.ANCHOR_TIER]
+            kept = [t for t in rest
+                    if not (tier_stats.get(t["name"], (0, 0))[0] >= self.skip_after_attempts and tier_stats[t["name"]][1] == 0)]
+            kept = kept or rest # Never drop every tier after T0
+            kept.sort(key=lambda t: self._success_rate(tier_stats, t["name"]), reverse=True) # Stable: ties keep config order
+            # The legal-only tiers take the slots they sorted into, but narrowest first
+            legal_only_in_order = iter(sorted((t for t in kept if t["name"] in HCAD_LEGAL_ONLY_TIERS),
+                                              key=lambda t: HCAD_LEGAL_ONLY_TIERS.index(t["name"])))
+            kept = [next(legal_only_in_order) if t["name"] in HCAD_LEGAL_ONLY_TIERS else t for t in kept]
+            planned = anchor + kept
+            if HCAD_LOG_LEVEL == "DEBUG" and [t["name"] for t in planned] != [t["name"] for t in tiers_config]:
+                print(f"DEBUG: Tier plan for shape '{query_shape}' ({shape_rows} rows of history): {[t['name'] for t in planned]}")
+        with self._lock:
+            self.expected_tiers_default += self._expected_tiers(tiers_config, tier_stats)
+            self.expected_tiers_planned += self._expected_tiers(planned, tier_stats)
+        return planned
+
+    def record_row(self, query_shape, tiers_searched, succeeded_tier_name=None):
+        """Records the tiers a row actually searched (live or from the query cache) and which one matched."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("INSERT INTO hcad_tier_shape (query_shape, rows) VALUES (?, 1) "
+                         "ON CONFLICT(query_shape) DO UPDATE SET rows = rows + 1", (query_shape,))
+            for tier_name in tiers_searched:
+                success = 1 if tier_name == succeeded_tier_name else 0
+                conn.execute("INSERT INTO hcad_tier_stats (query_shape, tier_name, attempts, successes) VALUES (?, ?, 1, ?) "
+                             "ON CONFLICT(query_shape, tier_name) DO UPDATE SET attempts = attempts + 1, successes = successes + ?",
+                             (query_shape, tier_name, success, success))
+            conn.commit()
+            self.rows += 1
+            self.tiers_searched += len(tiers_searched)
+            if succeeded_tier_name:
+                self.successful_rows += 1
+                self.tiers_searched_for_successes += len(tiers_searched)
+
+    def stats_line(self):
+        if not self.rows:
+            return "no rows searched"
+        per_success = f"{self.tiers_searched_for_successes / self.successful_rows:.2f}" if self.successful_rows else "n/a"
+        return (f"rows={self.rows}, tiers searched={self.tiers_searched} ({self.tiers_searched / self.rows:.2f}/row), "
+                f"tiers per successful match={per_success}, expected tiers/row from history: "
+                f"default order={self.expected_tiers_default / self.rows:.2f}, planned order={self.expected_tiers_planned / self.rows:.2f}")
+
+
+HCAD_TIER_PLANNER = HcadTierPlanner(HCAD_CACHE_DB_PATH, HCAD_TIER_PLANNER_ENABLED,
+                                    HCAD_TIER_PLANNER_MIN_SHAPE_ROWS, HCAD_TIER_PLANNER_SKIP_AFTER_ATTEMPTS)
+
+class HcadBroadSubdivisionRegistry:
+    """
+    Persisted legal-only queries known to return more than one page of HCAD results. Entries are keyed on
+    the exact legal query, so a block-less query never covers rows whose query names a block or tract.
+    """
+
+    def __init__(self, db_path, ttl_days):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.rows_seeded = 0
+        self.tier_searches_skipped = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None:
+            db_folder = os.path.dirname(self.db_path)
+            if db_folder: os.makedirs(db_folder, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS hcad_broad_legal_query (
+                    legal_query TEXT PRIMARY KEY,
+                    tier_name TEXT NOT NULL,
+                    record_count INTEGER,
+                    hits INTEGER NOT NULL DEFAULT 1,
+                    first_seen REAL NOT NULL,
+                    last_seen REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def is_broad(self, legal_query):
+        """Returns the registered record count (or -1 if unknown) when legal_query is known to be too broad, else None."""
+        if not legal_query:
+            return None
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COALESCE(record_count, -1) FROM hcad_broad_legal_query WHERE legal_query = ? AND last_seen >= ?",
+                (legal_query, time.time() - self.ttl_seconds)).fetchone()
+        return row[0] if row else None
+
+    def record(self, tier_name, legal_query, record_count=None):
+        if tier_name not in HCAD_LEGAL_ONLY_TIERS or not legal_query:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT INTO hcad_broad_legal_query (legal_query, tier_name, record_count, hits, first_seen, last_seen) VALUES (?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT(legal_query) DO UPDATE SET hits = hits + 1, last_seen = excluded.last_seen, "
+                "record_count = COALESCE(excluded.record_count, record_count)",
+                (legal_query, tier_name, record_count, now, now))
+            conn.commit()
+
+    def count_seeded_row(self):
+        with self._lock:
+            self.rows_seeded += 1
+
+    def count_skipped_search(self):
+        with self._lock:
+            self.tier_searches_skipped += 1
+
+    def stats_line(self):
+        with self._lock:
+            known = self._connection().execute("SELECT COUNT(*) FROM hcad_broad_legal_query WHERE last_seen >= ?",
+                                               (time.time() - self.ttl_seconds,)).fetchone()[0]
+        return f"known broad legal queries={known}, rows pre-flagged={self.rows_seeded}, legal-only searches skipped={self.tier_searches_skipped}"
+
+
+HCAD_BROAD_SUBDIVISIONS = HcadBroadSubdivisionRegistry(HCAD_CACHE_DB_PATH, HCAD_BROAD_SUBDIVISION_TTL_DAYS)
+
+
+def _legal_tiers_at_least_as_broad(tier_name):
+    """tier_name and the legal-only tiers broader than it (HCAD_LEGAL_ONLY_TIERS is ordered narrowest first)."""
+    return set(HCAD_LEGAL_ONLY_TIERS[HCAD_LEGAL_ONLY_TIERS.index(tier_name):])
+
+
+HCAD_LEGAL_TOKEN_LABELS = {"LT": "LT", "LOT": "LT", "LTS": "LT", "LOTS": "LT", "BLK": "BLK", "BLOCK": "BLK",
+                           "TR": "TR", "TRS": "TR", "TRACT": "TR", "SEC": "SEC", "SECTION": "SEC"}
+
+
+def hcad_legal_tokens(legal_text):
+    """
+    Tokens of a legal description: each LT/BLK/TR/SEC label is fused with the value after it ("LT 5 BLK 4"
+    gives LT:5 and BLK:4, so lot 5 never matches block 5), every other word is its own token.
+    """
+    words = re.findall(r"&|[A-Z0-9]+(?:[-/][A-Z0-9]+)*", str(legal_text or "").upper())
+    tokens = []
+    i = 0
+    while i < len(words):
+        label = HCAD_LEGAL_TOKEN_LABELS.get(words[i])
+        if label and i + 1 < len(words) and words[i + 1] not in HCAD_LEGAL_TOKEN_LABELS and words[i + 1] != "&":
+            tokens.append(f"{label}:{words[i + 1]}"); i += 2
+            # "LTS 5 & 6" covers lot 6 as well
+            while i + 1 < len(words) and words[i] == "&" and words[i + 1] not in HCAD_LEGAL_TOKEN_LABELS and words[i + 1] != "&":
+                tokens.append(f"{label}:{words[i + 1]}"); i += 2
+        else:
+            if words[i] != "&": tokens.append(words[i])
+            i += 1
+    return tokens
+
+
+def hcad_owner_tokens(owner_text):
+    return re.findall(r"[A-Z0-9]+", str(owner_text or "").upper())
+
+
+def hcad_candidate_tokens(legal_text, owner_names=()):
+    """Local index tokens: L: labelled legal values, S: trigrams of the other legal words, O: owner name words."""
+    tokens = set()
+    for token in hcad_legal_tokens(legal_text):
+        if ":" in token:
+            tokens.add(f"L:{token}")
+        else:
+            padded = f" {token} "
+            tokens.update(f"S:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+    for owner_name in owner_names:
+        tokens.update(f"O:{token}" for token in hcad_owner_tokens(owner_name))
+    return tokens
+
+
+class HcadBulkExtractStore:
+    """
+    Local copy of an HCAD real-account bulk extract (real_acct.txt + owners.txt), indexed by legal
+    description and owner name tokens. search() answers a tier query the way search_hcad_and_get_results
+    does, with the same statuses and summary dicts: an account matches when its legal description holds
+    every token of the legal query and its owner names hold every token of the owner query.
+    detail() returns the hcad_* detail fields the extract carries.
+    """
+
+    ACCOUNT_COLUMNS = ("acct", "tax_year", "owner_name", "mailing_address", "legal_desc", "site_street", "site_address",
+                       "site_zip", "pct_ownership", "land_area_sf", "living_area_sf", "land_value", "improvement_value",
+                       "market_value", "appraised_value")
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.searches = 0
+        self.details_served = 0
+        self._loaded = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None:
+            db_folder = os.path.dirname(self.db_path)
+            if db_folder: os.makedirs(db_folder, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS hcad_bulk_account ({", ".join(
+                    f"{column} TEXT PRIMARY KEY" if column == "acct" else column for column in self.ACCOUNT_COLUMNS)});
+                CREATE TABLE IF NOT EXISTS hcad_bulk_token (
+                    kind TEXT NOT NULL,
+                    token TEXT NOT NULL,
+                    acct TEXT NOT NULL,
+                    PRIMARY KEY (kind, token, acct)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS hcad_bulk_token_df (
+                    kind TEXT NOT NULL,
+                    token TEXT NOT NULL,
+                    df INTEGER NOT NULL,
+                    PRIMARY KEY (kind, token)
+                ) WITHOUT ROWID;
+            """)
+        return self._conn
+
+    @staticmethod
+    def _read_extract_file(path):
+        # HCAD's text files are tab-delimited with a header line, unquoted, and not always valid UTF-8.
+        with open(path, encoding="latin-1", newline="") as f:
+            for record in csv.DictReader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+                yield {(k or "").strip().lower(): (v or "").strip() for k, v in record.items()}
+
+    def load(self, extract_dir, batch_size=20000):
+        """Replaces the store's contents with real_acct.txt and owners.txt from extract_dir. Returns the account count."""
+        owners_by_acct = {}
+        owners_path = os.path.join(extract_dir, "owners.txt")
+        if os.path.exists(owners_path):
+            for record in self._read_extract_file(owners_path):
+                owners_by_acct.setdefault(record.get("acct", ""), []).append(
+                    (int(record.get("ln_num") or 0), record.get("name", ""), _clean_numeric_value(record.get("pct_own"))))
+        else:
+            print(f"WARN: {owners_path} not found. Owner names come from real_acct.txt mailto only.")
+
+        def _joined(*parts):
+            return " ".join(" ".join(parts).split())
+
+        account_count = 0
+        with self._lock:
+            conn = self._connection()
+            conn.executescript("DELETE FROM hcad_bulk_account; DELETE FROM hcad_bulk_token; DELETE FROM hcad_bulk_token_df;")
+            account_batch, token_batch = [], []
+            for record in self._read_extract_file(os.path.join(extract_dir, "real_acct.txt")):
+                acct = record.get("acct", "")
+                if not acct: continue
+                owners = sorted(owners_by_acct.get(acct, []))
+                legal_desc = _joined(*(record.get(f"lgl_{i}", "") for i in range(1, 5)))
+                owner_name = record.get("mailto") or " & ".join(name for _, name, _ in owners if name)
+                account_batch.append((
+                    acct, record.get("yr"), owner_name,
+                    _joined(record.get("mail_addr_1", ""), record.get("mail_addr_2", ""), record.get("mail_city", ""),
+                            record.get("mail_state", ""), record.get("mail_zip", "")) or None,
+                    legal_desc or None, record.get("site_addr_1") or None,
+                    _joined(record.get("site_addr_1", ""), record.get("site_addr_2", ""), "TX" if record.get("site_addr_1") else "",
+                            record.get("site_addr_3", "")) or None,
+                    record.get("site_addr_3") or None,
+                    owners[0][2] if len(owners) > 1 else None,
+                    _clean_numeric_value(record.get("land_ar")), _clean_numeric_value(record.get("bld_ar")),
+                    _clean_numeric_value(record.get("land_val")), _clean_numeric_value(record.get("bld_val")),
+                    _clean_numeric_value(record.get("tot_mkt_val")), _clean_numeric_value(record.get("tot_appr_val")),
+                ))
+                token_batch.extend(("L", token, acct) for token in set(hcad_legal_tokens(legal_desc)))
+                owner_names = [owner_name] + [name for _, name, _ in owners]
+                token_batch.extend(("O", token, acct) for token in set(t for name in owner_names for t in hcad_owner_tokens(name)))
+                account_count += 1
+                if len(account_batch) >= batch_size:
+                    self._insert_batches(conn, account_batch, token_batch)
+                    account_batch, token_batch = [], []
+            self._insert_batches(conn, account_batch, token_batch)
+            conn.execute("INSERT INTO hcad_bulk_token_df (kind, token, df) SELECT kind, token, COUNT(*) FROM hcad_bulk_token GROUP BY kind, token")
+            conn.commit()
+            self._loaded = account_count > 0
+        print(f"INFO: Loaded {account_count} HCAD account(s) from bulk extract '{extract_dir}' into {self.db_path}.")
+        return account_count
+
+    def _insert_batches(self, conn, account_batch, token_batch):
+        conn.executemany(f"INSERT OR REPLACE INTO hcad_bulk_account VALUES ({', '.join('?' * len(self.ACCOUNT_COLUMNS))})", account_batch)
+        conn.executemany("INSERT OR IGNORE INTO hcad_bulk_token (kind, token, acct) VALUES (?, ?, ?)", token_batch)
+
+    def is_loaded(self):
+        with self._lock:
+            if self._loaded is None:
+                self._loaded = self._connection().execute("SELECT 1 FROM hcad_bulk_account LIMIT 1").fetchone() is not None
+            return self._loaded
+
+    def matching_accounts(self, legal_desc_query, owner_name_query):
+        """Sorted accounts whose legal and owner tokens contain every token of the query, rarest token first."""
+        query_tokens = {("L", t) for t in hcad_legal_tokens(legal_desc_query)} | {("O", t) for t in hcad_owner_tokens(owner_name_query)}
+        if not query_tokens:
+            return []
+        with self._lock:
+            conn = self._connection()
+            token_dfs = []
+            for kind, token in query_tokens:
+                row = conn.execute("SELECT df FROM hcad_bulk_token_df WHERE kind = ? AND token = ?", (kind, token)).fetchone()
+                if not row: return []
+                token_dfs.append((row[0], kind, token))
+            token_dfs.sort()
+            _, kind, token = token_dfs[0]
+            accounts = {r[0] for r in conn.execute("SELECT acct FROM hcad_bulk_token WHERE kind = ? AND token = ?", (kind, token))}
+            for _, kind, token in token_dfs[1:]:
+                if not accounts: break
+                candidate_list = list(accounts)
+                accounts = set()
+                for start in range(0, len(candidate_list), 500):
+                    chunk = candidate_list[start:start + 500]
+                    accounts.update(r[0] for r in conn.execute(
+                        f"SELECT acct FROM hcad_bulk_token WHERE kind = ? AND token = ? AND acct IN ({', '.join('?' * len(chunk))})",
+                        (kind, token, *chunk)))
+        return sorted(accounts)
+
+    def _account_rows(self, accounts):
+        rows = {}
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(accounts), 500):
+                chunk = accounts[start:start + 500]
+                for row in conn.execute(f"SELECT * FROM hcad_bulk_account WHERE acct IN ({', '.join('?' * len(chunk))})", chunk):
+                    rows[row[0]] = dict(zip(self.ACCOUNT_COLUMNS, row))
+        return [rows[acct] for acct in accounts if acct in rows]
+
+    def search(self, search_tier_name, legal_desc_query=None, owner_name_query=None, search_info=None):
+        """Offline counterpart of search_hcad_and_get_results: returns (status, data) for one tier query."""
+        print(f"INFO: [HCAD Bulk Extract - {search_tier_name}] Legal: '{legal_desc_query}', Owner: '{owner_name_query}'")
+        with self._lock:
+            self.searches += 1
+        accounts = self.matching_accounts(legal_desc_query, owner_name_query)
+        num_records = len(accounts)
+        if search_info is not None: search_info['num_records'] = num_records
+        if num_records == 0:
+            return "NO_HITS", None
+        if num_records > max(HCAD_RESULTS_PER_PAGE, HCAD_PAGINATION_HARVEST_MAX_RECORDS):
+            print(f"WARN: [HCAD Bulk Extract - {search_tier_name}] {num_records} matching accounts. PAGINATION_TOO_LARGE.")
+            return "PAGINATION_TOO_LARGE", [self._summary(row) for row in self._account_rows(accounts[:HCAD_RESULTS_PER_PAGE])]
+        summaries = [self._summary(row) for row in self._account_rows(accounts)]
+        print(f"INFO: [HCAD Bulk Extract - {search_tier_name}] {num_records} matching account(s).")
+        return ("SINGLE_ITEM_IN_LIST" if num_records == 1 else "MULTIPLE_HITS"), summaries
+
+    @staticmethod
+    def _summary(row):
+        return {
+            'hcad_account_summary': row['acct'], 'hcad_owner_summary': row['owner_name'],
+            'hcad_address_summary': row['site_street'] or "", 'hcad_zip_summary': row['site_zip'] or "",
+            'hcad_sqft_summary': row['living_area_sf'], 'hcad_market_value_summary': row['market_value'],
+            'hcad_appraised_value_summary': row['appraised_value'],
+            'hcad_detail_url': HCAD_BULK_DETAIL_URL_TEMPLATE.format(acct=row['acct']),
+        }
+
+    def detail(self, account):
+        """The detail record for an account in the extract (fields the extract lacks stay None), or None."""
+        account = re.sub(r"\s+", "", str(account)) if account else None
+        rows = self._account_rows([account]) if account else []
+        if not rows:
+            return None
+        row = rows[0]
+        with self._lock:
+            self.details_served += 1
+        hcad_data = _new_hcad_detail_record(HCAD_BULK_DETAIL_URL_TEMPLATE.format(acct=row['acct']))
+        hcad_data.update({
+            'hcad_account': row['acct'], 'hcad_owner_full_name': row['owner_name'] or None,
+            'hcad_mailing_address': row['mailing_address'], 'hcad_legal_desc_detail': row['legal_desc'],
+            'hcad_site_address': row['site_address'], 'hcad_pct_ownership': row['pct_ownership'],
+            'hcad_market_value_detail': row['market_value'], 'hcad_appraised_value_detail': row['appraised_value'],
+            'hcad_land_area_sf': row['land_area_sf'], 'hcad_total_living_area_sf': row['living_area_sf'],
+            'hcad_land_market_value': row['land_value'], 'hcad_improvement_market_value': row['improvement_value'],
+            'hcad_detail_level': "CORE",
+        })
+        return hcad_data
 
+    def stats_line(self):
+        return f"searches={self.searches}, detail records served={self.details_served}"
 
 
+HCAD_BULK_EXTRACT = HcadBulkExtractStore(HCAD_BULK_EXTRACT_DB_PATH)
+
+
+def load_hcad_bulk_extract(extract_dir=None):
+    """Loads an HCAD bulk extract folder (real_acct.txt, owners.txt) into HCAD_BULK_EXTRACT."""
+    return HCAD_BULK_EXTRACT.load(extract_dir or HCAD_BULK_EXTRACT_DIR)
+
+
+class HcadRequestThrottle:
+    """
+    Shared pacing gate for requests to hcad.org. Every caller reserves the next free slot, so
+    all worker threads together never exceed max_per_minute page loads.
+    """
+
+    def __init__(self, max_per_minute):
+        self.min_interval_s = 60.0 / max_per_minute if max_per_minute else 0.0
+        self.requests_issued = 0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval_s
+            self.requests_issued += 1
+        if slot > now:
+            time.sleep(slot - now)
+
+
+HCAD_REQUEST_THROTTLE = HcadRequestThrottle(0) # Replaced with the HCAD_MAX_REQUESTS_PER_MINUTE cap when workers start
+
+
+class HcadSpeculativeSearchPool:
+    """
+    Extra browser pages for speculative tier searches. Each pool thread owns its own Playwright instance
+    and page (the sync API is bound to the thread that started it) and runs queued searches; submit()
+    returns a Future of the (status, data) pair search_hcad_and_get_results produces. Threads start on
+    first use and run until shutdown().
+    """
+
+    def __init__(self, num_pages):
+        self.num_pages = num_pages
+        self.submitted = 0
+        self.used = 0
+        self.cancelled = 0
+        self.discarded = 0
+        self._jobs = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def _run(self, page_id):
+        try:
+            with sync_playwright() as p:
+                browser = p.chromium.launch(**HCAD_BROWSER_LAUNCH_OPTIONS)
+                try:
+                    page = browser.new_context(**HCAD_BROWSER_CONTEXT_OPTIONS).new_page()
+                    while True:
+                        job = self._jobs.get()
+                        if job is None: return
+                        future, tier_name, legal_q, owner_q, harvest = job
+                        if not future.set_running_or_notify_cancel(): continue
+                        try:
+                            _prepare_hcad_search_page(page, f"Speculative_{page_id}_Tier_{tier_name}")
+                            status, data = search_hcad_and_get_results(page, tier_name, legal_q, owner_q, harvest)
+                            if harvest is None or harvest.cacheable:
+                                HCAD_QUERY_CACHE.put(legal_q, owner_q, status, data) # Kept even if the row no longer needs it
+                            future.set_result((status, data))
+                        except Exception as e_search:
+                            future.set_exception(e_search)
+                finally:
+                    browser.close()
+        except Exception as e_page:
+            print(f"ERROR: [Speculative page {page_id}] Browser stopped: {e_page}")
+        # Fail whatever is still queued so callers fall back to searching on their own page.
+        while True:
+            job = self._jobs.get()
+            if job is None: return
+            if job[0].set_running_or_notify_cancel():
+                job[0].set_exception(RuntimeError(f"Speculative page {page_id} is not available"))
+
+    def submit(self, tier_name, legal_q, owner_q, harvest=None):
+        with self._lock:
+            if not self._threads:
+                for page_id in range(1, self.num_pages + 1):
+                    thread = threading.Thread(target=self._run, args=(page_id,), name=f"hcad-speculative-{page_id}", daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+            self.submitted += 1
+        future = Future()
+        self._jobs.put((future, tier_name, legal_q, owner_q, harvest))
+        return future
+
+    def result(self, future):
+        """Waits for a speculative search; returns (None, None) if it failed so the caller searches itself."""
+        try:
+            status, data = future.result()
+        except Exception as e_search:
+            print(f"WARN: Speculative search failed ({e_search}). Searching on the row's own page.")
+            return None, None
+        with self._lock:
+            self.used += 1
+        return status, data
+
+    def discard(self, futures):
+        """Cancels speculative searches that have not started; ones already running finish and are ignored."""
+        for future in futures:
+            with self._lock:
+                if future.cancel(): self.cancelled += 1
+                else: self.discarded += 1
+
+    def shutdown(self):
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads: self._jobs.put(None)
+        for thread in threads: thread.join()
+
+    def stats_line(self):
+        return f"submitted={self.submitted}, used={self.used}, cancelled before start={self.cancelled}, discarded after start={self.discarded}"
+
+
+HCAD_SPECULATIVE_POOL = HcadSpeculativeSearchPool(HCAD_SPECULATIVE_TIER_K)
+
+
+# --- Helper Functions ---
+
+
+def _parse_acct_from_url(detail_url):
+    """Returns the acct= value from an HCAD detail URL, or None."""
+    if not detail_url:
+        return None
+    match_acct_url = re.search(r"acct=(\d+)", detail_url, re.IGNORECASE)
+    return match_acct_url.group(1) if match_acct_url else None
 
 
 def _clean_numeric_value(value_str):
@@ -97,6 +1045,84 @@ def _extract_potential_last_name(full_name_str):
     return name_parts[-1] if name_parts else "" # Fallback to last token if all are suffixes (unlikely) or empty
 
 
+# --- Detail Page XPaths (shared by the locator and snapshot engines) ---
+DETAIL_ACCOUNT_XPATH = "/html/body/table/tbody/tr/td/table[1]/tbody/tr/td[2]/b"
+DETAIL_OWNER_MAIL_XPATHS = (
+    '//td[starts-with(normalize-space(.), "Owner Name & Mailing Address:")]/following-sibling::*[1]',
+    "/html/body/table/tbody/tr/td/table[5]/tbody/tr[2]/td[1]/table/tbody/tr/th",
+)
+DETAIL_LEGAL_DESC_XPATHS = (
+    '//td[normalize-space(.)="Legal Description:"]/following-sibling::*[1]',
+    "/html/body/table/tbody/tr/td/table[5]/tbody/tr[2]/td[2]/table/tbody/tr[1]/th",
+)
+DETAIL_SITE_ADDRESS_XPATHS = (
+    '//td[normalize-space(.)="Property Address:"]/following-sibling::*[1]',
+    "/html/body/table/tbody/tr/td/table[5]/tbody/tr[2]/td[2]/table/tbody/tr[2]/th",
+)
+DETAIL_LAND_MARKET_VALUE_XPATH = "/html/body/table/tbody/tr/td/table[12]/tbody/tr[4]/td[5]"
+DETAIL_IMPROVEMENT_MARKET_VALUE_XPATH = "/html/body/table/tbody/tr/td/table[12]/tbody/tr[5]/td[5]"
+DETAIL_TOTAL_MARKET_VALUE_XPATH = "/html/body/table/tbody/tr/td/table[12]/tbody/tr[6]/td[5]"
+DETAIL_HISTORY_LINK_XPATH = "/html/body/table/tbody/tr/td/table[12]/tbody/tr[7]/td/a"
+HISTORY_YEAR_XPATH_TEMPLATE = "/html/body/table[2]/tbody/tr[1]/td[{}]/b"
+HISTORY_VALUE_XPATH_TEMPLATE = "/html/body/table[2]/tbody/tr[2]/th[{}]"
+# Only rows with at least 12 columns, which filters out header and spacer rows automatically.
+LAND_TABLE_ROWS_XPATH = '//table[.//th[contains(text(), "Land Use")]]//tr[count(td) >= 12]'
+BUILDING_TABLE_XPATH = '//table[.//th[contains(text(), "Building #")]]'
+BUILDING_CHARACTERISTICS_TABLE_XPATH = "/html/body/table/tbody/tr/td/table[17]/tbody/tr/td[2]/table"
+BUILDING_AREA_ROWS_XPATH = "/html/body/table/tbody/tr/td/table[17]/tbody/tr/td[4]/table/tbody/tr"
+
+
+def _locator_cell_text(row, column):
+    return row.locator(f'td:nth-child({column})').inner_text()
+
+
+def _locator_text(page_context, xpath, name):
+    try:
+        element = page_context.locator(f"xpath={xpath}").first
+        if element.is_visible(timeout=1000):
+            return element.inner_text().strip()
+    except Exception:
+        print(f"WARN: Could not find '{name}' with XPath: {xpath}")
+    return None
+
+
+def _parse_land_rows(data_rows, cell_text):
+    land_rows = []
+    total_lot_sqft = 0
+    total_land_value = 0
+
+    if not data_rows:
+         print("INFO: No data rows found in the land table matching the specific criteria.")
+
+    for row in data_rows:
+        # We can be more confident in these locators now, but the try/except is still good practice.
+        try:
+            land_use = cell_text(row, 1).strip()
+            unit_type = cell_text(row, 3).strip()
+            units_raw = cell_text(row, 4).strip()
+            market_val_raw = cell_text(row, 12).strip()
+
+            units = float(units_raw.replace(',', ''))
+            market_value = float(market_val_raw.replace('$', '').replace(',', ''))
+
+            land_rows.append({
+                "land_use": land_use,
+                "unit_type": unit_type,
+                "units": units,
+                "market_value": market_value
+            })
+
+            if unit_type == "SF":
+                total_lot_sqft += units
+
+            total_land_value += market_value
+        except Exception as e_row:
+            print(f"WARN: Could not parse a specific land data row, skipping it. Error: {e_row}")
+            continue
+
+    return land_rows, total_lot_sqft, total_land_value
+
+
 def parse_land_rows_xpath(page):
     """
     Scrapes the Land Data table using a highly specific selector to target only data rows.
@@ -104,42 +1130,10 @@ def parse_land_rows_xpath(page):
     land_rows = []
     total_lot_sqft = 0
     total_land_value = 0
-    
-    try:
-        # This selector now specifically looks for rows that have at least 12 columns,
-        # which will filter out most header and spacer rows automatically.
-        land_table_rows_selector = '//table[.//th[contains(text(), "Land Use")]]//tr[count(td) >= 12]'
-        data_rows = page.locator(land_table_rows_selector).all()
-        
-        if not data_rows:
-             print("INFO: No data rows found in the land table matching the specific criteria.")
-        
-        for row in data_rows:
-            # We can be more confident in these locators now, but the try/except is still good practice.
-            try:
-                land_use = row.locator('td:nth-child(1)').inner_text().strip()
-                unit_type = row.locator('td:nth-child(3)').inner_text().strip()
-                units_raw = row.locator('td:nth-child(4)').inner_text().strip()
-                market_val_raw = row.locator('td:nth-child(12)').inner_text().strip()
-
-                units = float(units_raw.replace(',', ''))
-                market_value = float(market_val_raw.replace('$', '').replace(',', ''))
-
-                land_rows.append({
-                    "land_use": land_use,
-                    "unit_type": unit_type,
-                    "units": units,
-                    "market_value": market_value
-                })
-                
-                if unit_type == "SF":
-                    total_lot_sqft += units
-                
-                total_land_value += market_value
-            except Exception as e_row:
-                print(f"WARN: Could not parse a specific land data row, skipping it. Error: {e_row}")
-                continue
 
+    try:
+        data_rows = page.locator(LAND_TABLE_ROWS_XPATH).all()
+        land_rows, total_lot_sqft, total_land_value = _parse_land_rows(data_rows, _locator_cell_text)
     except Exception as e:
         print(f"WARN: An unexpected error occurred in parse_land_rows_xpath. Error: {e}")
 
@@ -151,6 +1145,41 @@ def parse_land_rows_xpath(page):
     }
 
 
+def _parse_main_building_rows(headers, data_rows, cell_text, building_list):
+    """Appends one entry per building row to building_list and returns the summed 'Imprv Sq Ft', or None if the column is missing."""
+    # Dynamically find the column index for "Imprv Sq Ft"
+    sq_ft_col_index = -1
+    for i, header in enumerate(headers):
+        if "Imprv Sq Ft" in header:
+            sq_ft_col_index = i + 1 # Add 1 because nth-child is 1-based
+            break
+
+    if sq_ft_col_index == -1:
+        print("WARN: Could not find 'Imprv Sq Ft' column in main building table.")
+        return None
+
+    total_impr_sqft = 0
+    print(f"DEBUG: Found main building table and {len(data_rows)} data row(s).")
+    try:
+        for row in data_rows:
+            sq_ft_raw = cell_text(row, sq_ft_col_index).strip()
+            sq_ft = _clean_numeric_value(sq_ft_raw)
+
+            if sq_ft:
+                total_impr_sqft += sq_ft
+
+            building_list.append({
+                "year_built": cell_text(row, 2).strip(),
+                "type": cell_text(row, 3).strip(),
+                "style": cell_text(row, 4).strip(),
+                "quality": cell_text(row, 5).strip(),
+                "sq_ft": sq_ft
+            })
+    except Exception as e:
+        print(f"WARN: An unexpected error occurred in parse_building_main_data. Error: {e}")
+    return total_impr_sqft
+
+
 def parse_building_main_data(page):
     """
     Scrapes the main Building data table by dynamically finding the 'Imprv Sq Ft' column,
@@ -159,42 +1188,16 @@ def parse_building_main_data(page):
     building_list = []
     total_impr_sqft = 0
     print("INFO: Attempting to parse main building data...")
-    
+
     try:
-        building_table_selector = '//table[.//th[contains(text(), "Building #")]]'
-        building_table = page.locator(building_table_selector)
+        building_table = page.locator(BUILDING_TABLE_XPATH)
 
         if building_table.count() > 0:
             headers = [th.inner_text().strip() for th in building_table.locator('//thead/tr/th').all()]
-            
-            # Dynamically find the column index for "Imprv Sq Ft"
-            sq_ft_col_index = -1
-            for i, header in enumerate(headers):
-                if "Imprv Sq Ft" in header:
-                    sq_ft_col_index = i + 1 # Add 1 because nth-child is 1-based
-                    break
-            
-            if sq_ft_col_index == -1:
-                print("WARN: Could not find 'Imprv Sq Ft' column in main building table.")
-                return {"hcad_impr_total_sqft": 0, "hcad_main_building_data_json": None}
-
             data_rows = building_table.locator('//tbody/tr[./td]').all()
-            print(f"DEBUG: Found main building table and {len(data_rows)} data row(s).")
-
-            for row in data_rows:
-                sq_ft_raw = row.locator(f'td:nth-child({sq_ft_col_index})').inner_text().strip()
-                sq_ft = _clean_numeric_value(sq_ft_raw)
-                
-                if sq_ft:
-                    total_impr_sqft += sq_ft
-
-                building_list.append({
-                    "year_built": row.locator('td:nth-child(2)').inner_text().strip(),
-                    "type": row.locator('td:nth-child(3)').inner_text().strip(),
-                    "style": row.locator('td:nth-child(4)').inner_text().strip(),
-                    "quality": row.locator('td:nth-child(5)').inner_text().strip(),
-                    "sq_ft": sq_ft
-                })
+            total_impr_sqft = _parse_main_building_rows(headers, data_rows, _locator_cell_text, building_list)
+            if total_impr_sqft is None:
+                return {"hcad_impr_total_sqft": 0, "hcad_main_building_data_json": None}
         else:
             print("INFO: Main building data table not found on this page.")
 
@@ -202,259 +1205,469 @@ def parse_building_main_data(page):
         print(f"WARN: An unexpected error occurred in parse_building_main_data. Error: {e}")
 
     return {
-        "hcad_impr_total_sqft": total_impr_sqft, 
+        "hcad_impr_total_sqft": total_impr_sqft,
         "hcad_main_building_data_json": json.dumps(building_list) if building_list else None
     }
 
 
-def parse_building_characteristics(page):
+def _parse_characteristic_pairs(label_value_pairs, standard_characteristics, extra_characteristics):
     """
-    Dynamically scrapes the Building Characteristics table, standardizes known variations,
-    and places any unknown characteristics into a separate JSON field to maintain a stable schema.
+    Standardizes known characteristic label variations into standard_characteristics and puts any
+    unknown ones in extra_characteristics, filling both in place so a failure part-way keeps earlier rows.
     """
     known_labels = {
         "foundation_type", "exterior_wall", "roof_type", "heating_ac",
         "grade_adjustment", "physical_condition", "full_bathrooms",
         "half_bathrooms", "bedrooms", "stories", "carport"
     }
-    
+    for label_raw, value in label_value_pairs:
+        if label_raw:
+            cleaned_label = re.sub(r'[\s/-]+', '_', label_raw.lower().replace(':', '').replace('(', '').replace(')', '')).strip('_')
+
+            # --- NEW: More forgiving if/elif logic to standardize labels ---
+            final_label = cleaned_label # Default to the cleaned label
+            if "room_bedroom" in cleaned_label:
+                final_label = "bedrooms"
+            elif "room_full_bath" in cleaned_label:
+                final_label = "full_bathrooms"
+            elif "room_half_bath" in cleaned_label:
+                final_label = "half_bathrooms"
+            elif "heating_ac" in cleaned_label:
+                final_label = "heating_ac"
+            elif "stories_story_height" in cleaned_label:
+                final_label = "stories"
+
+            # --- End of new logic ---
+
+            if final_label in known_labels:
+                standard_characteristics[f"hcad_{final_label}"] = value
+            else:
+                extra_characteristics[final_label] = value
+
+    print(f"SUCCESS: Parsed characteristics. Found {len(standard_characteristics)} known and {len(extra_characteristics)} other properties.")
+
+
+def _locator_characteristic_pairs(char_table):
+    for row in char_table.locator('tr').all():
+        cells = row.locator('td').all()
+        if len(cells) == 2:
+            yield cells[0].inner_text().strip(), cells[1].inner_text().strip()
+
+
+def parse_building_characteristics(page):
+    """
+    Dynamically scrapes the Building Characteristics table, standardizes known variations,
+    and places any unknown characteristics into a separate JSON field to maintain a stable schema.
+    """
     standard_characteristics = {}
     extra_characteristics = {}
 
     print("INFO: Attempting to parse building characteristics...")
     try:
-        char_table_selector = 'xpath=/html/body/table/tbody/tr/td/table[17]/tbody/tr/td[2]/table'
-        char_table = page.locator(char_table_selector)
+        char_table = page.locator(f"xpath={BUILDING_CHARACTERISTICS_TABLE_XPATH}")
 
         if char_table.count() > 0:
-            rows = char_table.locator('tr').all()
-            for row in rows:
-                cells = row.locator('td').all()
-                if len(cells) == 2:
-                    label_raw = cells[0].inner_text().strip()
-                    value = cells[1].inner_text().strip()
-                    
-                    if label_raw:
-                        cleaned_label = re.sub(r'[\s/-]+', '_', label_raw.lower().replace(':', '').replace('(', '').replace(')', '')).strip('_')
-                        
-                        # --- NEW: More forgiving if/elif logic to standardize labels ---
-                        final_label = cleaned_label # Default to the cleaned label
-                        if "room_bedroom" in cleaned_label:
-                            final_label = "bedrooms"
-                        elif "room_full_bath" in cleaned_label:
-                            final_label = "full_bathrooms"
-                        elif "room_half_bath" in cleaned_label:
-                            final_label = "half_bathrooms"
-                        elif "heating_ac" in cleaned_label:
-                            final_label = "heating_ac"
-                        elif "stories_story_height" in cleaned_label:
-                            final_label = "stories"
-                        
-                        # --- End of new logic ---
-                        
-                        if final_label in known_labels:
-                            standard_characteristics[f"hcad_{final_label}"] = value
-                        else:
-                            extra_characteristics[final_label] = value
-            
-            print(f"SUCCESS: Parsed characteristics. Found {len(standard_characteristics)} known and {len(extra_characteristics)} other properties.")
+            _parse_characteristic_pairs(_locator_characteristic_pairs(char_table), standard_characteristics, extra_characteristics)
         else:
             print("INFO: Building characteristics table not found on this page.")
-            
+
     except Exception as e:
         print(f"WARN: An unexpected error occurred in parse_building_characteristics. Error: {e}")
-        
+
     standard_characteristics['hcad_other_characteristics_json'] = json.dumps(extra_characteristics) if extra_characteristics else None
-    
-    return standard_characteristics
 
+    return standard_characteristics
 
 
-def parse_building_area_data(page):
-    """
-    Scrapes the Building Area table, which has a variable number of rows.
-    Calculates total base, structure, and garage square footage.
-    """
-    # This selector targets all rows within the specific "Building Area" table.
-    # It's based on the XPaths you provided, made more general.
-    building_area_rows_selector = 'xpath=/html/body/table/tbody/tr/td/table[17]/tbody/tr/td[4]/table/tbody/tr'
-    
-    building_rows_data = []
-    total_base_sqft = 0
-    total_structure_sqft = 0
-    garage_sqft = 0
-    
+def _parse_building_area_rows(building_area_table_rows, cell_text, building_rows_data):
+    totals = {"base": 0, "structure": 0, "garage": 0}
     try:
-        building_area_table_rows = page.locator(building_area_rows_selector).all()
-        
-        # We start from the 3rd row to skip the header rows shown in your screenshot
+        # We start from the 3rd row to skip the header rows
         for row in building_area_table_rows[2:]:
-            type_text = row.locator('td:nth-child(1)').inner_text().strip()
-            area_text = row.locator('td:nth-child(2)').inner_text().strip()
-            
+            type_text = cell_text(row, 1).strip()
+            area_text = cell_text(row, 2).strip()
+
             # Skip empty rows if any
             if not type_text or not area_text:
                 continue
-                
+
             area = int(area_text.replace(",", ""))
 
             building_rows_data.append({
                 "type": type_text,
                 "area": area
             })
-            
+
             # Add to the total structure square footage
-            total_structure_sqft += area
-            
+            totals["structure"] += area
+
             # Check for specific types to sum them separately
             if "BASE AREA" in type_text:
-                total_base_sqft += area
-            
+                totals["base"] += area
+
             if "GARAGE" in type_text:
-                garage_sqft += area
-                
+                totals["garage"] += area
     except Exception as e:
         print(f"WARN: Could not parse building area data. Error: {e}")
+    return totals
+
 
+def _building_area_fields(building_rows_data, totals):
     return {
-        "hcad_total_base_sqft": total_base_sqft,
-        "hcad_total_structure_sqft": total_structure_sqft,
-        "hcad_garage_sqft": garage_sqft,
+        "hcad_total_base_sqft": totals["base"],
+        "hcad_total_structure_sqft": totals["structure"],
+        "hcad_garage_sqft": totals["garage"],
         "hcad_building_area_count": len(building_rows_data),
         "hcad_building_data_json": json.dumps(building_rows_data) if building_rows_data else None
     }
 
 
+def parse_building_area_data(page):
+    """
+    Scrapes the Building Area table, which has a variable number of rows.
+    Calculates total base, structure, and garage square footage.
+    """
+    building_rows_data = []
+    totals = {"base": 0, "structure": 0, "garage": 0}
+
+    try:
+        building_area_table_rows = page.locator(f"xpath={BUILDING_AREA_ROWS_XPATH}").all()
+        totals = _parse_building_area_rows(building_area_table_rows, _locator_cell_text, building_rows_data)
+    except Exception as e:
+        print(f"WARN: Could not parse building area data. Error: {e}")
+
+    return _building_area_fields(building_rows_data, totals)
+
+
+# --- Snapshot Detail Parsing ---
+# The locator helpers above cost one browser round trip per count()/inner_text() call (plus slow_mo).
+# The snapshot engine takes the whole document in a single p_page.content() call and evaluates the same
+# XPaths with lxml. Parsed HTML is normalised so bare <tr> children of <table> sit inside a <tbody>,
+# the way the browser DOM has them, so the tbody-based XPaths also work on HTML fetched without a browser.
+
+_SNAPSHOT_BLOCK_TAGS = {
+    "address", "blockquote", "caption", "center", "dd", "div", "dl", "dt", "fieldset", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "hr", "li", "ol", "p", "pre", "table", "tbody", "tfoot",
+    "thead", "tr", "ul",
+}
+_SNAPSHOT_SKIP_TAGS = {"head", "noscript", "script", "style", "template", "title"}
+_SNAPSHOT_BLOCK_BREAK = "\x00"
+
+
+def _snapshot_tree(html):
+    """Parses a page's HTML with lxml, wrapping bare table rows in <tbody> as a browser would."""
+    tree = lxml.html.document_fromstring(html)
+    for table in list(tree.iter("table")):
+        bare_rows = [child for child in table if child.tag == "tr"]
+        if bare_rows:
+            tbody = table.makeelement("tbody", {})
+            bare_rows[0].addprevious(tbody)
+            for row in bare_rows:
+                tbody.append(row)
+    return tree
+
+
+def _snapshot_collect_text(node, pieces):
+    tag = node.tag if isinstance(node.tag, str) else None
+    if tag is None or tag in _SNAPSHOT_SKIP_TAGS:
+        return
+    if tag == "br":
+        pieces.append("\n")
+        return
+    is_block = tag in _SNAPSHOT_BLOCK_TAGS
+    if is_block:
+        pieces.append(_SNAPSHOT_BLOCK_BREAK)
+    if node.text:
+        pieces.append(re.sub(r"[ \t\r\n\f]+", " ", node.text))
+    for child in node:
+        _snapshot_collect_text(child, pieces)
+        if child.tail:
+            pieces.append(re.sub(r"[ \t\r\n\f]+", " ", child.tail))
+    if tag in ("td", "th"):
+        pieces.append("\t")
+    elif is_block:
+        pieces.append(_SNAPSHOT_BLOCK_BREAK)
+
+
+def _snapshot_inner_text(element):
+    """
+    Approximates the browser's innerText for a snapshot node: whitespace collapsed, <br> and block
+    boundaries as line breaks, table cells tab-separated.
+    """
+    pieces = []
+    _snapshot_collect_text(element, pieces)
+    text = re.sub(rf"[ \t]*{_SNAPSHOT_BLOCK_BREAK}[{_SNAPSHOT_BLOCK_BREAK} \t]*", "\n", "".join(pieces))
+    lines = [re.sub(r" {2,}", " ", line).strip(" \t") for line in text.split("\n")]
+    return "\n".join(lines).strip("\n")
 
-def parse_hcad_detail_page(p_page, detail_url):
-    print(f"INFO: Navigating to and parsing detail page: {detail_url}")
-    
-    # --- Define all keys, including every new field ---
-    all_expected_keys = [
-        'hcad_account', 'hcad_owner_full_name', 'hcad_mailing_address',
-        'hcad_legal_desc_detail', 'hcad_site_address', 'hcad_pct_ownership',
-        'hcad_market_value_detail', 'hcad_appraised_value_detail', 
-        'hcad_land_area_sf', 'hcad_total_living_area_sf',
-        'hcad_lot_sqft_total', 'hcad_land_market_value_total', 'hcad_land_line_count', 'hcad_land_data_json',
-        'hcad_total_base_sqft', 'hcad_total_structure_sqft', 'hcad_garage_sqft',
-        'hcad_building_area_count', 'hcad_building_data_json',
-        'hcad_main_building_data_json', 'hcad_foundation_type', 'hcad_exterior_wall', 'hcad_heating_ac',
-        'hcad_grade_adjustment', 'hcad_physical_condition', 'hcad_full_bathrooms', 'hcad_bedrooms',
-        'hcad_land_market_value', 'hcad_improvement_market_value', 'hcad_appraised_history_json',
-        'hcad_detail_url_visited', 'parsing_error'
-    ]
-    
+
+def _snapshot_first_text(tree, *xpaths):
+    """inner_text of the first node matched by the first XPath that matches anything, else None."""
+    for xpath in xpaths:
+        nodes = tree.xpath(xpath)
+        if nodes:
+            return _snapshot_inner_text(nodes[0])
+    return None
+
+
+def _snapshot_cell_text(row, column):
+    """Snapshot equivalent of row.locator(f'td:nth-child({column})').inner_text(), including its strictness."""
+    cells = row.xpath(f".//td[count(preceding-sibling::*) = {column - 1}]")
+    if len(cells) != 1:
+        raise ValueError(f"expected one element for td:nth-child({column}), found {len(cells)}")
+    return _snapshot_inner_text(cells[0])
+
+
+def _snapshot_characteristic_pairs(char_table):
+    for row in char_table.xpath(".//tr"):
+        cells = row.xpath(".//td")
+        if len(cells) == 2:
+            yield _snapshot_inner_text(cells[0]).strip(), _snapshot_inner_text(cells[1]).strip()
+
+
+def extract_detail_fields_snapshot(tree, include_heavy=True):
+    """
+    Reads every main detail page field from a _snapshot_tree. Returns the same hcad_* keys and values
+    as extract_detail_fields_locator, without any further browser calls. With include_heavy=False only
+    the core fields are read (no land, building area, building or characteristics tables).
+    """
+    fields = {}
+
+    account_nodes = tree.xpath(DETAIL_ACCOUNT_XPATH)
+    if account_nodes:
+        fields['hcad_account'] = ' '.join(_snapshot_inner_text(account_nodes[0]).split()).strip()
+
+    owner_mail_text = _snapshot_first_text(tree, *DETAIL_OWNER_MAIL_XPATHS)
+    if owner_mail_text is not None:
+        lines = [line.strip() for line in owner_mail_text.split('\n') if line.strip()]
+        if lines:
+            fields['hcad_owner_full_name'] = lines[0]
+            fields['hcad_mailing_address'] = " ".join(lines[1:]) if len(lines) > 1 else None
+
+    legal_desc_text = _snapshot_first_text(tree, *DETAIL_LEGAL_DESC_XPATHS)
+    if legal_desc_text is not None:
+        fields['hcad_legal_desc_detail'] = ' '.join(legal_desc_text.splitlines()).strip()
+
+    site_address_text = _snapshot_first_text(tree, *DETAIL_SITE_ADDRESS_XPATHS)
+    if site_address_text is not None:
+        fields['hcad_site_address'] = ' '.join(site_address_text.splitlines()).strip()
+
+    fields['hcad_land_market_value'] = _clean_numeric_value(_snapshot_first_text(tree, DETAIL_LAND_MARKET_VALUE_XPATH))
+    fields['hcad_improvement_market_value'] = _clean_numeric_value(_snapshot_first_text(tree, DETAIL_IMPROVEMENT_MARKET_VALUE_XPATH))
+    if not include_heavy:
+        return fields
+
+    land_rows, total_lot_sqft, total_land_value = _parse_land_rows(tree.xpath(LAND_TABLE_ROWS_XPATH), _snapshot_cell_text)
+    fields.update({
+        "hcad_lot_sqft_total": total_lot_sqft,
+        "hcad_land_market_value_total": total_land_value,
+        "hcad_land_line_count": len(land_rows),
+        "hcad_land_data_json": json.dumps(land_rows) if land_rows else None
+    })
+    print(f"INFO: Land data parsed. Lines found: {fields['hcad_land_line_count']}. Total SQFT: {fields['hcad_lot_sqft_total']}.")
+
+    building_rows_data = []
+    totals = _parse_building_area_rows(tree.xpath(BUILDING_AREA_ROWS_XPATH), _snapshot_cell_text, building_rows_data)
+    fields.update(_building_area_fields(building_rows_data, totals))
+    print(f"INFO: Building Area data parsed. Lines found: {fields['hcad_building_area_count']}. Total Base SQFT: {fields['hcad_total_base_sqft']}.")
+
+    print("INFO: Attempting to parse main building data...")
+    building_list = []
+    total_impr_sqft = 0
+    # Chained Playwright XPaths starting with // are evaluated relative to every matched table,
+    # so the union over all matches is one document-order query here.
+    if tree.xpath(BUILDING_TABLE_XPATH):
+        headers = [_snapshot_inner_text(th).strip() for th in tree.xpath(BUILDING_TABLE_XPATH + '//thead/tr/th')]
+        data_rows = tree.xpath(BUILDING_TABLE_XPATH + '//tbody/tr[./td]')
+        total_impr_sqft = _parse_main_building_rows(headers, data_rows, _snapshot_cell_text, building_list)
+        if total_impr_sqft is None:
+            total_impr_sqft, building_list = 0, []
+    else:
+        print("INFO: Main building data table not found on this page.")
+    fields["hcad_impr_total_sqft"] = total_impr_sqft
+    fields["hcad_main_building_data_json"] = json.dumps(building_list) if building_list else None
+
+    print("INFO: Attempting to parse building characteristics...")
+    char_tables = tree.xpath(BUILDING_CHARACTERISTICS_TABLE_XPATH)
+    characteristics_data = {}
+    extra_characteristics = {}
+    if char_tables:
+        try:
+            # Locator chaining unions rows across every matched table, so walk them all in document order.
+            _parse_characteristic_pairs(
+                (pair for char_table in char_tables for pair in _snapshot_characteristic_pairs(char_table)),
+                characteristics_data, extra_characteristics)
+        except Exception as e:
+            print(f"WARN: An unexpected error occurred in parse_building_characteristics. Error: {e}")
+    else:
+        print("INFO: Building characteristics table not found on this page.")
+    characteristics_data['hcad_other_characteristics_json'] = json.dumps(extra_characteristics) if extra_characteristics else None
+    fields.update(characteristics_data)
+    print(f"INFO: Building characteristics parsed. Found {len(characteristics_data)} properties.")
+    print(f"INFO: Main Building data parsed. Buildings found: {len(building_list)}.")
+    return fields
+
+
+def extract_detail_fields_locator(p_page, include_heavy=True):
+    """Reads every main detail page field with individual Playwright locators (the original engine)."""
+    fields = {}
+
+    # --- Scrape Core Fields with Original Robust Logic ---
+    # HCAD Account Number
+    account_elem_b = p_page.locator(f"xpath={DETAIL_ACCOUNT_XPATH}")
+    if account_elem_b.count() > 0:
+        fields['hcad_account'] = ' '.join(account_elem_b.first.inner_text().split()).strip()
+
+    # Owner Name & Mailing Address
+    owner_mail_value_cell = p_page.locator(f"xpath={DETAIL_OWNER_MAIL_XPATHS[0]}")
+    if not owner_mail_value_cell.count(): owner_mail_value_cell = p_page.locator(f"xpath={DETAIL_OWNER_MAIL_XPATHS[1]}")
+    if owner_mail_value_cell.count() > 0:
+        lines = [line.strip() for line in owner_mail_value_cell.first.inner_text().split('\n') if line.strip()]
+        if lines:
+            fields['hcad_owner_full_name'] = lines[0]
+            fields['hcad_mailing_address'] = " ".join(lines[1:]) if len(lines) > 1 else None
+
+    # Legal Description
+    legal_desc_value_cell = p_page.locator(f"xpath={DETAIL_LEGAL_DESC_XPATHS[0]}")
+    if not legal_desc_value_cell.count(): legal_desc_value_cell = p_page.locator(f"xpath={DETAIL_LEGAL_DESC_XPATHS[1]}")
+    if legal_desc_value_cell.count() > 0:
+        fields['hcad_legal_desc_detail'] = ' '.join(legal_desc_value_cell.first.inner_text().splitlines()).strip()
+
+    # Property Address
+    prop_addr_value_cell = p_page.locator(f"xpath={DETAIL_SITE_ADDRESS_XPATHS[0]}")
+    if not prop_addr_value_cell.count(): prop_addr_value_cell = p_page.locator(f"xpath={DETAIL_SITE_ADDRESS_XPATHS[1]}")
+    if prop_addr_value_cell.count() > 0:
+        fields['hcad_site_address'] = ' '.join(prop_addr_value_cell.first.inner_text().splitlines()).strip()
+
+    # --- Scrape Additional Static Fields ---
+    fields['hcad_land_market_value'] = _clean_numeric_value(_locator_text(p_page, DETAIL_LAND_MARKET_VALUE_XPATH, "Land Market Value"))
+    fields['hcad_improvement_market_value'] = _clean_numeric_value(_locator_text(p_page, DETAIL_IMPROVEMENT_MARKET_VALUE_XPATH, "Improvement Market Value"))
+    if not include_heavy:
+        return fields
+
+   # --- Call Dynamic Table Parsers ---
+    land_data = parse_land_rows_xpath(p_page)
+    fields.update(land_data)
+    print(f"INFO: Land data parsed. Lines found: {land_data.get('hcad_land_line_count', 0)}. Total SQFT: {land_data.get('hcad_lot_sqft_total', 0)}.")
+
+    building_area_data = parse_building_area_data(p_page)
+    fields.update(building_area_data)
+    print(f"INFO: Building Area data parsed. Lines found: {building_area_data.get('hcad_building_area_count', 0)}. Total Base SQFT: {building_area_data.get('hcad_total_base_sqft', 0)}.")
+
+    main_building_data = parse_building_main_data(p_page)
+    fields.update(main_building_data)
+
+    characteristics_data = parse_building_characteristics(p_page)
+    fields.update(characteristics_data)
+    print(f"INFO: Building characteristics parsed. Found {len(characteristics_data)} properties.")
+
+    # --- CORRECTED: Safely check for None before processing JSON ---
+    main_building_json = main_building_data.get('hcad_main_building_data_json')
+    building_list_len = len(json.loads(main_building_json)) if main_building_json else 0
+    print(f"INFO: Main Building data parsed. Buildings found: {building_list_len}.")
+    return fields
+
+
+# --- Define all keys, including every new field ---
+HCAD_DETAIL_EXPECTED_KEYS = [
+    'hcad_account', 'hcad_owner_full_name', 'hcad_mailing_address',
+    'hcad_legal_desc_detail', 'hcad_site_address', 'hcad_pct_ownership',
+    'hcad_market_value_detail', 'hcad_appraised_value_detail',
+    'hcad_land_area_sf', 'hcad_total_living_area_sf',
+    'hcad_lot_sqft_total', 'hcad_land_market_value_total', 'hcad_land_line_count', 'hcad_land_data_json',
+    'hcad_total_base_sqft', 'hcad_total_structure_sqft', 'hcad_garage_sqft',
+    'hcad_building_area_count', 'hcad_building_data_json',
+    'hcad_main_building_data_json', 'hcad_foundation_type', 'hcad_exterior_wall', 'hcad_heating_ac',
+    'hcad_grade_adjustment', 'hcad_physical_condition', 'hcad_full_bathrooms', 'hcad_bedrooms',
+    'hcad_land_market_value', 'hcad_improvement_market_value', 'hcad_appraised_history_json',
+    'hcad_detail_url_visited', 'hcad_detail_level', 'parsing_error'
+]
+
+
+def _new_hcad_detail_record(detail_url):
     hcad_data = {"hcad_detail_url_visited": detail_url}
-    for key in all_expected_keys:
+    for key in HCAD_DETAIL_EXPECTED_KEYS:
         if key not in hcad_data: hcad_data[key] = None
-        
+    return hcad_data
+
+
+def extract_history_fields_snapshot(history_tree, detail_tree):
+    """Appraised value, total market value and the 5-year history JSON from snapshot trees of both pages."""
+    history = {}
+    for i in range(1, 6):
+        year = _snapshot_first_text(history_tree, HISTORY_YEAR_XPATH_TEMPLATE.format(i + 1))
+        value = _clean_numeric_value(_snapshot_first_text(history_tree, HISTORY_VALUE_XPATH_TEMPLATE.format(i)))
+        if year: history[year] = value
+    return {
+        'hcad_appraised_value_detail': _clean_numeric_value(_snapshot_first_text(history_tree, HISTORY_VALUE_XPATH_TEMPLATE.format(1))),
+        'hcad_market_value_detail': _clean_numeric_value(_snapshot_first_text(detail_tree, DETAIL_TOTAL_MARKET_VALUE_XPATH)),
+        'hcad_appraised_history_json': json.dumps(history) if history else None,
+    }
+
+
+HCAD_ARTIFACTS = DebugArtifactWriter(HCAD_ARTIFACT_DIR, HCAD_ARTIFACT_MODE, HCAD_ARTIFACT_SAMPLE_PERCENT, HCAD_ARTIFACT_MAX_FILES, HCAD_ARTIFACT_QUEUE_SIZE)
+
+
+def parse_hcad_detail_page(p_page, detail_url, detail_level="full"):
+    """Parses a detail page in the browser. detail_level "core" reads only the core fields and skips the 5-year history page."""
+    print(f"INFO: Navigating to and parsing detail page: {detail_url}")
+    hcad_data = _new_hcad_detail_record(detail_url)
+    include_heavy = detail_level != "core"
+
     try:
         # --- Main Navigation ---
         if p_page.url != detail_url:
+            HCAD_REQUEST_THROTTLE.wait()
             p_page.goto(detail_url, timeout=60000, wait_until="networkidle")
         else:
             p_page.wait_for_load_state("networkidle", timeout=20000)
-        
-        print(f"DEBUG: On detail page: {p_page.url}")
 
-        # --- Scrape Core Fields with Original Robust Logic ---
-        # This is the logic that was missing from the previous version.
-        # HCAD Account Number
-        account_xpath = "/html/body/table/tbody/tr/td/table[1]/tbody/tr/td[2]/b"
-        account_elem_b = p_page.locator(f"xpath={account_xpath}")
-        if account_elem_b.count() > 0:
-            hcad_data['hcad_account'] = ' '.join(account_elem_b.first.inner_text().split()).strip()
-
-        # Owner Name & Mailing Address
-        owner_mail_label_semantic_xpath = '//td[starts-with(normalize-space(.), "Owner Name & Mailing Address:")]/following-sibling::*[1]'
-        owner_mail_user_xpath = "/html/body/table/tbody/tr/td/table[5]/tbody/tr[2]/td[1]/table/tbody/tr/th"
-        owner_mail_value_cell = p_page.locator(f"xpath={owner_mail_label_semantic_xpath}")
-        if not owner_mail_value_cell.count(): owner_mail_value_cell = p_page.locator(f"xpath={owner_mail_user_xpath}")
-        if owner_mail_value_cell.count() > 0:
-            lines = [line.strip() for line in owner_mail_value_cell.first.inner_text().split('\n') if line.strip()]
-            if lines:
-                hcad_data['hcad_owner_full_name'] = lines[0]
-                hcad_data['hcad_mailing_address'] = " ".join(lines[1:]) if len(lines) > 1 else None
-
-        # Legal Description
-        legal_desc_label_semantic_xpath = '//td[normalize-space(.)="Legal Description:"]/following-sibling::*[1]'
-        legal_desc_user_xpath = "/html/body/table/tbody/tr/td/table[5]/tbody/tr[2]/td[2]/table/tbody/tr[1]/th"
-        legal_desc_value_cell = p_page.locator(f"xpath={legal_desc_label_semantic_xpath}")
-        if not legal_desc_value_cell.count(): legal_desc_value_cell = p_page.locator(f"xpath={legal_desc_user_xpath}")
-        if legal_desc_value_cell.count() > 0:
-            hcad_data['hcad_legal_desc_detail'] = ' '.join(legal_desc_value_cell.first.inner_text().splitlines()).strip()
-
-        # Property Address
-        prop_addr_semantic_xpath = '//td[normalize-space(.)="Property Address:"]/following-sibling::*[1]'
-        prop_addr_user_xpath = "/html/body/table/tbody/tr/td/table[5]/tbody/tr[2]/td[2]/table/tbody/tr[2]/th"
-        prop_addr_value_cell = p_page.locator(f"xpath={prop_addr_semantic_xpath}")
-        if not prop_addr_value_cell.count(): prop_addr_value_cell = p_page.locator(f"xpath={prop_addr_user_xpath}")
-        if prop_addr_value_cell.count() > 0:
-            hcad_data['hcad_site_address'] = ' '.join(prop_addr_value_cell.first.inner_text().splitlines()).strip()
-
-        # --- Scrape Additional Static Fields ---
-        def get_text(page_context, xpath, name):
-            try:
-                element = page_context.locator(f"xpath={xpath}").first
-                if element.is_visible(timeout=1000):
-                    return element.inner_text().strip()
-            except Exception:
-                print(f"WARN: Could not find '{name}' with XPath: {xpath}")
-            return None
-        
-        hcad_data['hcad_land_market_value'] = _clean_numeric_value(get_text(p_page, "/html/body/table/tbody/tr/td/table[12]/tbody/tr[4]/td[5]", "Land Market Value"))
-        hcad_data['hcad_improvement_market_value'] = _clean_numeric_value(get_text(p_page, "/html/body/table/tbody/tr/td/table[12]/tbody/tr[5]/td[5]", "Improvement Market Value"))
-        
-
-       # --- Call Dynamic Table Parsers ---
-        land_data = parse_land_rows_xpath(p_page)
-        hcad_data.update(land_data)
-        print(f"INFO: Land data parsed. Lines found: {land_data.get('hcad_land_line_count', 0)}. Total SQFT: {land_data.get('hcad_lot_sqft_total', 0)}.")
+        print(f"DEBUG: On detail page: {p_page.url}")
 
-        building_area_data = parse_building_area_data(p_page)
-        hcad_data.update(building_area_data)
-        print(f"INFO: Building Area data parsed. Lines found: {building_area_data.get('hcad_building_area_count', 0)}. Total Base SQFT: {building_area_data.get('hcad_total_base_sqft', 0)}.")
-        
-        main_building_data = parse_building_main_data(p_page)
-        hcad_data.update(main_building_data)
+        # One snapshot serves the snapshot engine, the history link and the total market value.
+        detail_tree = _snapshot_tree(p_page.content())
+        history_links = detail_tree.xpath(DETAIL_HISTORY_LINK_XPATH) if include_heavy else []
+        history_url = _history_url_from_link(history_links[0], p_page.url) if history_links else None
+        history_fetch = None
+        if history_url and HCAD_HISTORY_FETCH_MODE == "http":
+            history_fetch = _hcad_detail_executor().submit(fetch_hcad_html, history_url)
 
-        # --- NEW: Call the building characteristics parser ---
-        characteristics_data = parse_building_characteristics(p_page)
-        hcad_data.update(characteristics_data)
-        print(f"INFO: Building characteristics parsed. Found {len(characteristics_data)} properties.")
-        
-        # --- CORRECTED: Safely check for None before processing JSON ---
-        main_building_json = main_building_data.get('hcad_main_building_data_json')
-        building_list_len = len(json.loads(main_building_json)) if main_building_json else 0
-        print(f"INFO: Main Building data parsed. Buildings found: {building_list_len}.")
-
-        # --- Navigate and Scrape 5-Year History (with New Tab Logic) ---
-        history_link_xpath = "/html/body/table/tbody/tr/td/table[12]/tbody/tr[7]/td/a"
-        history_link = p_page.locator(f"xpath={history_link_xpath}")
-        if history_link.count() > 0:
+        if HCAD_DETAIL_PARSE_ENGINE == "snapshot":
+            hcad_data.update(extract_detail_fields_snapshot(detail_tree, include_heavy))
+        else:
+            hcad_data.update(extract_detail_fields_locator(p_page, include_heavy))
+        hcad_data['hcad_detail_level'] = "FULL" if include_heavy else "CORE"
+
+        # --- 5-Year History (fetched from the link's URL, no new tab) ---
+        if not include_heavy:
+            hcad_data['hcad_market_value_detail'] = _clean_numeric_value(_snapshot_first_text(detail_tree, DETAIL_TOTAL_MARKET_VALUE_XPATH))
+        elif history_url:
+            history_html = None
+            if history_fetch is not None:
+                try:
+                    history_html = history_fetch.result()
+                    _count_history_fetch("http")
+                except Exception as e_history:
+                    print(f"WARN: HTTP fetch of 5-Year History page failed ({e_history}). Opening it in this tab instead.")
+            if history_html is None:
+                HCAD_REQUEST_THROTTLE.wait()
+                p_page.goto(history_url, timeout=60000, wait_until="networkidle")
+                history_html = p_page.content()
+                _count_history_fetch("page")
+            print(f"DEBUG: Read 5-Year History page: {history_url}")
+            hcad_data.update(extract_history_fields_snapshot(_snapshot_tree(history_html), detail_tree))
+        elif history_links:
+            # The link's target could not be read from its attributes; let the site open it.
             with p_page.context.expect_page() as new_page_info:
-                history_link.click()
-            
+                p_page.locator(f"xpath={DETAIL_HISTORY_LINK_XPATH}").click()
             history_page = new_page_info.value
             history_page.wait_for_load_state("networkidle")
-            print(f"DEBUG: Switched to 5-Year History page: {history_page.url}")
-
-            hcad_data['hcad_appraised_value_detail'] = _clean_numeric_value(get_text(history_page, "/html/body/table[2]/tbody/tr[2]/th[1]", "Most Recent Appraised Value"))
-            hcad_data['hcad_market_value_detail'] = _clean_numeric_value(get_text(p_page, "/html/body/table/tbody/tr/td/table[12]/tbody/tr[6]/td[5]", "Total Market Value"))
-            
-            history = {}
-            for i in range(1, 6):
-                year = get_text(history_page, f"/html/body/table[2]/tbody/tr[1]/td[{i+1}]/b", f"Year {i}")
-                value = _clean_numeric_value(get_text(history_page, f"/html/body/table[2]/tbody/tr[2]/th[{i}]", f"Value {i}"))
-                if year: history[year] = value
-            
-            hcad_data['hcad_appraised_history_json'] = json.dumps(history) if history else None
-            
+            hcad_data.update(extract_history_fields_snapshot(_snapshot_tree(history_page.content()), detail_tree))
             history_page.close()
-            print("DEBUG: Closed history tab and returned to main detail page.")
+            _count_history_fetch("tab")
         else:
             print("WARN: Could not find link to 5-Year Value History page.")
-        
+
         print(f"SUCCESS: Parsed detail page data.")
         return hcad_data
 
@@ -462,92 +1675,533 @@ def parse_hcad_detail_page(p_page, detail_url):
         print(f"ERROR: Exception during detail page parsing for {detail_url}: {e}")
         traceback.print_exc()
 
-        # --- NEW: Save screenshots to a dedicated folder ---
-        try:
-            screenshot_folder = "hcad_error_screenshots"
-            os.makedirs(screenshot_folder, exist_ok=True) # Create folder if it doesn't exist
-            
-            # Create a unique filename based on the case number and time
-            case_num_for_file = hcad_data.get('probate_lead_case_number', 'UNKNOWN_CASE')
-            timestamp = f"{time.time():.0f}"
-            filename = f"parse_error_{case_num_for_file}_{timestamp}.png"
-
-            screenshot_path = os.path.join(screenshot_folder, filename)
-            p_page.screenshot(path=screenshot_path)
-            print(f"INFO: Saved error screenshot to: {screenshot_path}")
-        except Exception as se:
-            print(f"ERROR: Could not save screenshot: {se}")
-        # --- End of new logic ---
-
-        hcad_data["parsing_error"] = str(e) 
+        # Screenshot and page HTML go to HCAD_ARTIFACT_DIR via the background artifact writer.
+        if HCAD_ARTIFACTS.should_capture(is_error=True):
+            try:
+                # Create a unique filename based on the case number and time
+                case_num_for_file = hcad_data.get('probate_lead_case_number', 'UNKNOWN_CASE')
+                file_stem = f"parse_error_{case_num_for_file}_{time.time():.0f}"
+                HCAD_ARTIFACTS.save_screenshot(p_page, file_stem)
+                HCAD_ARTIFACTS.save_html(p_page.content(), file_stem)
+                print(f"INFO: Queued error screenshot and HTML: {os.path.join(HCAD_ARTIFACT_DIR, file_stem)}")
+            except Exception as se:
+                print(f"ERROR: Could not save screenshot: {se}")
+
+        hcad_data["parsing_error"] = str(e)
         return hcad_data
 
+
+# --- Browserless Detail Fetching ---
+
+_HCAD_HTTP_SESSION = None
+_HCAD_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def get_hcad_http_session():
+    """Shared requests session with a keep-alive connection pool sized for HCAD_HTTP_MAX_WORKERS."""
+    global _HCAD_HTTP_SESSION
+    with _HCAD_HTTP_SESSION_LOCK:
+        if _HCAD_HTTP_SESSION is None:
+            session = requests.Session()
+            retries = Retry(total=HCAD_HTTP_MAX_RETRIES, backoff_factor=1.0,
+                            status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"])
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HCAD_HTTP_POOL_SIZE, max_retries=retries)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({
+                "User-Agent": HCAD_BROWSER_CONTEXT_OPTIONS.get("user_agent", "Mozilla/5.0"),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            })
+            _HCAD_HTTP_SESSION = session
+        return _HCAD_HTTP_SESSION
+
+
+class HcadFetchCancelled(Exception):
+    pass
+
+
+def fetch_hcad_html(url, cancel_event=None):
+    """GETs url with the shared session. If cancel_event is set before the request goes out, raises instead."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise HcadFetchCancelled(f"Fetch of {url} cancelled")
+    HCAD_REQUEST_THROTTLE.wait()
+    # Checked again because the throttle wait is where a queued fetch spends most of its time.
+    if cancel_event is not None and cancel_event.is_set():
+        raise HcadFetchCancelled(f"Fetch of {url} cancelled")
+    response = get_hcad_http_session().get(url, timeout=HCAD_HTTP_TIMEOUT_S)
+    response.raise_for_status()
+    return response.text
+
+
+def _history_url_from_link(link_element, base_url):
+    """The 5-year history link opens a new tab; its target is either a plain href or a window.open(...) argument."""
+    for attr in ("href", "onclick"):
+        raw_value = (link_element.get(attr) or "").strip()
+        if not raw_value or raw_value == "#":
+            continue
+        if attr == "onclick" or raw_value.lower().startswith("javascript:"):
+            quoted_url = re.search(r"""['"]([^'"]+)['"]""", raw_value)
+            if quoted_url:
+                return urljoin(base_url, quoted_url.group(1))
+            continue
+        return urljoin(base_url, raw_value)
+    return None
+
+
+def parse_hcad_detail_http(detail_url, cancel_event=None, detail_level="full"):
+    """
+    Fetches a detail page and its 5-year history page without a browser and parses both with the
+    snapshot engine. Returns the same record as parse_hcad_detail_page; failures set parsing_error.
+    """
+    print(f"INFO: Fetching and parsing detail page over HTTP: {detail_url}")
+    hcad_data = _new_hcad_detail_record(detail_url)
+    try:
+        detail_tree = _snapshot_tree(fetch_hcad_html(detail_url, cancel_event))
+        if detail_level == "core":
+            hcad_data.update(extract_detail_fields_snapshot(detail_tree, include_heavy=False))
+            hcad_data['hcad_market_value_detail'] = _clean_numeric_value(_snapshot_first_text(detail_tree, DETAIL_TOTAL_MARKET_VALUE_XPATH))
+            hcad_data['hcad_detail_level'] = "CORE"
+            print(f"SUCCESS: Parsed detail page core fields.")
+            return hcad_data
+        hcad_data.update(extract_detail_fields_snapshot(detail_tree))
+        hcad_data['hcad_detail_level'] = "FULL"
+
+        history_links = detail_tree.xpath(DETAIL_HISTORY_LINK_XPATH)
+        history_url = _history_url_from_link(history_links[0], detail_url) if history_links else None
+        if history_url:
+            print(f"DEBUG: Fetching 5-Year History page: {history_url}")
+            hcad_data.update(extract_history_fields_snapshot(_snapshot_tree(fetch_hcad_html(history_url, cancel_event)), detail_tree))
+        else:
+            print("WARN: Could not find link to 5-Year Value History page.")
+
+        print(f"SUCCESS: Parsed detail page data.")
+    except HcadFetchCancelled as e:
+        print(f"DEBUG: {e}")
+        hcad_data["parsing_error"] = str(e)
+    except Exception as e:
+        print(f"ERROR: Exception during HTTP detail fetch for {detail_url}: {e}")
+        hcad_data["parsing_error"] = str(e)
+    return hcad_data
+
+
+_HCAD_DETAIL_EXECUTOR = None
+HCAD_HISTORY_FETCHES = {"http": 0, "page": 0, "tab": 0}
+_HCAD_HISTORY_FETCHES_LOCK = threading.Lock()
+
+
+def _count_history_fetch(how):
+    with _HCAD_HISTORY_FETCHES_LOCK:
+        HCAD_HISTORY_FETCHES[how] += 1
+
+
+def _hcad_detail_executor():
+    global _HCAD_DETAIL_EXECUTOR
+    with _HCAD_HTTP_SESSION_LOCK:
+        if _HCAD_DETAIL_EXECUTOR is None:
+            _HCAD_DETAIL_EXECUTOR = ThreadPoolExecutor(max_workers=HCAD_HTTP_MAX_WORKERS, thread_name_prefix="hcad-detail")
+    return _HCAD_DETAIL_EXECUTOR
+
+
+def submit_hcad_detail_fetch(detail_url, summary_account=None, cancel_event=None, detail_level=None):
+    """
+    Queues a browserless get_hcad_detail_cached call on a shared pool of HCAD_HTTP_MAX_WORKERS threads
+    and returns its Future. There is no browser fallback inside the pool (pages are thread-bound);
+    HCAD_REQUEST_THROTTLE still caps the overall request rate. Setting cancel_event abandons the fetch
+    if its request has not gone out yet (the result then carries a parsing_error and is not cached).
+    """
+    return _hcad_detail_executor().submit(get_hcad_detail_cached, None, detail_url, summary_account, "http", cancel_event, detail_level)
+
+
+def fetch_hcad_details_concurrent(detail_requests):
+    """
+    Fetches many detail pages at once over HTTP. detail_requests is a list of (detail_url, summary_account)
+    pairs; the returned list holds get_hcad_detail_cached results in the same order.
+    """
+    pending_fetches = [submit_hcad_detail_fetch(detail_url, summary_account) for detail_url, summary_account in detail_requests]
+    return [future.result() for future in pending_fetches]
+
+
+class HcadDetailBackfill:
+    """
+    Detail fetches queued for summary winners accepted without their detail page. submit() starts the
+    fetch; apply() waits for the fetches and fills the rows' missing detail fields.
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.filled = 0
+        self.failed = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def submit(self, detail_url, account):
+        key = HcadDetailStore._normalize_key(account)
+        with self._lock:
+            if key and key not in self._pending:
+                self._pending[key] = submit_hcad_detail_fetch(detail_url, account)
+                self.submitted += 1
+
+    def apply(self, output_rows):
+        """Fills every PENDING row from its finished detail fetch. Only fields that are still empty are set."""
+        for output_row in output_rows:
+            if not output_row or output_row.get('hcad_detail_backfill_status') != "PENDING":
+                continue
+            with self._lock:
+                pending_fetch = self._pending.get(HcadDetailStore._normalize_key(output_row.get('hcad_account')))
+            detail_data = None
+            if pending_fetch is not None:
+                try:
+                    detail_data = pending_fetch.result()
+                except Exception as e_fetch:
+                    print(f"WARN: Detail backfill for Acct {output_row.get('hcad_account')} failed: {e_fetch}")
+            if detail_data and not detail_data.get('parsing_error') and detail_data.get('hcad_account'):
+                for key, value in detail_data.items():
+                    if output_row.get(key) is None: output_row[key] = value
+                output_row['hcad_detail_backfill_status'] = "DONE"
+                self.filled += 1
+            else:
+                output_row['hcad_detail_backfill_status'] = "FAILED"
+                self.failed += 1
+
+    def stats_line(self):
+        return f"queued={self.submitted}, rows filled={self.filled}, rows failed={self.failed}"
+
+
+HCAD_DETAIL_BACKFILL = HcadDetailBackfill()
+
+
+HCAD_HEAVY_DETAIL_COUNTS = {"rows_full": 0, "rows_core_only": 0, "accounts_fetched": 0, "accounts_failed": 0}
+_HCAD_HEAVY_DETAIL_COUNTS_LOCK = threading.Lock()
+
+
+def _count_heavy_detail_event(event_name, amount=1):
+    with _HCAD_HEAVY_DETAIL_COUNTS_LOCK:
+        HCAD_HEAVY_DETAIL_COUNTS[event_name] += amount
+
+
+def _wants_heavy_hcad_detail(output_row):
+    """Whether a row's lead passes the phase 2 gate: match_score_total or match_confidence_level."""
+    try:
+        match_score_total = float(output_row.get('match_score_total'))
+    except (TypeError, ValueError):
+        match_score_total = float('nan')
+    if match_score_total >= HCAD_HEAVY_DETAIL_MIN_MATCH_SCORE:
+        return True
+    return str(output_row.get('match_confidence_level', '')).strip() in HCAD_HEAVY_DETAIL_CONFIDENCE_LEVELS
+
+
+def fetch_heavy_hcad_details(output_rows):
+    """
+    Phase 2 of HCAD_TWO_PHASE_ENRICHMENT: fetches the full detail record once per account for the CORE rows
+    that pass _wants_heavy_hcad_detail and fills in the fields they are still missing. Other rows stay CORE.
+    """
+    if not HCAD_TWO_PHASE_ENRICHMENT:
+        return
+    rows_by_account = {}
+    for output_row in output_rows:
+        if not output_row or output_row.get('hcad_detail_level') != "CORE":
+            continue
+        if not _wants_heavy_hcad_detail(output_row):
+            _count_heavy_detail_event("rows_core_only")
+            continue
+        account = HcadDetailStore._normalize_key(output_row.get('hcad_account'))
+        if account and output_row.get('hcad_detail_url_visited'):
+            rows_by_account.setdefault(account, []).append(output_row)
+    if not rows_by_account:
+        return
+
+    print(f"INFO: Phase 2: fetching full HCAD details for {len(rows_by_account)} account(s) "
+          f"({sum(len(rows) for rows in rows_by_account.values())} row(s)).")
+    pending_fetches = {
+        account: submit_hcad_detail_fetch(rows[0]['hcad_detail_url_visited'], rows[0].get('hcad_account'), detail_level="full")
+        for account, rows in rows_by_account.items()
+    }
+    for account, pending_fetch in pending_fetches.items():
+        try:
+            detail_data = pending_fetch.result()
+        except Exception as e_fetch:
+            print(f"WARN: Phase 2 detail fetch for Acct {account} failed: {e_fetch}")
+            detail_data = None
+        if not detail_data or detail_data.get('parsing_error') or detail_data.get('hcad_detail_level') != "FULL":
+            print(f"WARN: Phase 2 could not fetch full details for Acct {account}. Its row(s) keep the core fields only.")
+            _count_heavy_detail_event("accounts_failed")
+            continue
+        _count_heavy_detail_event("accounts_fetched")
+        for output_row in rows_by_account[account]:
+            for key, value in detail_data.items():
+                if output_row.get(key) is None: output_row[key] = value
+            output_row['hcad_detail_level'] = "FULL"
+            _count_heavy_detail_event("rows_full")
+
+
+def benchmark_hcad_detail_parse(p_page, pages, repeats=3):
+    """
+    Times extract_detail_fields_locator against extract_detail_fields_snapshot on already-rendered
+    detail pages and checks they agree. `pages` holds detail URLs and/or paths to saved detail page HTML
+    (loaded with set_content, so no network is needed). The 5-year history tab is not included.
+    Returns a list of per-page result dicts.
+    """
+    results = []
+    for page_ref in pages:
+        if os.path.exists(page_ref):
+            with open(page_ref, encoding="utf-8", errors="replace") as f:
+                p_page.set_content(f.read(), wait_until="load")
+        else:
+            p_page.goto(page_ref, timeout=60000, wait_until="networkidle")
+
+        timings = {"locator": [], "snapshot": []}
+        outputs = {}
+        for _ in range(repeats):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                outputs["locator"] = extract_detail_fields_locator(p_page)
+                timings["locator"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                outputs["snapshot"] = extract_detail_fields_snapshot(_snapshot_tree(p_page.content()))
+                timings["snapshot"].append(time.perf_counter() - start)
+
+        mismatched = sorted(key for key in set(outputs["locator"]) | set(outputs["snapshot"])
+                            if outputs["locator"].get(key) != outputs["snapshot"].get(key))
+        result = {
+            "page": page_ref,
+            "locator_ms": 1000 * min(timings["locator"]),
+            "snapshot_ms": 1000 * min(timings["snapshot"]),
+            "mismatched_keys": mismatched,
+        }
+        results.append(result)
+        print(f"INFO: [BENCH] {page_ref}: locator {result['locator_ms']:.1f} ms, snapshot {result['snapshot_ms']:.1f} ms "
+              f"({result['locator_ms'] / max(result['snapshot_ms'], 0.001):.1f}x)"
+              + (f", MISMATCHED: {mismatched}" if mismatched else ", outputs identical"))
+
+    if results:
+        mean_locator = sum(r["locator_ms"] for r in results) / len(results)
+        mean_snapshot = sum(r["snapshot_ms"] for r in results) / len(results)
+        print(f"INFO: [BENCH] {len(results)} page(s): mean per-page parse locator {mean_locator:.1f} ms, "
+              f"snapshot {mean_snapshot:.1f} ms.")
+    return results
+
+
+def get_hcad_detail_cached(p_page, detail_url, summary_account=None, fetch_mode=None, cancel_event=None, detail_level=None):
+    """
+    Returns detail data for detail_url, consulting HCAD_DETAIL_CACHE before scraping.
+    A successful parse is stored under its canonical hcad_account, with the acct= value from
+    the URL and the results-list account number recorded as aliases.
+    fetch_mode overrides HCAD_DETAIL_FETCH_MODE for this call; cancel_event can abandon an HTTP fetch.
+    detail_level is "core" or "full" (default: "core" in phase 1 of HCAD_TWO_PHASE_ENRICHMENT, else "full");
+    a cached CORE record does not satisfy a "full" request.
+    In HCAD_BULK_EXTRACT_MODE the record comes from HCAD_BULK_EXTRACT, and the site is only asked for
+    the fields the extract does not carry (HCAD_BULK_EXTRACT_SITE_BACKFILL, or phase 2 of two-phase enrichment).
+    """
+    detail_level = detail_level or ("core" if HCAD_TWO_PHASE_ENRICHMENT else "full")
+    if HCAD_BULK_EXTRACT_MODE:
+        bulk_detail = HCAD_BULK_EXTRACT.detail(_parse_acct_from_url(detail_url) or summary_account)
+        if bulk_detail:
+            print(f"DEBUG: [BULK EXTRACT] Detail data for Acct: {bulk_detail['hcad_account']}")
+            if detail_level == "full" and (HCAD_BULK_EXTRACT_SITE_BACKFILL or HCAD_TWO_PHASE_ENRICHMENT):
+                site_detail = _get_hcad_detail_from_site(p_page, detail_url, summary_account, fetch_mode or "http", cancel_event, "full") or {}
+                for key, value in site_detail.items():
+                    if key not in ('parsing_error', 'hcad_detail_url_visited') and bulk_detail.get(key) is None:
+                        bulk_detail[key] = value
+                if site_detail.get('hcad_detail_level') == "FULL" and not site_detail.get('parsing_error'):
+                    bulk_detail['hcad_detail_level'] = "FULL"
+            return bulk_detail
+        print(f"WARN: Account {_parse_acct_from_url(detail_url) or summary_account} is not in the bulk extract.")
+        return None
+    return _get_hcad_detail_from_site(p_page, detail_url, summary_account, fetch_mode, cancel_event, detail_level)
+
+
+def _get_hcad_detail_from_site(p_page, detail_url, summary_account=None, fetch_mode=None, cancel_event=None, detail_level="full"):
+    fetch_mode = fetch_mode or HCAD_DETAIL_FETCH_MODE
+    acct_from_url = _parse_acct_from_url(detail_url)
+    cached_detail = HCAD_DETAIL_CACHE.get(acct_from_url, summary_account)
+    # Records cached before hcad_detail_level existed were always full parses.
+    if cached_detail and (detail_level == "core" or cached_detail.get('hcad_detail_level') != "CORE"):
+        print(f"DEBUG: [CACHE HIT] Detail data for Acct: {cached_detail.get('hcad_account')}")
+        return cached_detail
+    if not detail_url or (not p_page and fetch_mode != "http"):
+        return None
+
+    print(f"DEBUG: [CACHE MISS] Fetching {detail_level} details for Acct: {acct_from_url or summary_account}, URL: {detail_url}")
+    if fetch_mode == "http":
+        detail_data = parse_hcad_detail_http(detail_url, cancel_event, detail_level)
+        if p_page and (detail_data.get('parsing_error') or not detail_data.get('hcad_account')):
+            print(f"WARN: HTTP detail fetch did not yield an account for {detail_url}. Falling back to the browser.")
+            detail_data = parse_hcad_detail_page(p_page, detail_url, detail_level)
+    else:
+        detail_data = parse_hcad_detail_page(p_page, detail_url, detail_level)
+    if detail_data and not detail_data.get('parsing_error') and detail_data.get('hcad_account'):
+        HCAD_DETAIL_CACHE.put(detail_data, acct_from_url, summary_account)
+        print(f"INFO: Cached details for account {detail_data['hcad_account']}")
+    return detail_data
+
 #  Only parse_hcad_detail_page is modified here.
 
-def _score_summary_candidate(candidate_summary, rp_data_row, tier_context):
+class RowContext:
+    """
+    What the tier loop and the candidate scorers read from one input row, derived once per row:
+    the NAN-cleaned legal parts used for queries, every tier's (legal, owner) query, the raw
+    upper-cased parts and owner targets the scorers compare against, and the full comparison legal.
+    """
+
+    __slots__ = (
+        "rp_row", "tract", "block", "subdivision", "section", "lot",
+        "first_grantee_last_name", "decedent_last_for_search", "query_shape", "tier_queries",
+        "confidence_level", "t0_probate_last", "t0_rp_party_last", "full_rp_legal",
+        "subdivision_orig", "detail_subdivision", "detail_legal_needles",
+        "summary_owner_targets", "detail_owner_targets", "local_index_tokens", "local_index_legal_needles",
+    )
+
+    def __init__(self, rp_row):
+        self.rp_row = rp_row
+        row = rp_row.to_dict() if isinstance(rp_row, pd.Series) else dict(rp_row)
+
+        # --- Standard variable extraction (query construction) ---
+        tract = str(row.get('rp_legal_tract', '')).upper().strip()
+        block = str(row.get('rp_legal_block', '')).upper().strip()
+        subdivision = str(row.get('rp_legal_description_text', '')).upper().strip()
+        section = str(row.get('rp_legal_sec', str(row.get('rp_legal_section', '')))).upper().strip() # Handles both keys
+
+        raw_lot = row.get('rp_legal_lot', None) # Get it potentially as float/int or string
+        lot = "" # Default to empty string
+        if pd.notna(raw_lot) and str(raw_lot).strip() != "":
+            try:
+                # Attempt to convert to float first, then to int, to handle "X.0"
+                float_val = float(raw_lot)
+                if float_val.is_integer(): # Check if it's a whole number (e.g., 5.0)
+                    lot = str(int(float_val)) # Convert to "5"
+                else:
+                    lot = str(raw_lot).upper().strip() # Keep as is if it has actual decimals e.g. "5.5A" (unlikely for lot)
+            except ValueError:
+                # If it's not a number (e.g., "A", "10A", or already "5"), just use it as is
+                lot = str(raw_lot).upper().strip()
+
+        grantee_full_names = row.get('rp_grantee_full_names_list', [])
+        first_grantee_last_name = None
+        if isinstance(grantee_full_names, list) and grantee_full_names:
+            first_grantee_full_name_parts = str(grantee_full_names[0]).split()
+            if first_grantee_full_name_parts:
+                first_grantee_last_name = first_grantee_full_name_parts[-1].upper().strip()
+
+        decedent_last_raw = str(row.get('probate_lead_decedent_last', '')).upper().strip()
+        decedent_first_raw = str(row.get('probate_lead_decedent_first', '')).upper().strip()
+
+        # Clean 'NAN' values from main variables for query construction
+        self.tract = tract if tract and tract != 'NAN' else "" # Use empty string if NAN for easier logic
+        self.block = block if block and block != 'NAN' else ""
+        self.subdivision = subdivision if subdivision and subdivision != 'NAN' else ""
+        self.section = section if section and section != 'NAN' else ""
+        self.lot = lot if lot and lot != 'NAN' else ""
+        self.first_grantee_last_name = first_grantee_last_name if first_grantee_last_name and first_grantee_last_name != 'NAN' else None
+        self.decedent_last_for_search = decedent_last_raw if decedent_last_raw and decedent_last_raw != 'NAN' else None
+
+        present = {"lot": self.lot, "block": self.block, "tract": self.tract, "sec": self.section, "sub": self.subdivision,
+                   "grantee": self.first_grantee_last_name, "decedent": self.decedent_last_for_search}
+        self.query_shape = "+".join(name for name, value in present.items() if value) or "none"
+        self.tier_queries = {tier_info["name"]: construct_search_query(self, tier_info["name"]) for tier_info in HCAD_SEARCH_TIERS_CONFIG}
+
+        # --- Tier loop inputs ---
+        self.confidence_level = str(row.get('match_confidence_level', 'Unknown')).strip()
+        self.t0_probate_last = decedent_last_raw
+        self.t0_rp_party_last = str(row.get('cleaned_rp_party_last_name', '')).upper().strip()
+
+        # --- Scoring inputs (raw upper-cased parts, as the scorers have always compared them) ---
+        self.full_rp_legal = construct_full_rp_legal_for_comparison(row)
+        self.subdivision_orig = subdivision
+        self.detail_subdivision = subdivision if subdivision and subdivision != 'NAN' else ""
+        lot_orig = str(row.get('rp_legal_lot', '')).upper().strip()
+        self.detail_legal_needles = [
+            (points, needles) for points, value, needles in (
+                (40, tract, (f"TR {tract}",)), (30, block, (f"BLK {block}",)),
+                (20, lot_orig, (f"LT {lot_orig}", f"LOT {lot_orig}")), (10, section, (f"SEC {section}",)))
+            if value and value != 'NAN'
+        ]
+
+        first_grantee_parts = []
+        if grantee_full_names and isinstance(grantee_full_names, list) and grantee_full_names[0]:
+            first_grantee_parts = str(grantee_full_names[0]).upper().strip().split()
+        grantee_last = first_grantee_parts[-1] if first_grantee_parts else ""
+        self.summary_owner_targets = {"grantee": grantee_last, "decedent": decedent_last_raw, "other": ""}
+
+        def _full_target(first_name, last_name):
+            full_name = f"{first_name} {last_name}".strip()
+            return full_name if full_name.strip() else None
+        if row.get('cleaned_rp_party_last_name'): # Prioritize cleaned RP party name
+            legal_target = _full_target(str(row.get('cleaned_rp_party_first_name', '')).upper().strip(), self.t0_rp_party_last)
+        else: # Fallback to probate decedent if no cleaned_rp_party name
+            legal_target = _full_target(decedent_first_raw, decedent_last_raw)
+        self.detail_owner_targets = {
+            "grantee": _full_target(" ".join(first_grantee_parts[:-1]), grantee_last),
+            "decedent": _full_target(decedent_first_raw, decedent_last_raw),
+            "other": legal_target,
+        }
+
+        # --- Local candidate index lookup ---
+        index_legal = " ".join(part for part in (f"LT {self.lot}" if self.lot else "", f"BLK {self.block}" if self.block else "",
+                                                 f"TR {self.tract}" if self.tract else "", f"SEC {self.section}" if self.section else "",
+                                                 self.subdivision) if part)
+        self.local_index_tokens = hcad_candidate_tokens(index_legal, [name for name in self.detail_owner_targets.values() if name])
+        # Same points as detail_legal_needles, but from the cleaned parts (lot 5.0 -> "5")
+        self.local_index_legal_needles = [
+            (points, needles) for points, value, needles in (
+                (40, self.tract, (f"TR {self.tract}",)), (30, self.block, (f"BLK {self.block}",)),
+                (20, self.lot, (f"LT {self.lot}", f"LOT {self.lot}")), (10, self.section, (f"SEC {self.section}",)))
+            if value
+        ]
+
+    @staticmethod
+    def owner_target_kind(tier_context):
+        if "GranteeLastName" in tier_context: return "grantee"
+        if "DecedentLastName" in tier_context or "Fallback_Owner" in tier_context: return "decedent"
+        return "other"
+
+
+def _score_summary_candidates(candidate_summaries, row_context, tier_context):
     """
-    Scores a candidate based ONLY on summary data from HCAD results list.
+    Scores candidates based ONLY on summary data from the HCAD results list, all at once.
     Args:
-        candidate_summary (dict): A dict from hcad_results_list (e.g., owner_summary, address_summary).
-        rp_data_row (pd.Series): The input row data.
+        candidate_summaries (list): Dicts from hcad_results_list (e.g., owner_summary, address_summary).
+        row_context (RowContext): The input row's precomputed search/scoring context.
         tier_context (str): The name of the current search tier.
     Returns:
-        float: The calculated summary score.
+        np.ndarray: The summary score of each candidate, in input order.
     """
-    score = 0
-    hcad_owner_summary = str(candidate_summary.get('hcad_owner_summary', '')).upper().strip()
-    hcad_address_summary = str(candidate_summary.get('hcad_address_summary', '')).upper().strip() # This often contains legal desc/subdivision
-    hcad_account_summary = str(candidate_summary.get('hcad_account_summary', '')).upper().strip()
+    scores = np.zeros(len(candidate_summaries), dtype=np.float64)
+    if not candidate_summaries:
+        return scores
+    hcad_owner_summaries = [str(c.get('hcad_owner_summary', '')).upper().strip() for c in candidate_summaries]
+    hcad_address_summaries = [str(c.get('hcad_address_summary', '')).upper().strip() for c in candidate_summaries] # These often contain legal desc/subdivision
 
     # --- Owner Name Component (if tier involves owner) ---
-    owner_query_name_for_tier = ""
-    # Determine the target name from rp_data_row based on tier_context
-    if "GranteeLastName" in tier_context:
-        # For T1_GranteeLastName_Subdivision, we'd use the first grantee's last name
-        grantee_names = rp_data_row.get('rp_grantee_full_names_list', [])
-        if grantee_names and isinstance(grantee_names, list) and grantee_names[0]:
-            first_grantee_full_name = str(grantee_names[0]).strip()
-            owner_query_name_for_tier = first_grantee_full_name.split()[-1].upper() # Just last name
-    elif "DecedentLastName" in tier_context or "Fallback_Owner" in tier_context:
-        owner_query_name_for_tier = str(rp_data_row.get('probate_lead_decedent_last', '')).upper().strip()
-    
-    if owner_query_name_for_tier and hcad_owner_summary:
-        # Simple check: is the query name part of the HCAD owner summary?
-        # token_set_ratio is good for this as names can be reordered or have initials.
-        owner_match_score = fuzz.token_set_ratio(owner_query_name_for_tier, hcad_owner_summary)
-        score += owner_match_score * 0.5 # Weight: 50%
+    # First grantee's last name for grantee tiers, the decedent's last name for decedent/fallback tiers.
+    # token_set_ratio is good for this as names can be reordered or have initials; an empty owner scores 0.
+    owner_query_name_for_tier = row_context.summary_owner_targets[RowContext.owner_target_kind(tier_context)]
+    if owner_query_name_for_tier:
+        scores += process.cdist([owner_query_name_for_tier], hcad_owner_summaries, scorer=fuzz.token_set_ratio, dtype=np.float64)[0] * 0.5 # Weight: 50%
 
     # --- Legal/Address Component (Subdivision mainly) ---
-    rp_subdivision_orig = str(rp_data_row.get('rp_legal_description_text', '')).upper().strip()
-    if rp_subdivision_orig and hcad_address_summary:
-        # hcad_address_summary often IS the subdivision or contains it.
-        # token_set_ratio is good for matching phrases with common words.
-        subdiv_match_score = fuzz.token_set_ratio(rp_subdivision_orig, hcad_address_summary)
-        score += subdiv_match_score * 0.5 # Weight: 50%
-    
-    # --- Bonus for T1/T2 specific components if address summary is very close to full legal ---
-    # This is harder with just summary, but we can try.
-    if tier_context in ["T2_ExactLegal", "T3_DropSec"]:
-        full_rp_legal = construct_full_rp_legal_for_comparison(rp_data_row)
-        if full_rp_legal and hcad_address_summary:
-            # If address summary is a good partial match for full legal, boost score
-            # This is a rough approximation
-            t1_t2_bonus_score = fuzz.partial_ratio(full_rp_legal, hcad_address_summary)
-            if t1_t2_bonus_score > 70 : # If pretty good partial match
-                score += t1_t2_bonus_score * 0.2 # Add a small bonus (max 20 points)
+    rp_subdivision_orig = row_context.subdivision_orig
+    if rp_subdivision_orig:
+        scores += process.cdist([rp_subdivision_orig], hcad_address_summaries, scorer=fuzz.token_set_ratio, dtype=np.float64)[0] * 0.5 # Weight: 50%
 
-    # print(f"DEBUG: Summary Score for Acct {hcad_account_summary} (Tier: {tier_context}): {score:.2f} (Owner: '{hcad_owner_summary}', Addr: '{hcad_address_summary}') vs RP Owner Query: '{owner_query_name_for_tier}', RP Subdiv: '{rp_subdivision_orig}'")
-    return score
+    # --- Bonus for T1/T2 specific components if address summary is a good partial match for the full legal ---
+    if tier_context in ["T2_ExactLegal", "T3_DropSec"] and row_context.full_rp_legal:
+        t1_t2_bonus_scores = process.cdist([row_context.full_rp_legal], hcad_address_summaries, scorer=fuzz.partial_ratio, dtype=np.float64)[0]
+        scores += np.where(t1_t2_bonus_scores > 70, t1_t2_bonus_scores * 0.2, 0.0) # Small bonus (max 20 points)
+    return scores
 
 
-def _score_detailed_candidate(detailed_candidate_data, rp_data_row, tier_context):
+def _score_detailed_candidate(detailed_candidate_data, row_context, tier_context, row_relative=False):
     """
     Scores a candidate that has full details fetched, incorporating weighted blending
     of legal and owner scores, and smarter RP target name selection.
     Args:
         detailed_candidate_data (dict): Candidate dict, now including keys from parse_hcad_detail_page.
-        rp_data_row (pd.Series): The input row data.
+        row_context (RowContext): The input row's precomputed search/scoring context.
         tier_context (str): The name of the current search tier.
+        row_relative (bool): Normalize the legal score by the points the row's own legal parts can earn
+            (instead of all 130), so a candidate matching every part the row has scores 100.
     Returns:
         float: The calculated detailed score (0-100).
     """
@@ -558,58 +2212,29 @@ def _score_detailed_candidate(detailed_candidate_data, rp_data_row, tier_context
     hcad_legal_detail = str(detailed_candidate_data.get('hcad_legal_desc_detail', '')).upper().strip()
     hcad_owner_detail = str(detailed_candidate_data.get('hcad_owner_full_name', '')).upper().strip()
 
-    # RP Data for legal comparison
-    rp_tract_orig = str(rp_data_row.get('rp_legal_tract', '')).upper().strip()
-    rp_block_orig = str(rp_data_row.get('rp_legal_block', '')).upper().strip()
-    rp_lot_orig = str(rp_data_row.get('rp_legal_lot', '')).upper().strip()
-    rp_subdivision_orig = str(rp_data_row.get('rp_legal_description_text', '')).upper().strip()
-    rp_section_orig = str(rp_data_row.get('rp_legal_sec', str(rp_data_row.get('rp_legal_section', '')))).upper().strip()
-
-    # Determine the RP target owner name for comparison against HCAD owner
-    # This logic considers the HCAD search tier context
-    rp_target_owner_first_name_full = "" 
-    rp_target_owner_last = ""
-
-    if "GranteeLastName" in tier_context:
-        grantee_names = rp_data_row.get('rp_grantee_full_names_list', [])
-        if grantee_names and isinstance(grantee_names, list) and grantee_names[0]:
-            first_grantee_full_name_parts = str(grantee_names[0]).upper().strip().split()
-            if len(first_grantee_full_name_parts) > 0:
-                rp_target_owner_last = first_grantee_full_name_parts[-1]
-                rp_target_owner_first_name_full = " ".join(first_grantee_full_name_parts[:-1])
-    elif "DecedentLastName" in tier_context or "Fallback_Owner" in tier_context:
-        rp_target_owner_last = str(rp_data_row.get('probate_lead_decedent_last', '')).upper().strip()
-        rp_target_owner_first_name_full = str(rp_data_row.get('probate_lead_decedent_first', '')).upper().strip()
-    else: # For purely legal search tiers (T1, T2, T4)
-        if rp_data_row.get('cleaned_rp_party_last_name'): # Prioritize cleaned RP party name
-            rp_target_owner_last = str(rp_data_row.get('cleaned_rp_party_last_name', '')).upper().strip()
-            rp_target_owner_first_name_full = str(rp_data_row.get('cleaned_rp_party_first_name', '')).upper().strip()
-        else: # Fallback to probate decedent if no cleaned_rp_party name
-            rp_target_owner_last = str(rp_data_row.get('probate_lead_decedent_last', '')).upper().strip()
-            rp_target_owner_first_name_full = str(rp_data_row.get('probate_lead_decedent_first', '')).upper().strip()
-    
-    rp_target_full_name_for_match = f"{rp_target_owner_first_name_full} {rp_target_owner_last}".strip()
-    if not rp_target_full_name_for_match.strip() : rp_target_full_name_for_match = None
-
+    # RP target owner name for comparison against HCAD owner, chosen by the search tier: the first grantee
+    # for grantee tiers, the decedent for decedent/fallback tiers, otherwise the cleaned RP party (or decedent)
+    rp_target_full_name_for_match = row_context.detail_owner_targets[RowContext.owner_target_kind(tier_context)]
 
     # --- Legal Score Calculation ---
     if tier_context == "T4_Subdivision_Block":
-        original_rp_legal_for_t4 = construct_full_rp_legal_for_comparison(rp_data_row)
+        original_rp_legal_for_t4 = row_context.full_rp_legal
         if original_rp_legal_for_t4 and hcad_legal_detail:
             legal_score_raw = fuzz.ratio(original_rp_legal_for_t4, hcad_legal_detail)
     else:
-        if rp_tract_orig and rp_tract_orig != 'NAN' and f"TR {rp_tract_orig}" in hcad_legal_detail: legal_score_raw += 40
-        if rp_block_orig and rp_block_orig != 'NAN' and f"BLK {rp_block_orig}" in hcad_legal_detail: legal_score_raw += 30
-        if rp_lot_orig and rp_lot_orig != 'NAN':
-            if f"LT {rp_lot_orig}" in hcad_legal_detail or f"LOT {rp_lot_orig}" in hcad_legal_detail: legal_score_raw += 20
-        if rp_section_orig and rp_section_orig != 'NAN' and f"SEC {rp_section_orig}" in hcad_legal_detail: legal_score_raw += 10
-        
-        if rp_subdivision_orig and rp_subdivision_orig != 'NAN' and hcad_legal_detail:
-            if rp_subdivision_orig.strip(): 
-                subdivision_similarity = fuzz.token_set_ratio(rp_subdivision_orig, hcad_legal_detail)
-                legal_score_raw += (subdivision_similarity / 100.0) * 30 
+        # Tract 40, Block 30, Lot 20 ("LT"/"LOT"), Section 10 points for each part found in the HCAD legal
+        legal_needles = row_context.local_index_legal_needles if row_relative else row_context.detail_legal_needles
+        for points, needles in legal_needles:
+            if any(needle in hcad_legal_detail for needle in needles): legal_score_raw += points
+
+        if row_context.detail_subdivision and hcad_legal_detail:
+            subdivision_similarity = fuzz.token_set_ratio(row_context.detail_subdivision, hcad_legal_detail)
+            legal_score_raw += (subdivision_similarity / 100.0) * 30 
     
-    normalized_legal_score = min(100.0, (legal_score_raw / 130.0) * 100.0) if legal_score_raw > 0 else 0.0
+    legal_points_possible = 130.0
+    if row_relative and tier_context != "T4_Subdivision_Block":
+        legal_points_possible = sum(points for points, _ in row_context.local_index_legal_needles) + (30 if row_context.detail_subdivision else 0)
+    normalized_legal_score = min(100.0, (legal_score_raw / legal_points_possible) * 100.0) if legal_score_raw > 0 else 0.0
     normalized_legal_score = max(0.0, normalized_legal_score) # Ensure non-negative
 
     # --- Owner Score Calculation (0-100) ---
@@ -640,48 +2265,11 @@ def _score_detailed_candidate(detailed_candidate_data, rp_data_row, tier_context
     return max(0.0, min(100.0, final_blended_score))
 
 
-def construct_search_query(rp_data_row, tier):
-    # --- Standard variable extraction at the beginning ---
-    tract = str(rp_data_row.get('rp_legal_tract', '')).upper().strip()
-    block = str(rp_data_row.get('rp_legal_block', '')).upper().strip()
-    subdivision = str(rp_data_row.get('rp_legal_description_text', '')).upper().strip()
-    section = str(rp_data_row.get('rp_legal_sec', str(rp_data_row.get('rp_legal_section', '')))).upper().strip() # Handles both keys
-
-    # --- MODIFIED: Replaced the simple extraction for 'lot' with this improved logic ---
-    raw_lot = rp_data_row.get('rp_legal_lot', None) # Get it potentially as float/int or string
-    lot = "" # Default to empty string
-    if pd.notna(raw_lot) and str(raw_lot).strip() != "":
-        try:
-            # Attempt to convert to float first, then to int, to handle "X.0"
-            float_val = float(raw_lot)
-            if float_val.is_integer(): # Check if it's a whole number (e.g., 5.0)
-                lot = str(int(float_val)) # Convert to "5"
-            else:
-                lot = str(raw_lot).upper().strip() # Keep as is if it has actual decimals e.g. "5.5A" (unlikely for lot)
-        except ValueError:
-            # If it's not a number (e.g., "A", "10A", or already "5"), just use it as is
-            lot = str(raw_lot).upper().strip()
-    # --- END OF MODIFICATION ---
-
-    grantee_full_names = rp_data_row.get('rp_grantee_full_names_list', [])
-    first_grantee_last_name = None
-    if isinstance(grantee_full_names, list) and grantee_full_names:
-        first_grantee_full_name_parts = str(grantee_full_names[0]).split()
-        if first_grantee_full_name_parts:
-            first_grantee_last_name = first_grantee_full_name_parts[-1].upper().strip()
-
-    decedent_last_for_search = str(rp_data_row.get('probate_lead_decedent_last', '')).upper().strip()
-
-    # Clean 'NAN' values from main variables for query construction
-    tract = tract if tract and tract != 'NAN' else "" # Use empty string if NAN for easier logic
-    block = block if block and block != 'NAN' else ""
-    subdivision = subdivision if subdivision and subdivision != 'NAN' else ""
-    section = section if section and section != 'NAN' else ""
-    # The existing NAN check for 'lot' is kept, as the new logic runs before it
-    lot = lot if lot and lot != 'NAN' else ""
-    first_grantee_last_name = first_grantee_last_name if first_grantee_last_name and first_grantee_last_name != 'NAN' else None
-    decedent_last_for_search = decedent_last_for_search if decedent_last_for_search and decedent_last_for_search != 'NAN' else None
-    # --- End of standard variable extraction ---
+def construct_search_query(row_context, tier):
+    """(legal_query, owner_query) for one tier, from a RowContext's NAN-cleaned legal parts. RowContext.tier_queries holds these for every tier."""
+    tract, block, subdivision, section, lot = row_context.tract, row_context.block, row_context.subdivision, row_context.section, row_context.lot
+    first_grantee_last_name = row_context.first_grantee_last_name
+    decedent_last_for_search = row_context.decedent_last_for_search
 
     legal_query = None
     owner_query = None
@@ -800,27 +2388,89 @@ def construct_full_rp_legal_for_comparison(rp_data_row): # Copied from previous,
 # ... (imports and other functions) ...
 # Ensure construct_full_rp_legal_for_comparison is defined
 
-def choose_best_from_multiple(hcad_results_list, rp_data_row, tier_context,
-                              p_page_for_detail_scrape, confidence_level_of_rp_row):
-    global HCAD_DETAIL_CACHE # Access the global cache
+HCAD_LOCAL_INDEX_COUNTS = {"lookups": 0, "auto_winners": 0, "seeded_candidates_scored": 0}
+_HCAD_LOCAL_INDEX_COUNTS_LOCK = threading.Lock()
+
+
+def _count_local_index_event(event_name, amount=1):
+    with _HCAD_LOCAL_INDEX_COUNTS_LOCK:
+        HCAD_LOCAL_INDEX_COUNTS[event_name] += amount
+
+
+def rank_local_hcad_candidates(row_context):
+    """
+    Already-parsed accounts from HCAD_DETAIL_CACHE that share tokens with the row, each scored with
+    _score_detailed_candidate (as HCAD_LOCAL_INDEX_TIER_NAME, row_relative) into hcad_best_property_fit_score, best first.
+    """
+    if not HCAD_LOCAL_INDEX_ENABLED:
+        return []
+    _count_local_index_event("lookups")
+    candidates = HCAD_DETAIL_CACHE.candidates(row_context.local_index_tokens, HCAD_LOCAL_INDEX_MAX_CANDIDATES)
+    for candidate in candidates:
+        candidate['hcad_best_property_fit_score'] = _score_detailed_candidate(candidate, row_context, HCAD_LOCAL_INDEX_TIER_NAME, row_relative=True)
+    candidates.sort(key=lambda c: c['hcad_best_property_fit_score'], reverse=True)
+    return candidates
+
+
+def hcad_owner_has_name_signal(hcad_data, row_context):
+    """True if the HCAD owner contains the probate or RP party surname (the T0 name-confirmation check)."""
+    hcad_owner = str(hcad_data.get('hcad_owner_full_name', '') or '').upper().strip()
+    probate_last, rp_party_last = row_context.t0_probate_last, row_context.t0_rp_party_last
+    return bool(hcad_owner) and bool((probate_last and probate_last in hcad_owner) or (rp_party_last and rp_party_last in hcad_owner))
 
+
+def local_hcad_auto_winner(local_candidates, row_context):
+    """
+    The top local candidate if it is the only one at or above AUTO_WINNER_DETAIL_SCORE_THRESHOLD and its owner
+    carries the row's surname (row_relative scores can clear the threshold on the legal parts alone), else None.
+    """
+    if not local_candidates or local_candidates[0]['hcad_best_property_fit_score'] < AUTO_WINNER_DETAIL_SCORE_THRESHOLD:
+        return None
+    if len(local_candidates) > 1 and local_candidates[1]['hcad_best_property_fit_score'] >= AUTO_WINNER_DETAIL_SCORE_THRESHOLD:
+        return None
+    if not hcad_owner_has_name_signal(local_candidates[0], row_context):
+        print(f"INFO: Local index top candidate Acct {local_candidates[0].get('hcad_account')} has no owner name confirmation. Searching HCAD.")
+        return None
+    return local_candidates[0]
+
+def _summary_winner_fields(candidate_summary):
+    """The detail record fields a results-list row already provides; the rest stay None until backfilled."""
+    hcad_data = _new_hcad_detail_record(candidate_summary.get('hcad_detail_url'))
+    hcad_data.update({
+        'hcad_account': candidate_summary.get('hcad_account_summary'),
+        'hcad_owner_full_name': candidate_summary.get('hcad_owner_summary') or None,
+        'hcad_site_address': " ".join(filter(None, (candidate_summary.get('hcad_address_summary'), candidate_summary.get('hcad_zip_summary')))) or None,
+        'hcad_total_living_area_sf': candidate_summary.get('hcad_sqft_summary'),
+        'hcad_market_value_detail': candidate_summary.get('hcad_market_value_summary'),
+        'hcad_appraised_value_detail': candidate_summary.get('hcad_appraised_value_summary'),
+        'hcad_detail_backfill_status': "PENDING",
+    })
+    return hcad_data
+
+
+def choose_best_from_multiple(hcad_results_list, row_context, tier_context,
+                              p_page_for_detail_scrape, confidence_level_of_rp_row, seed_candidates=None):
+    """
+    Picks the winning account from a tier's results list, or None. seed_candidates (from
+    rank_local_hcad_candidates) are detail-scored whenever they appear in the list, even below the
+    DETAIL_FETCH_LIMIT_AFTER_SUMMARY cut; their details are already cached.
+    """
     if not hcad_results_list: return None
-    print(f"INFO: Choosing best from {len(hcad_results_list)} results for tier '{tier_context}'. RP Sub: '{rp_data_row.get('rp_legal_description_text', '')}', Confidence: {confidence_level_of_rp_row}")
+    print(f"INFO: Choosing best from {len(hcad_results_list)} results for tier '{tier_context}'. RP Sub: '{row_context.subdivision_orig}', Confidence: {confidence_level_of_rp_row}")
 
     # --- 1. Summary-Only Scoring Round ---
+    summary_scores = _score_summary_candidates(hcad_results_list, row_context, tier_context)
+    # Stable, so equal scores keep their results-list order.
     scored_summaries = []
-    for candidate_summary_item in hcad_results_list:
-        # Ensure it's a mutable copy if direct modifications are made later, though not in _score_summary
-        current_candidate_summary = candidate_summary_item.copy() 
-        summary_score = _score_summary_candidate(current_candidate_summary, rp_data_row, tier_context)
-        current_candidate_summary['hcad_list_page_summary_rank_score'] = summary_score
+    for candidate_position in np.argsort(-summary_scores, kind="stable"):
+        current_candidate_summary = hcad_results_list[candidate_position].copy()
+        current_candidate_summary['hcad_list_page_summary_rank_score'] = float(summary_scores[candidate_position])
         scored_summaries.append(current_candidate_summary)
 
-    scored_summaries.sort(key=lambda x: x.get('hcad_list_page_summary_rank_score', 0), reverse=True)
-
-    print(f"DEBUG: Top 5 Summary Scored Candidates for tier '{tier_context}':")
-    for i, cand in enumerate(scored_summaries[:5]):
-        print(f"  #{i+1} Acct: {cand.get('hcad_account_summary')}, Summary Score: {cand.get('hcad_list_page_summary_rank_score', 0):.2f}, Owner: {cand.get('hcad_owner_summary')}, Address: {cand.get('hcad_address_summary')}")
+    if HCAD_LOG_LEVEL == "DEBUG":
+        print(f"DEBUG: Top 5 Summary Scored Candidates for tier '{tier_context}':")
+        for i, cand in enumerate(scored_summaries[:5]):
+            print(f"  #{i+1} Acct: {cand.get('hcad_account_summary')}, Summary Score: {cand.get('hcad_list_page_summary_rank_score', 0):.2f}, Owner: {cand.get('hcad_owner_summary')}, Address: {cand.get('hcad_address_summary')}")
 
     # --- 2. Check for Clear Winner from Summary Scores ---
     if scored_summaries:
@@ -833,36 +2483,23 @@ def choose_best_from_multiple(hcad_results_list, rp_data_row, tier_context,
 
         if top_summary_score >= SUMMARY_SCORE_ABSOLUTE_THRESHOLD and \
            (len(scored_summaries) == 1 or (top_summary_score - second_summary_score) >= SUMMARY_SCORE_DIFFERENCE_THRESHOLD):
-            print(f"INFO: Clear winner identified from summary scoring: Acct {top_summary_candidate.get('hcad_account_summary')} (Summary Score: {top_summary_score:.2f}). Fetching its details for confirmation.")
-            # Fetch details for this single summary winner to return a complete record
-            # (Cache-aware fetching for this one winner)
-            detail_data_for_summary_winner = None
             account_s = top_summary_candidate.get('hcad_account_summary')
             url_s = top_summary_candidate.get('hcad_detail_url')
-            
-            parsed_acct_s_url = None
-            if url_s:
-                match_s = re.search(r"acct=(\d+)", url_s, re.IGNORECASE)
-                if match_s: parsed_acct_s_url = match_s.group(1)
-            
-            key_s_check = parsed_acct_s_url if parsed_acct_s_url else account_s
-
-            if key_s_check and key_s_check in HCAD_DETAIL_CACHE:
-                detail_data_for_summary_winner = HCAD_DETAIL_CACHE[key_s_check]
-            elif p_page_for_detail_scrape and url_s:
-                detail_data_for_summary_winner = parse_hcad_detail_page(p_page_for_detail_scrape, url_s)
-                if detail_data_for_summary_winner and not detail_data_for_summary_winner.get('parsing_error') and detail_data_for_summary_winner.get('hcad_account'):
-                    def_key_s = detail_data_for_summary_winner['hcad_account']
-                    HCAD_DETAIL_CACHE[def_key_s] = detail_data_for_summary_winner
-                    # Also cache by other potential keys if different
-                    if parsed_acct_s_url and parsed_acct_s_url != def_key_s and parsed_acct_s_url not in HCAD_DETAIL_CACHE: HCAD_DETAIL_CACHE[parsed_acct_s_url] = detail_data_for_summary_winner
-                    if account_s and account_s != def_key_s and account_s not in HCAD_DETAIL_CACHE: HCAD_DETAIL_CACHE[account_s] = detail_data_for_summary_winner
-
+            if HCAD_DEFER_SUMMARY_WINNER_DETAILS and account_s and url_s:
+                print(f"INFO: Clear winner identified from summary scoring: Acct {account_s} (Summary Score: {top_summary_score:.2f}). Accepting it now; details are backfilled.")
+                top_summary_candidate.update(_summary_winner_fields(top_summary_candidate))
+                top_summary_candidate['hcad_best_property_fit_score'] = top_summary_score
+                HCAD_DETAIL_BACKFILL.submit(url_s, account_s)
+                return top_summary_candidate
+            print(f"INFO: Clear winner identified from summary scoring: Acct {account_s} (Summary Score: {top_summary_score:.2f}). Fetching its details for confirmation.")
+            # Fetch details for this single summary winner to return a complete record
+            # (Cache-aware fetching for this one winner)
+            detail_data_for_summary_winner = get_hcad_detail_cached(p_page_for_detail_scrape, url_s, account_s)
 
             if detail_data_for_summary_winner and not detail_data_for_summary_winner.get('parsing_error'):
                 top_summary_candidate.update(detail_data_for_summary_winner)
                 # Re-score with detailed info to be consistent for the final 'hcad_best_property_fit_score'
-                detailed_score_for_summary_winner = _score_detailed_candidate(top_summary_candidate, rp_data_row, tier_context)
+                detailed_score_for_summary_winner = _score_detailed_candidate(top_summary_candidate, row_context, tier_context)
                 top_summary_candidate['hcad_best_property_fit_score'] = detailed_score_for_summary_winner
                 print(f"INFO: Summary winner Acct {top_summary_candidate.get('hcad_account')} re-scored with details: {detailed_score_for_summary_winner:.2f}")
                 return top_summary_candidate
@@ -878,51 +2515,63 @@ def choose_best_from_multiple(hcad_results_list, rp_data_row, tier_context,
     
     num_to_fetch_detail = min(len(scored_summaries), DETAIL_FETCH_LIMIT_AFTER_SUMMARY)
     print(f"DEBUG: No clear summary winner. Will fetch details for up to {num_to_fetch_detail} top summary candidates.")
-
-    for i in range(num_to_fetch_detail):
-        candidate_to_detail = scored_summaries[i].copy() # Work on a copy
-        account_d = candidate_to_detail.get('hcad_account_summary')
-        url_d = candidate_to_detail.get('hcad_detail_url')
-        
-        parsed_acct_d_url = None
-        if url_d:
-            match_d = re.search(r"acct=(\d+)", url_d, re.IGNORECASE)
-            if match_d: parsed_acct_d_url = match_d.group(1)
-        key_d_check = parsed_acct_d_url if parsed_acct_d_url else account_d
-        
-        fetched_detail_data = None
-        if key_d_check and key_d_check in HCAD_DETAIL_CACHE:
-            print(f"DEBUG: [CACHE HIT] For detail fetch candidate Acct: {key_d_check}")
-            fetched_detail_data = HCAD_DETAIL_CACHE[key_d_check]
-        elif p_page_for_detail_scrape and url_d:
-            print(f"DEBUG: [CACHE MISS] Fetching details for candidate {account_d}, URL: {url_d}")
-            fetched_detail_data = parse_hcad_detail_page(p_page_for_detail_scrape, url_d)
-            if fetched_detail_data and not fetched_detail_data.get('parsing_error') and fetched_detail_data.get('hcad_account'):
-                def_key_d = fetched_detail_data['hcad_account']
-                HCAD_DETAIL_CACHE[def_key_d] = fetched_detail_data
-                print(f"INFO: Cached details for account {def_key_d}")
-                if parsed_acct_d_url and parsed_acct_d_url != def_key_d and parsed_acct_d_url not in HCAD_DETAIL_CACHE: HCAD_DETAIL_CACHE[parsed_acct_d_url] = fetched_detail_data
-                if account_d and account_d != def_key_d and account_d not in HCAD_DETAIL_CACHE: HCAD_DETAIL_CACHE[account_d] = fetched_detail_data
-        
-        if fetched_detail_data and not fetched_detail_data.get('parsing_error'):
-            candidate_to_detail.update(fetched_detail_data)
-            detailed_score = _score_detailed_candidate(candidate_to_detail, rp_data_row, tier_context)
-            candidate_to_detail['hcad_best_property_fit_score'] = detailed_score
-            candidates_for_detailed_scoring.append(candidate_to_detail)
-            print(f"DEBUG: Detailed Candidate Acct {candidate_to_detail.get('hcad_account')} scored: {detailed_score:.2f}")
-
-            # Early exit if a very high confidence match is found during this limited detail fetch
-            if detailed_score >= AUTO_WINNER_DETAIL_SCORE_THRESHOLD:
-                print(f"INFO: Auto-winner found after detail fetch: Acct {candidate_to_detail.get('hcad_account')} (Score: {detailed_score:.2f}). Selecting.")
-                return candidate_to_detail
-        else:
-            # If detail fetch failed, use its summary score as its final hcad_best_property_fit_score
-            candidate_to_detail['hcad_best_property_fit_score'] = candidate_to_detail.get('hcad_list_page_summary_rank_score', 0)
-            candidates_for_detailed_scoring.append(candidate_to_detail) # Still add it for consideration with summary score
-            error_msg_d = fetched_detail_data.get('parsing_error') if fetched_detail_data else 'Unknown or no URL'
-            print(f"WARN: Could not fetch/parse details for {account_d}. Using its summary score. Error: {error_msg_d}")
+    detail_targets = scored_summaries[:num_to_fetch_detail]
+    if seed_candidates:
+        seeded_accounts = {HcadDetailStore._normalize_key(c.get('hcad_account')) for c in seed_candidates}
+        seeded_targets = [c for c in scored_summaries[num_to_fetch_detail:]
+                          if HcadDetailStore._normalize_key(c.get('hcad_account_summary')) in seeded_accounts]
+        if seeded_targets:
+            print(f"DEBUG: Also scoring {len(seeded_targets)} candidate(s) known to the local index: {[c.get('hcad_account_summary') for c in seeded_targets]}")
+            _count_local_index_event("seeded_candidates_scored", len(seeded_targets))
+            detail_targets = detail_targets + seeded_targets
+        num_to_fetch_detail = len(detail_targets)
+
+    # Over HTTP all the fetches are issued at once; candidates are still scored in summary-rank order,
+    # and an auto-winner cancels whatever has not started yet.
+    fetch_concurrently = HCAD_DETAIL_FETCH_MODE == "http" and num_to_fetch_detail > 1
+    pending_fetches = []
+    cancel_pending_fetches = threading.Event()
+    if fetch_concurrently:
+        pending_fetches = [submit_hcad_detail_fetch(c.get('hcad_detail_url'), c.get('hcad_account_summary'), cancel_pending_fetches)
+                           for c in detail_targets]
+    try:
+        for i in range(num_to_fetch_detail):
+            candidate_to_detail = detail_targets[i].copy() # Work on a copy
+            account_d = candidate_to_detail.get('hcad_account_summary')
+            url_d = candidate_to_detail.get('hcad_detail_url')
+            if fetch_concurrently:
+                fetched_detail_data = pending_fetches[i].result()
+                if p_page_for_detail_scrape and url_d and (not fetched_detail_data or fetched_detail_data.get('parsing_error') or not fetched_detail_data.get('hcad_account')):
+                    print(f"WARN: HTTP detail fetch did not yield an account for {url_d}. Falling back to the browser.")
+                    fetched_detail_data = get_hcad_detail_cached(p_page_for_detail_scrape, url_d, account_d, fetch_mode="browser")
+            else:
+                fetched_detail_data = get_hcad_detail_cached(p_page_for_detail_scrape, url_d, account_d)
+
+            if fetched_detail_data and not fetched_detail_data.get('parsing_error'):
+                candidate_to_detail.update(fetched_detail_data)
+                detailed_score = _score_detailed_candidate(candidate_to_detail, row_context, tier_context)
+                candidate_to_detail['hcad_best_property_fit_score'] = detailed_score
+                candidates_for_detailed_scoring.append(candidate_to_detail)
+                print(f"DEBUG: Detailed Candidate Acct {candidate_to_detail.get('hcad_account')} scored: {detailed_score:.2f}")
+
+                # Early exit if a very high confidence match is found during this limited detail fetch
+                if detailed_score >= AUTO_WINNER_DETAIL_SCORE_THRESHOLD:
+                    print(f"INFO: Auto-winner found after detail fetch: Acct {candidate_to_detail.get('hcad_account')} (Score: {detailed_score:.2f}). Selecting.")
+                    return candidate_to_detail
+            else:
+                # If detail fetch failed, use its summary score as its final hcad_best_property_fit_score
+                candidate_to_detail['hcad_best_property_fit_score'] = candidate_to_detail.get('hcad_list_page_summary_rank_score', 0)
+                candidates_for_detailed_scoring.append(candidate_to_detail) # Still add it for consideration with summary score
+                error_msg_d = fetched_detail_data.get('parsing_error') if fetched_detail_data else 'Unknown or no URL'
+                print(f"WARN: Could not fetch/parse details for {account_d}. Using its summary score. Error: {error_msg_d}")
         
-        if i < (num_to_fetch_detail - 1) : time.sleep(0.75) # Pause between detail fetches
+            if not fetch_concurrently and i < (num_to_fetch_detail - 1) : time.sleep(HCAD_DETAIL_FETCH_DELAY_S) # Pause between detail fetches
+    finally:
+        cancel_pending_fetches.set()
+        cancelled_fetches = sum(1 for future in pending_fetches if not future.done())
+        for future in pending_fetches: future.cancel()
+        if cancelled_fetches:
+            print(f"DEBUG: Cancelled {cancelled_fetches} outstanding detail fetch(es).")
 
     # --- 4. Final Decision Logic (based on detailed scores or fallbacks) ---
     if not candidates_for_detailed_scoring:
@@ -971,8 +2620,101 @@ def choose_best_from_multiple(hcad_results_list, rp_data_row, tier_context,
     
 # Fallback if scored_summaries was empty to begin with (already handled by initial check)
 
-def search_hcad_and_get_results(p_page, search_tier_name, legal_desc_query=None, owner_name_query=None):
+def _results_rows_to_summaries(rows):
+    """Summary dicts for the result-table rows of one results page (rows without a detail link are skipped)."""
+    summaries = []
+    for i, row_element in enumerate(rows):
+        cols = row_element.query_selector_all('td')
+        if len(cols) < 7:
+            print(f"WARN: Row {i} in iframe results table did not have enough columns ({len(cols)}). Skipping.")
+            continue
+        account_link_element = cols[0].query_selector('a')
+        account_number = account_link_element.inner_text().strip() if account_link_element else cols[0].inner_text().strip()
+        detail_url_relative = account_link_element.get_attribute('href') if account_link_element else None
+        detail_url_absolute = urljoin("https://public.hcad.org/", detail_url_relative) if detail_url_relative else None
+        if detail_url_absolute:
+            summaries.append({
+                'hcad_account_summary': account_number, 'hcad_owner_summary': ' '.join(cols[1].inner_text().split()).strip(),
+                'hcad_address_summary': cols[2].inner_text().strip(), 'hcad_zip_summary': cols[3].inner_text().strip(),
+                'hcad_sqft_summary': _clean_numeric_value(cols[4].inner_text().strip()),
+                'hcad_market_value_summary': _clean_numeric_value(cols[5].inner_text().strip()),
+                'hcad_appraised_value_summary': _clean_numeric_value(cols[6].inner_text().strip()), 'hcad_detail_url': detail_url_absolute
+            })
+    return summaries
+
+
+class HcadSummaryHarvest:
+    """Running summary scores for one row and tier while result pages are harvested."""
+
+    def __init__(self, row_context, tier_context):
+        self.row_context = row_context
+        self.tier_context = tier_context
+        self.scores = []
+        self.stopped_early = False
+
+    def add_page(self, page_summaries):
+        """Scores a page of summaries; True once the best score so far is a clear summary winner."""
+        self.scores.extend(_score_summary_candidates(page_summaries, self.row_context, self.tier_context).tolist())
+        top_scores = sorted(self.scores, reverse=True)[:2]
+        if not top_scores or top_scores[0] < SUMMARY_SCORE_ABSOLUTE_THRESHOLD: return False
+        return len(top_scores) == 1 or (top_scores[0] - top_scores[1]) >= SUMMARY_SCORE_DIFFERENCE_THRESHOLD
+
+    @property
+    def cacheable(self):
+        # An early-stopped harvest depends on this row's scoring, so it must not answer other rows' queries.
+        return not self.stopped_early
+
+
+def _harvest_result_pages(iframe_context, search_tier_name, num_records, first_page_results, harvest):
+    """
+    Walks the remaining result pages of the current search in the iframe, feeding each page to harvest.
+    Returns all harvested summaries once every record is read or a clear winner appears, or None if the
+    walk could not get that far (the caller then reports PAGINATION_TOO_LARGE as before).
+    """
+    harvested_results = list(first_page_results)
+    if harvest.add_page(first_page_results):
+        harvest.stopped_early = True
+        return harvested_results
+    pages_read = 1
+    previous_page_first_account = first_page_results[0]['hcad_account_summary'] if first_page_results else None
+    while len(harvested_results) < num_records and pages_read < HCAD_PAGINATION_HARVEST_MAX_PAGES:
+        try:
+            next_control = iframe_context.query_selector(RESULTS_NEXT_PAGE_SELECTOR)
+            if not next_control or not next_control.is_visible():
+                print(f"WARN: [HCAD Harvest - {search_tier_name}] No next-page control after page {pages_read}.")
+                return None
+            HCAD_REQUEST_THROTTLE.wait()
+            with iframe_context.expect_navigation(wait_until="networkidle", timeout=30000):
+                next_control.click(timeout=10000)
+            page_results = _results_rows_to_summaries(iframe_context.query_selector_all(RESULTS_TABLE_ROWS_SELECTOR))
+        except Exception as e_page:
+            print(f"WARN: [HCAD Harvest - {search_tier_name}] Could not read result page {pages_read + 1}: {e_page}")
+            return None
+        if not page_results or page_results[0]['hcad_account_summary'] == previous_page_first_account:
+            print(f"WARN: [HCAD Harvest - {search_tier_name}] Result page {pages_read + 1} was empty or repeated the previous page.")
+            return None
+        pages_read += 1
+        previous_page_first_account = page_results[0]['hcad_account_summary']
+        harvested_results.extend(page_results)
+        if harvest.add_page(page_results):
+            harvest.stopped_early = True
+            print(f"INFO: [HCAD Harvest - {search_tier_name}] Clear summary winner after {pages_read} page(s) ({len(harvested_results)}/{num_records} records).")
+            return harvested_results
+    if len(harvested_results) < num_records:
+        print(f"WARN: [HCAD Harvest - {search_tier_name}] Stopped at {pages_read} page(s) ({len(harvested_results)}/{num_records} records) without a clear winner.")
+        return None
+    print(f"INFO: [HCAD Harvest - {search_tier_name}] Harvested all {len(harvested_results)} records over {pages_read} page(s).")
+    return harvested_results
+
+
+def search_hcad_and_get_results(p_page, search_tier_name, legal_desc_query=None, owner_name_query=None, harvest=None, search_info=None):
+    """
+    Runs one search in the HCAD iframe form and returns (status, data). With a HcadSummaryHarvest, results
+    that span several pages are harvested (see HCAD_PAGINATION_HARVEST_MAX_RECORDS) instead of reported
+    as PAGINATION_TOO_LARGE. If search_info is a dict, the record count HCAD reported is stored under 'num_records'.
+    """
     print(f"INFO: [HCAD Search - {search_tier_name}] Attempting search. Legal: '{legal_desc_query}', Owner: '{owner_name_query}'")
+    HCAD_REQUEST_THROTTLE.wait()
     
     main_page = p_page
     iframe_context = None
@@ -982,12 +2724,12 @@ def search_hcad_and_get_results(p_page, search_tier_name, legal_desc_query=None,
     current_main_url = main_page.url
     if HCAD_ADVANCED_SEARCH_URL not in current_main_url:
         print(f"INFO: Navigating to main search page: {HCAD_ADVANCED_SEARCH_URL}")
-        main_page.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+        _load_hcad_search_page(main_page)
         main_page.wait_for_load_state("networkidle", timeout=20000)
     else:
         print(f"DEBUG: Already on main search page URL or reset. Attempting to get/re-get iframe.")
 
-    iframe_selector = 'iframe[src*="public.hcad.org/records/Real/Advanced.asp"]'
+    iframe_selector = HCAD_SEARCH_IFRAME_SELECTOR
     try:
         iframe_element = main_page.wait_for_selector(iframe_selector, state='visible', timeout=20000)
         if not iframe_element: raise Exception(f"iframe_element for '{iframe_selector}' is None.")
@@ -1005,7 +2747,7 @@ def search_hcad_and_get_results(p_page, search_tier_name, legal_desc_query=None,
         print(f"ERROR: Could not get or initialize iframe context: {e_iframe}")
         try:
             print(f"ERROR: Forcing full reload of main search page due to iframe init error.")
-            main_page.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+            _load_hcad_search_page(main_page)
             main_page.wait_for_load_state("networkidle", timeout=20000)
             iframe_element = main_page.wait_for_selector(iframe_selector, state='visible', timeout=20000)
             iframe_context = iframe_element.content_frame()
@@ -1024,16 +2766,20 @@ def search_hcad_and_get_results(p_page, search_tier_name, legal_desc_query=None,
 
         legal_desc_input_locator.wait_for(state='visible', timeout=15000)
 
-        if legal_desc_query is not None:
-            legal_desc_input_locator.fill("") 
-            legal_desc_input_locator.fill(legal_desc_query, timeout=5000)
-        if owner_name_query is not None:
-            try:
-                owner_name_input_locator.wait_for(state='visible', timeout=3000) 
-                owner_name_input_locator.fill("") 
-                owner_name_input_locator.fill(owner_name_query, timeout=5000)
-            except Exception:
-                print(f"WARN: Owner name input not processed (perhaps not visible/needed) for query '{owner_name_query}'")
+        # Both inputs are always cleared and refilled: with HCAD_RESET_ONLY_ON_ERROR the form can still hold the
+        # previous tier's values, and a None query must be sent as an empty field.
+        legal_desc_input_locator.fill("")
+        legal_desc_input_locator.fill(legal_desc_query or "", timeout=5000)
+        try:
+            owner_name_input_locator.wait_for(state='visible', timeout=3000)
+            owner_name_input_locator.fill("")
+            owner_name_input_locator.fill(owner_name_query or "", timeout=5000)
+        except Exception:
+            print(f"WARN: Owner name input not processed (perhaps not visible/needed) for query '{owner_name_query}'")
+            leftover_owner = ""
+            with contextlib.suppress(Exception): leftover_owner = owner_name_input_locator.input_value(timeout=1000)
+            if leftover_owner.strip() != (owner_name_query or "").strip():
+                raise Exception(f"owner input still holds '{leftover_owner}' instead of '{owner_name_query or ''}'")
         
         search_button_locator.wait_for(state='visible', timeout=5000)
     except Exception as e_form_fill:
@@ -1121,6 +2867,7 @@ def search_hcad_and_get_results(p_page, search_tier_name, legal_desc_query=None,
         print(f"WARN: Record count paragraph '{RECORD_COUNT_TEXT_SELECTOR}' not found. Assuming ambiguous (num_records=0).")
         num_records = 0
     # --- END OF MODIFIED Record Count Parsing Logic ---
+    if search_info is not None: search_info['num_records'] = num_records
 
     if num_records == 0 and (record_count_para_element or "0 records" in (iframe_context.content() or "").lower()): # If we explicitly parsed zero OR found "0 records" text
         print(f"INFO: HCAD Search - {search_tier_name} - Confirmed 0 records found.")
@@ -1138,55 +2885,17 @@ def search_hcad_and_get_results(p_page, search_tier_name, legal_desc_query=None,
 
         if num_records > HCAD_RESULTS_PER_PAGE and len(rows) >= HCAD_RESULTS_PER_PAGE:
             print(f"WARN: [HCAD Search - {search_tier_name}] HCAD reported {num_records} records, parsed {len(rows)} (a full page). PAGINATION_TOO_LARGE.")
-            for i_sum, row_sum_element in enumerate(rows): 
-                cols_sum = row_sum_element.query_selector_all('td')
-                if len(cols_sum) >= 7:
-                    account_link_element_sum = cols_sum[0].query_selector('a')
-                    account_number_sum = account_link_element_sum.inner_text().strip() if account_link_element_sum else cols_sum[0].inner_text().strip()
-                    detail_url_relative_sum = account_link_element_sum.get_attribute('href') if account_link_element_sum else None
-                    detail_url_absolute_sum = urljoin("https://public.hcad.org/", detail_url_relative_sum) if detail_url_relative_sum else None
-                    owner_name_raw_sum = cols_sum[1].inner_text()
-                    owner_name_sum = ' '.join(owner_name_raw_sum.split()).strip()
-                    property_address_sum = cols_sum[2].inner_text().strip()
-                    zip_code_sum = cols_sum[3].inner_text().strip()
-                    sq_ft_sum = _clean_numeric_value(cols_sum[4].inner_text().strip())
-                    market_value_sum = _clean_numeric_value(cols_sum[5].inner_text().strip())
-                    appraised_value_sum = _clean_numeric_value(cols_sum[6].inner_text().strip())
-                    if detail_url_absolute_sum:
-                        results_data.append({
-                            'hcad_account_summary': account_number_sum, 'hcad_owner_summary': owner_name_sum,
-                            'hcad_address_summary': property_address_sum, 'hcad_zip_summary': zip_code_sum,
-                            'hcad_sqft_summary': sq_ft_sum, 'hcad_market_value_summary': market_value_sum,
-                            'hcad_appraised_value_summary': appraised_value_sum, 'hcad_detail_url': detail_url_absolute_sum
-                        })
+            results_data = _results_rows_to_summaries(rows)
+            if harvest is not None and num_records <= HCAD_PAGINATION_HARVEST_MAX_RECORDS:
+                harvested_results = _harvest_result_pages(iframe_context, search_tier_name, num_records, results_data, harvest)
+                if harvested_results is not None:
+                    _try_click_change_criteria_IN_IFRAME(iframe_context, main_page, f"{search_tier_name}_HARVEST_RESET")
+                    return "MULTIPLE_HITS", harvested_results
             _try_click_change_criteria_IN_IFRAME(iframe_context, main_page, f"{search_tier_name}_PAGINATION_RESET")
             return "PAGINATION_TOO_LARGE", results_data
 
         if rows: 
-            for i, row_element in enumerate(rows):
-                cols = row_element.query_selector_all('td')
-                if len(cols) >= 7: 
-                    account_link_element = cols[0].query_selector('a')
-                    account_number = account_link_element.inner_text().strip() if account_link_element else cols[0].inner_text().strip()
-                    detail_url_relative = account_link_element.get_attribute('href') if account_link_element else None
-                    detail_url_absolute = urljoin("https://public.hcad.org/", detail_url_relative) if detail_url_relative else None
-                    owner_name_raw = cols[1].inner_text()
-                    owner_name = ' '.join(owner_name_raw.split()).strip() 
-                    property_address = cols[2].inner_text().strip()
-                    zip_code = cols[3].inner_text().strip()
-                    sq_ft = _clean_numeric_value(cols[4].inner_text().strip())
-                    market_value = _clean_numeric_value(cols[5].inner_text().strip())
-                    appraised_value = _clean_numeric_value(cols[6].inner_text().strip())
-
-                    if detail_url_absolute: 
-                        results_data.append({
-                            'hcad_account_summary': account_number, 'hcad_owner_summary': owner_name,
-                            'hcad_address_summary': property_address, 'hcad_zip_summary': zip_code,
-                            'hcad_sqft_summary': sq_ft, 'hcad_market_value_summary': market_value,
-                            'hcad_appraised_value_summary': appraised_value, 'hcad_detail_url': detail_url_absolute
-                        })
-                else:
-                    print(f"WARN: Row {i} in iframe results table did not have enough columns ({len(cols)}). Skipping.")
+            results_data = _results_rows_to_summaries(rows)
     
     if results_data: # This condition implies rows were found and parsed successfully
         # Crucially, num_records should be correctly parsed now (e.g. 1 for your test case)
@@ -1230,11 +2939,11 @@ def _try_click_change_criteria_IN_IFRAME(iframe_ctx, main_p, context_message):
             return True
         else:
             print(f"WARN: [{context_message}] 'Change Criteria' button not visible in iframe. Reloading main page to reset.")
-            main_p.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+            _load_hcad_search_page(main_p)
             return True # Main page reloaded, iframe should reset
     except Exception as ex_iframe_reset:
         print(f"ERROR: [{context_message}] Exception clicking 'Change Criteria' in iframe: {ex_iframe_reset}. Reloading main page.")
-        main_p.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+        _load_hcad_search_page(main_p)
         return True # Main page reloaded
 
 # _try_click_change_criteria (for main page) should be kept if needed for other scenarios,
@@ -1244,13 +2953,48 @@ def _try_click_change_criteria_IN_IFRAME(iframe_ctx, main_p, context_message):
 # _try_click_change_criteria function remains the same as the last version, it should handle most reset cases.
 # The rest of the script (parse_hcad_detail_page, etc.) also remains the same.
 
+HCAD_SEARCH_PAGE_LOADS = {"full_page_loads": 0, "form_reuses": 0}
+_HCAD_SEARCH_PAGE_LOADS_LOCK = threading.Lock()
+
+
+def _count_search_page_event(event_name):
+    with _HCAD_SEARCH_PAGE_LOADS_LOCK:
+        HCAD_SEARCH_PAGE_LOADS[event_name] += 1
+
+
+def _load_hcad_search_page(p_page):
+    """Full navigation to the HCAD advanced search page (counted for the run summary)."""
+    _count_search_page_event("full_page_loads")
+    p_page.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+
+
+def _hcad_search_form_ready(p_page):
+    """True if the page is already showing the Advanced search iframe with its form inputs visible."""
+    try:
+        if HCAD_ADVANCED_SEARCH_URL not in (p_page.url or ""): return False
+        iframe_element = p_page.query_selector(HCAD_SEARCH_IFRAME_SELECTOR)
+        iframe_context = iframe_element.content_frame() if iframe_element else None
+        return bool(iframe_context) and iframe_context.locator(LEGAL_DESC_INPUT_SELECTOR).is_visible()
+    except Exception:
+        return False
+
+
+def _prepare_hcad_search_page(p_page, context_message):
+    """Gets the page onto the search form before a search, reloading it only when needed (see HCAD_RESET_ONLY_ON_ERROR)."""
+    if HCAD_RESET_ONLY_ON_ERROR and _hcad_search_form_ready(p_page):
+        _count_search_page_event("form_reuses")
+        return True
+    return _try_click_change_criteria(p_page, context_message, True, True)
+
+
 def _try_click_change_criteria(p_page, context_message, fallback_to_main_search=False, force_navigation=False):
     """Helper function to attempt clicking 'Change Criteria' or navigate to main search."""
     print(f"INFO: [{context_message}] Attempting to reset/navigate.")
     try:
         if force_navigation: # Always force if requested
             print(f"INFO: [{context_message}] Forcing navigation to main search page: {HCAD_ADVANCED_SEARCH_URL}")
-            p_page.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+            HCAD_REQUEST_THROTTLE.wait()
+            _load_hcad_search_page(p_page)
             print(f"INFO: [{context_message}] Successfully navigated (forced).")
             return True
 
@@ -1279,7 +3023,7 @@ def _try_click_change_criteria(p_page, context_message, fallback_to_main_search=
         # If button not found/visible OR if explicitly told to fallback_to_main_search
         elif fallback_to_main_search or HCAD_ADVANCED_SEARCH_URL not in p_page.url:
             print(f"WARN: [{context_message}] 'Change Criteria' not found/visible or fallback requested. Navigating to main search page: {HCAD_ADVANCED_SEARCH_URL}")
-            p_page.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+            _load_hcad_search_page(p_page)
             print(f"INFO: [{context_message}] Successfully navigated to main search (fallback/direct).")
             return True
         else:
@@ -1290,7 +3034,7 @@ def _try_click_change_criteria(p_page, context_message, fallback_to_main_search=
         print(f"ERROR: [{context_message}] Exception during reset/navigation: {ex}")
         try:
             print(f"INFO: [{context_message}] Final fallback: Navigating to main search page after reset error.")
-            p_page.goto(HCAD_ADVANCED_SEARCH_URL, timeout=60000, wait_until="networkidle")
+            _load_hcad_search_page(p_page)
             return True
         except Exception as ex_nav:
             print(f"ERROR: [{context_message}] Final attempt to navigate to main search page also failed: {ex_nav}")
@@ -1307,232 +3051,463 @@ def _try_click_change_criteria(p_page, context_message, fallback_to_main_search=
 #      choose_best_from_multiple (with conditional detail fetching & scoring)) ...
 
 
-def main_hcad_processing_loop(df_processed_input, playwright_page):
-    all_enriched_data = []
-    search_tiers_config = [
-        {"name": "T0_ExactLotBlockSubdivision", "type": "legal_primary_exact"},
-        {"name": "T1_GranteeLastName_Subdivision", "type": "owner_legal_combo"}, # Renamed from T3
-        {"name": "T1_GrantorLastName_Subdivision", "type": "owner_legal_combo"},# Renamed from T3
-        {"name": "T2_ExactLegal", "type": "legal_primary"}, # Renamed from T1
-        {"name": "T3_DropSec", "type": "legal_primary"}, # Renamed from T2
-        {"name": "Fallback_Owner_SubdivisionContains", "type": "owner_legal_combo"},
-        {"name": "T4_Subdivision_Block", "type": "legal_primary"},
-    ]
-
-    fuzzy_match_cols_to_init = [
-        'hcad_detail_url_visited', 'hcad_account', 'hcad_owner_full_name',
-        'hcad_mailing_address', 'hcad_legal_desc_detail', 'hcad_site_address',
-        'hcad_pct_ownership', 'hcad_market_value_detail', 'hcad_appraised_value_detail',
-        'hcad_land_area_sf', 'hcad_total_living_area_sf', 'parsing_error',
-        'hcad_search_status', 'hcad_final_tier_hit', 'is_owner_grantor',
-        'is_owner_grantee', 'hcad_owner_match_type', 'needs_review_flag', 'review_reason',
-        'hcad_first_page_summary_data', 'score_hcad_vs_probate', 'score_hcad_vs_rp_party',
-        'score_hcad_vs_best_rp_grantee', 'score_probate_vs_rp_party',
-        # Land Data Columns
-        'hcad_lot_sqft_total', 'hcad_land_market_value_total', 'hcad_land_line_count', 'hcad_land_data_json',
-        # Building Area Columns
-        'hcad_total_base_sqft', 'hcad_total_structure_sqft', 'hcad_garage_sqft',
-        'hcad_building_area_count', 'hcad_building_data_json',
-        # Main Building Data Columns
-        'hcad_main_building_data_json',
-        # Building Characteristics
-        'hcad_foundation_type', 'hcad_exterior_wall', 'hcad_heating_ac',
-        'hcad_grade_adjustment', 'hcad_physical_condition',
-        'hcad_full_bathrooms', 'hcad_bedrooms',
-        # Main Page Values
-        'hcad_land_market_value', 'hcad_improvement_market_value',
-        # 5-Year History
-        'hcad_appraised_history_json'
-        # NEW: Add common building characteristic columns
-        'hcad_foundation_type', 'hcad_exterior_wall', 'hcad_roof_type', 'hcad_heating_ac',
-        'hcad_grade_adjustment', 'hcad_physical_condition', 'hcad_full_bathrooms',
-        'hcad_half_bathrooms', 'hcad_bedrooms', 'hcad_stories', 'hcad_carport'
-    ]
-
-    for index, rp_row in df_processed_input.iterrows():
-        case_id_for_log = rp_row.get('probate_lead_case_number', f"RowIndex_{index}")
-        rp_file_for_log = rp_row.get('rp_file_number', 'N/A')
-        print(f"\n--- Processing Input Row {index}: Case# {case_id_for_log} (RP File: {rp_file_for_log}) ---")
-
-        output_row = rp_row.to_dict()
-        for col in fuzzy_match_cols_to_init:
-            if col not in output_row: output_row[col] = None
-        # Defaults for binary flags and scores are set within the logic block later
-
-        output_row['hcad_search_status'] = "PENDING_HCAD_SEARCH" 
-
-        can_form_any_query_overall = False
-        for tier_info_check in search_tiers_config:
-            temp_legal_q_check, temp_owner_q_check = construct_search_query(rp_row, tier_info_check["name"])
-            if temp_legal_q_check == "COMMON_SURNAME_TOO_BROAD": continue
-            if temp_legal_q_check or temp_owner_q_check:
-                can_form_any_query_overall = True; break
-        
-        if not can_form_any_query_overall:
-            print(f"INFO: Case# {case_id_for_log} has insufficient data for any search query. Skipping HCAD search.")
-            output_row['hcad_search_status'] = "SKIPPED_INSUFFICIENT_DATA"
-            output_row['hcad_final_tier_hit'] = "N/A"
-            output_row['hcad_owner_match_type'] = "SKIPPED_NO_QUERY_DATA"
-            all_enriched_data.append(output_row); continue
-
-        hcad_winner_detail_data = None 
-        hcad_status_final_for_row = "NO_HCAD_MATCH_FOUND_ALL_TIERS" 
-        succeeded_tier_name = "N/A"
-        first_page_summary_if_too_many = None 
-
-        # --- NEW: Initialize a set to track subdivisions that are too broad ---
-        subdivisions_to_skip = set()
-
-        if not _try_click_change_criteria(playwright_page, f"InitialReset_Case_{case_id_for_log}", True, True):
-            print(f"ERROR: Initial page reset failed for Case# {case_id_for_log}. Skipping HCAD search for this row.")
-            output_row['hcad_search_status'] = "ERROR_PAGE_RESET_FAILED"
-            output_row['review_reason'] = "Initial page reset failed"; output_row['needs_review_flag'] = 1
-            all_enriched_data.append(output_row); continue
-        time.sleep(0.25) 
-
-        for tier_info in search_tiers_config:
-            tier_name = tier_info["name"]
-
-            # --- NEW: Check if this tier should be skipped ---
-            if tier_name in ["T4_Subdivision_Block", "T3_DropSec", "T2_ExactLegal"]:
-                current_subdivision_for_check = str(rp_row.get('rp_legal_description_text', '')).upper().strip()
-                if current_subdivision_for_check and current_subdivision_for_check in subdivisions_to_skip:
-                    print(f"INFO: Skipping Tier '{tier_name}' because subdivision '{current_subdivision_for_check}' previously returned too many results.")
-                    if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = "SKIPPED_DUE_TO_BROAD_SEARCH"
-                    continue # Skip to the next tier
-
-            print(f"Attempting Tier: {tier_name}")
-            legal_q, owner_q = construct_search_query(rp_row, tier_name)
-
-            if legal_q == "COMMON_SURNAME_TOO_BROAD":
-                print(f"INFO (Tier {tier_name}): Skipped - Common surname with insufficient specifics.")
-                if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = "COMMON_SURNAME_TOO_BROAD"
-                time.sleep(0.2); continue
-            elif legal_q is None and owner_q is None:
-                print(f"INFO: Skipping tier {tier_name} - no query formed.")
-                if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = "NO_QUERY_FORMED"
-                continue
-
-            if not _try_click_change_criteria(playwright_page, f"PreSearchReset_Tier_{tier_name}", True, True):
+HCAD_SEARCH_TIERS_CONFIG = [
+    {"name": "T0_ExactLotBlockSubdivision", "type": "legal_primary_exact"},
+    {"name": "T1_GranteeLastName_Subdivision", "type": "owner_legal_combo"}, # Renamed from T3
+    {"name": "T1_GrantorLastName_Subdivision", "type": "owner_legal_combo"},# Renamed from T3
+    {"name": "T2_ExactLegal", "type": "legal_primary"}, # Renamed from T1
+    {"name": "T3_DropSec", "type": "legal_primary"}, # Renamed from T2
+    {"name": "Fallback_Owner_SubdivisionContains", "type": "owner_legal_combo"},
+    {"name": "T4_Subdivision_Block", "type": "legal_primary"},
+]
+
+HCAD_OUTPUT_COLS_TO_INIT = [
+    'hcad_detail_url_visited', 'hcad_account', 'hcad_owner_full_name',
+    'hcad_mailing_address', 'hcad_legal_desc_detail', 'hcad_site_address',
+    'hcad_pct_ownership', 'hcad_market_value_detail', 'hcad_appraised_value_detail',
+    'hcad_land_area_sf', 'hcad_total_living_area_sf', 'parsing_error', 'hcad_detail_level',
+    'hcad_search_status', 'hcad_final_tier_hit', 'is_owner_grantor',
+    'is_owner_grantee', 'hcad_owner_match_type', 'needs_review_flag', 'review_reason',
+    'hcad_first_page_summary_data', 'score_hcad_vs_probate', 'score_hcad_vs_rp_party',
+    'score_hcad_vs_best_rp_grantee', 'score_probate_vs_rp_party',
+    # Land Data Columns
+    'hcad_lot_sqft_total', 'hcad_land_market_value_total', 'hcad_land_line_count', 'hcad_land_data_json',
+    # Building Area Columns
+    'hcad_total_base_sqft', 'hcad_total_structure_sqft', 'hcad_garage_sqft',
+    'hcad_building_area_count', 'hcad_building_data_json',
+    # Main Building Data Columns
+    'hcad_main_building_data_json',
+    # Building Characteristics
+    'hcad_foundation_type', 'hcad_exterior_wall', 'hcad_heating_ac',
+    'hcad_grade_adjustment', 'hcad_physical_condition',
+    'hcad_full_bathrooms', 'hcad_bedrooms',
+    # Main Page Values
+    'hcad_land_market_value', 'hcad_improvement_market_value',
+    # 5-Year History
+    'hcad_appraised_history_json'
+    # NEW: Add common building characteristic columns
+    'hcad_foundation_type', 'hcad_exterior_wall', 'hcad_roof_type', 'hcad_heating_ac',
+    'hcad_grade_adjustment', 'hcad_physical_condition', 'hcad_full_bathrooms',
+    'hcad_half_bathrooms', 'hcad_bedrooms', 'hcad_stories', 'hcad_carport'
+]
+
+
+# Every input column search_hcad_for_row reads (query construction, candidate scoring and the T0 name check).
+# Rows that agree on all of them get the same search outcome, so only one of them is searched.
+HCAD_DEDUP_SEARCH_ROWS = True
+HCAD_SEARCH_KEY_COLUMNS = [
+    'rp_legal_description_text', 'rp_legal_lot', 'rp_legal_block', 'rp_legal_tract',
+    'rp_legal_sec', 'rp_legal_section',
+    'probate_lead_decedent_first', 'probate_lead_decedent_last',
+    'cleaned_rp_party_first_name', 'cleaned_rp_party_last_name',
+    'rp_grantee_full_names_list', 'match_confidence_level',
+]
+
+# Owner matching runs as a batch stage after all searches (score_hcad_owner_matches). Rows with these
+# statuses never reached it, and rescoring leaves them unchanged.
+HCAD_STATUSES_WITHOUT_OWNER_MATCHING = ("SKIPPED_INSUFFICIENT_DATA", "ERROR_PAGE_RESET_FAILED", "ERROR_WORKER_EXCEPTION", "ERROR_ROW_NOT_PROCESSED")
+HCAD_OWNER_MATCH_WORKERS = -1 # rapidfuzz threads for the batch name comparisons; -1 = all cores
+
+
+def _hcad_search_key(rp_row):
+    key_parts = []
+    for col in HCAD_SEARCH_KEY_COLUMNS:
+        value = rp_row.get(col)
+        key_parts.append(tuple(str(v) for v in value) if isinstance(value, list) else str(value))
+    return tuple(key_parts)
+
+
+def plan_hcad_search_groups(indexed_rows):
+    """
+    Groups (index, rp_row) pairs by _hcad_search_key. Returns lists of row positions in order of first
+    appearance; the first position of each group is the row that is actually searched.
+    """
+    if not HCAD_DEDUP_SEARCH_ROWS:
+        return [[position] for position in range(len(indexed_rows))]
+    groups = {}
+    for position, (_, rp_row) in enumerate(indexed_rows):
+        groups.setdefault(_hcad_search_key(rp_row), []).append(position)
+    search_groups = list(groups.values())
+    print(f"INFO: Search plan: {len(indexed_rows)} input row(s) share {len(search_groups)} distinct search key(s).")
+    return search_groups
+
+
+def _process_hcad_search_group(indexed_rows, member_positions, playwright_page, enriched_rows):
+    """Searches the group's first row and fans the result out to every member. Owner matching runs later, over all rows."""
+    leader_index, leader_row = indexed_rows[member_positions[0]]
+    search_fields, run_owner_matching = search_hcad_for_row(leader_index, leader_row, playwright_page)
+    for position in member_positions:
+        index, rp_row = indexed_rows[position]
+        if position != member_positions[0]:
+            print(f"INFO: Input row {index} (Case# {rp_row.get('probate_lead_case_number', 'N/A')}) has the same search key as row {leader_index}. Reusing its HCAD result.")
+        enriched_rows[position] = _merge_hcad_search_fields(rp_row, search_fields)
+
+
+def _print_hcad_run_summary(indexed_rows, search_groups):
+    print(f"INFO: Row dedup: {len(indexed_rows)} row(s) resolved with {len(search_groups)} search(es); "
+          f"{len(indexed_rows) - len(search_groups)} search(es) avoided.")
+    print(f"INFO: HCAD detail cache stats: {HCAD_DETAIL_CACHE.stats_line()}")
+    print(f"INFO: HCAD query cache stats: {HCAD_QUERY_CACHE.stats_line()}")
+    print(f"INFO: HCAD tier planner stats: {HCAD_TIER_PLANNER.stats_line()}")
+    print(f"INFO: HCAD broad subdivision registry: {HCAD_BROAD_SUBDIVISIONS.stats_line()}")
+    print(f"INFO: HCAD search page: full loads={HCAD_SEARCH_PAGE_LOADS['full_page_loads']} "
+          f"({HCAD_SEARCH_PAGE_LOADS['full_page_loads'] / max(1, len(search_groups)):.2f} per searched row), "
+          f"form reused without reload={HCAD_SEARCH_PAGE_LOADS['form_reuses']}")
+    if HCAD_SPECULATIVE_TIER_K > 1:
+        print(f"INFO: HCAD speculative search stats: {HCAD_SPECULATIVE_POOL.stats_line()}")
+    if HCAD_DEFER_SUMMARY_WINNER_DETAILS:
+        print(f"INFO: HCAD deferred detail backfill: {HCAD_DETAIL_BACKFILL.stats_line()}")
+    if HCAD_TWO_PHASE_ENRICHMENT:
+        print(f"INFO: HCAD two-phase enrichment: rows with full details={HCAD_HEAVY_DETAIL_COUNTS['rows_full']}, "
+              f"rows left at core fields (below the lead gate)={HCAD_HEAVY_DETAIL_COUNTS['rows_core_only']}, "
+              f"phase 2 accounts fetched={HCAD_HEAVY_DETAIL_COUNTS['accounts_fetched']}, failed={HCAD_HEAVY_DETAIL_COUNTS['accounts_failed']}")
+    if any(HCAD_HISTORY_FETCHES.values()):
+        print(f"INFO: HCAD 5-year history pages read in the browser path: over HTTP={HCAD_HISTORY_FETCHES['http']}, "
+              f"in the detail tab={HCAD_HISTORY_FETCHES['page']}, via new tab={HCAD_HISTORY_FETCHES['tab']}")
+    if HCAD_BULK_EXTRACT_MODE:
+        print(f"INFO: HCAD bulk extract stats: {HCAD_BULK_EXTRACT.stats_line()}")
+    if HCAD_LOCAL_INDEX_ENABLED:
+        print(f"INFO: HCAD local candidate index: lookups={HCAD_LOCAL_INDEX_COUNTS['lookups']}, "
+              f"auto-winners (remote search skipped)={HCAD_LOCAL_INDEX_COUNTS['auto_winners']}, "
+              f"extra candidates scored in choose_best_from_multiple={HCAD_LOCAL_INDEX_COUNTS['seeded_candidates_scored']}")
+    HCAD_ARTIFACTS.flush()
+    if HCAD_ARTIFACTS.written or HCAD_ARTIFACTS.dropped or HCAD_ARTIFACTS.failed:
+        print(f"INFO: HCAD debug artifacts ({HCAD_ARTIFACT_MODE}) in {HCAD_ARTIFACT_DIR}: {HCAD_ARTIFACTS.stats_line()}")
+
+
+def _new_summary_harvest(row_context, tier_name):
+    return HcadSummaryHarvest(row_context, tier_name) if HCAD_PAGINATION_HARVEST_MAX_RECORDS > 0 else None
+
+
+def _start_speculative_tier_searches(row_context, planned_tiers):
+    """
+    Submits the first HCAD_SPECULATIVE_TIER_K searchable, uncached tiers of planned_tiers that are listed
+    in HCAD_SPECULATIVE_TIER_NAMES to HCAD_SPECULATIVE_POOL. Returns {tier_name: Future}.
+    """
+    speculative_searches = {}
+    if HCAD_SPECULATIVE_TIER_K < 2 or HCAD_BULK_EXTRACT_MODE:
+        return speculative_searches
+    for tier_info in planned_tiers:
+        if len(speculative_searches) >= HCAD_SPECULATIVE_TIER_K: break
+        tier_name = tier_info["name"]
+        if tier_name not in HCAD_SPECULATIVE_TIER_NAMES: continue
+        legal_q, owner_q = row_context.tier_queries[tier_name]
+        if legal_q == "COMMON_SURNAME_TOO_BROAD" or (legal_q is None and owner_q is None): continue
+        if HCAD_QUERY_CACHE.contains(legal_q, owner_q): continue
+        speculative_searches[tier_name] = HCAD_SPECULATIVE_POOL.submit(tier_name, legal_q, owner_q, _new_summary_harvest(row_context, tier_name))
+    if speculative_searches:
+        print(f"DEBUG: Speculative searches started for tiers: {list(speculative_searches)}")
+    return speculative_searches
+
+
+def search_hcad_for_row(index, rp_row, playwright_page):
+    """
+    Runs the tiered HCAD search for one input row. Returns (search_fields, run_owner_matching):
+    the output fields the search resolved, and whether owner matching should run on them.
+    Only the columns in HCAD_SEARCH_KEY_COLUMNS are read, so the result can be reused for any
+    row with the same _hcad_search_key.
+    """
+    case_id_for_log = rp_row.get('probate_lead_case_number', f"RowIndex_{index}")
+    rp_file_for_log = rp_row.get('rp_file_number', 'N/A')
+    print(f"\n--- Processing Input Row {index}: Case# {case_id_for_log} (RP File: {rp_file_for_log}) ---")
+
+    search_fields = {'hcad_search_status': "PENDING_HCAD_SEARCH"}
+    row_context = RowContext(rp_row)
+
+    can_form_any_query_overall = False
+    for tier_info_check in HCAD_SEARCH_TIERS_CONFIG:
+        temp_legal_q_check, temp_owner_q_check = row_context.tier_queries[tier_info_check["name"]]
+        if temp_legal_q_check == "COMMON_SURNAME_TOO_BROAD": continue
+        if temp_legal_q_check or temp_owner_q_check:
+            can_form_any_query_overall = True; break
+    
+    if not can_form_any_query_overall:
+        print(f"INFO: Case# {case_id_for_log} has insufficient data for any search query. Skipping HCAD search.")
+        search_fields['hcad_search_status'] = "SKIPPED_INSUFFICIENT_DATA"
+        search_fields['hcad_final_tier_hit'] = "N/A"
+        search_fields['hcad_owner_match_type'] = "SKIPPED_NO_QUERY_DATA"
+        return search_fields, False
+
+    local_candidates = rank_local_hcad_candidates(row_context)
+    local_winner = local_hcad_auto_winner(local_candidates, row_context)
+    if local_winner:
+        print(f"INFO: Local index auto-winner: Acct {local_winner.get('hcad_account')} (Score: {local_winner['hcad_best_property_fit_score']:.2f}). Skipping remote search tiers.")
+        _count_local_index_event("auto_winners")
+        search_fields['hcad_search_status'] = "SUCCESS"
+        search_fields.update(local_winner)
+        search_fields['hcad_final_tier_hit'] = HCAD_LOCAL_INDEX_TIER_NAME
+        return search_fields, True
+    if local_candidates:
+        print(f"DEBUG: Local index: {len(local_candidates)} candidate(s), best Acct {local_candidates[0].get('hcad_account')} "
+              f"(Score: {local_candidates[0]['hcad_best_property_fit_score']:.2f}). Searching HCAD.")
+
+    hcad_winner_detail_data = None 
+    hcad_status_final_for_row = "NO_HCAD_MATCH_FOUND_ALL_TIERS" 
+    succeeded_tier_name = "N/A"
+    first_page_summary_if_too_many = None 
+
+    # --- NEW: Track the legal-only tiers that are too broad for this row ---
+    legal_tiers_to_skip = set()
+    for legal_tier_name in HCAD_LEGAL_ONLY_TIERS:
+        registered_legal_q = row_context.tier_queries[legal_tier_name][0]
+        known_broad_count = HCAD_BROAD_SUBDIVISIONS.is_broad(registered_legal_q)
+        if known_broad_count is not None:
+            legal_tiers_to_skip = _legal_tiers_at_least_as_broad(legal_tier_name)
+            print(f"INFO: Legal query '{registered_legal_q}' is registered as too broad ({known_broad_count if known_broad_count >= 0 else 'unknown'} records). "
+                  f"Skipping tiers {sorted(legal_tiers_to_skip)}.")
+            HCAD_BROAD_SUBDIVISIONS.count_seeded_row()
+            break
+    registry_skipped_tiers = set(legal_tiers_to_skip)
+
+    query_shape = row_context.query_shape
+    tiers_searched = []
+
+    # The initial reset is deferred until the first tier that actually needs the browser,
+    # so rows answered entirely from HCAD_QUERY_CACHE never touch the page.
+    initial_reset_done = False
+
+    planned_tiers = HCAD_TIER_PLANNER.plan(query_shape, HCAD_SEARCH_TIERS_CONFIG)
+    speculative_searches = _start_speculative_tier_searches(
+        row_context, [t for t in planned_tiers if t["name"] not in legal_tiers_to_skip])
+
+    for tier_info in planned_tiers:
+        tier_name = tier_info["name"]
+
+        # --- NEW: Check if this tier should be skipped ---
+        if tier_name in legal_tiers_to_skip:
+            print(f"INFO: Skipping Tier '{tier_name}' because a search at least as narrow previously returned too many results.")
+            if tier_name in registry_skipped_tiers: HCAD_BROAD_SUBDIVISIONS.count_skipped_search()
+            if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = "SKIPPED_DUE_TO_BROAD_SEARCH"
+            continue # Skip to the next tier
+
+        print(f"Attempting Tier: {tier_name}")
+        legal_q, owner_q = row_context.tier_queries[tier_name]
+
+        if legal_q == "COMMON_SURNAME_TOO_BROAD":
+            print(f"INFO (Tier {tier_name}): Skipped - Common surname with insufficient specifics.")
+            if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = "COMMON_SURNAME_TOO_BROAD"
+            time.sleep(0.2); continue
+        elif legal_q is None and owner_q is None:
+            print(f"INFO: Skipping tier {tier_name} - no query formed.")
+            if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = "NO_QUERY_FORMED"
+            continue
+
+        search_info = {}
+        speculative_search = speculative_searches.pop(tier_name, None)
+        status, data = HCAD_SPECULATIVE_POOL.result(speculative_search) if speculative_search else (None, None)
+        speculative_hit = status is not None
+        query_cache_hit = False
+        bulk_extract_hit = HCAD_BULK_EXTRACT_MODE and not speculative_hit
+        if speculative_hit:
+            print(f"DEBUG: [SPECULATIVE] Tier {tier_name}: {status} for Legal: '{legal_q}', Owner: '{owner_q}'")
+        elif bulk_extract_hit:
+            status, data = HCAD_BULK_EXTRACT.search(tier_name, legal_q, owner_q, search_info)
+        else:
+            status, data = HCAD_QUERY_CACHE.get(legal_q, owner_q)
+            query_cache_hit = status is not None
+        if query_cache_hit:
+            print(f"DEBUG: [QUERY CACHE HIT] Tier {tier_name}: {status} for Legal: '{legal_q}', Owner: '{owner_q}'")
+        elif not (speculative_hit or bulk_extract_hit):
+            if not initial_reset_done:
+                if not _prepare_hcad_search_page(playwright_page, f"InitialReset_Case_{case_id_for_log}"):
+                    print(f"ERROR: Initial page reset failed for Case# {case_id_for_log}. Skipping HCAD search for this row.")
+                    HCAD_SPECULATIVE_POOL.discard(speculative_searches.values())
+                    search_fields['hcad_search_status'] = "ERROR_PAGE_RESET_FAILED"
+                    search_fields['review_reason'] = "Initial page reset failed"; search_fields['needs_review_flag'] = 1
+                    return search_fields, False
+                initial_reset_done = True
+                time.sleep(0.25)
+
+            if not _prepare_hcad_search_page(playwright_page, f"PreSearchReset_Tier_{tier_name}"):
                  print(f"WARN: Pre-search reset for tier {tier_name} might have failed.")
             time.sleep(0.1) 
 
-            status, data = search_hcad_and_get_results(playwright_page, tier_name, legal_q, owner_q)
-            
-            if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = status
-
-            if status == "UNIQUE_HIT":
-                found_hcad_url = data 
-                parsed_acct_from_url = None
-                match_acct_url = re.search(r"acct=(\d+)", found_hcad_url, re.IGNORECASE)
-                if match_acct_url: parsed_acct_from_url = match_acct_url.group(1)
-
-                if parsed_acct_from_url and parsed_acct_from_url in HCAD_DETAIL_CACHE:
-                    hcad_winner_detail_data = HCAD_DETAIL_CACHE[parsed_acct_from_url]
-                else:
-                    hcad_winner_detail_data = parse_hcad_detail_page(playwright_page, found_hcad_url)
-                    if hcad_winner_detail_data and not hcad_winner_detail_data.get('parsing_error') and hcad_winner_detail_data.get('hcad_account'):
-                        HCAD_DETAIL_CACHE[hcad_winner_detail_data['hcad_account']] = hcad_winner_detail_data
-                
-                if hcad_winner_detail_data and hcad_winner_detail_data.get('hcad_account'):
-                    succeeded_tier_name = tier_name
-                    hcad_status_final_for_row = "SUCCESS"
-                    if tier_name == "T0_ExactLotBlockSubdivision":
-                        temp_hcad_owner = str(hcad_winner_detail_data.get('hcad_owner_full_name', '')).upper().strip()
-                        temp_probate_last = str(rp_row.get('probate_lead_decedent_last', '')).upper().strip()
-                        temp_rp_party_last = str(rp_row.get('cleaned_rp_party_last_name', '')).upper().strip()
-                        if temp_hcad_owner and ((temp_probate_last and temp_probate_last in temp_hcad_owner) or (temp_rp_party_last and temp_rp_party_last in temp_hcad_owner)):
-                            print(f"INFO: T0 success with good name signal. Skipping further tiers.")
-                            break # Break ONLY if name signal is good
-                        else:
-                            print(f"INFO: T0 success, but name signal weak. Continuing for confirmation.")
-                            hcad_status_final_for_row = "SUCCESS_T0_NEEDS_NAME_CONFIRM"
-                            # DO NOT BREAK - continue to next tier
+            harvest = _new_summary_harvest(row_context, tier_name)
+            status, data = search_hcad_and_get_results(playwright_page, tier_name, legal_q, owner_q, harvest, search_info)
+            if harvest is None or harvest.cacheable:
+                HCAD_QUERY_CACHE.put(legal_q, owner_q, status, data)
+        tiers_searched.append(tier_name)
+        
+        if hcad_status_final_for_row != "SUCCESS": hcad_status_final_for_row = status
+
+        if status == "UNIQUE_HIT":
+            found_hcad_url = data
+            hcad_winner_detail_data = get_hcad_detail_cached(playwright_page, found_hcad_url)
+
+            if hcad_winner_detail_data and hcad_winner_detail_data.get('hcad_account'):
+                succeeded_tier_name = tier_name
+                hcad_status_final_for_row = "SUCCESS"
+                if tier_name == "T0_ExactLotBlockSubdivision":
+                    if hcad_owner_has_name_signal(hcad_winner_detail_data, row_context):
+                        print(f"INFO: T0 success with good name signal. Skipping further tiers.")
+                        break # Break ONLY if name signal is good
                     else:
-                        # For any other successful tier, we can break immediately.
-                        break
-                else: 
-                    hcad_status_final_for_row = "DETAIL_PARSE_FAILED"
+                        print(f"INFO: T0 success, but name signal weak. Continuing for confirmation.")
+                        hcad_status_final_for_row = "SUCCESS_T0_NEEDS_NAME_CONFIRM"
+                        # DO NOT BREAK - continue to next tier
+                else:
+                    # For any other successful tier, we can break immediately.
                     break
+            else: 
+                hcad_status_final_for_row = "DETAIL_PARSE_FAILED"
+                break
+
+        elif status == "SINGLE_ITEM_IN_LIST":
+            single_item_summary = data[0]; found_hcad_url = single_item_summary['hcad_detail_url']
+            account_summary_for_lookup = single_item_summary.get('hcad_account_summary')
+            hcad_winner_detail_data = get_hcad_detail_cached(playwright_page, found_hcad_url, account_summary_for_lookup)
+
+            if hcad_winner_detail_data and hcad_winner_detail_data.get('hcad_account'):
+                succeeded_tier_name = tier_name; hcad_status_final_for_row = "SUCCESS" 
+                if tier_name == "T0_ExactLotBlockSubdivision":
+                    if hcad_owner_has_name_signal(hcad_winner_detail_data, row_context):
+                        print(f"INFO: T0 success with good name signal. Skipping further tiers.")
+                        break 
+                    else:
+                        print(f"INFO: T0 success, but name signal weak. Continuing for confirmation.")
+                        hcad_status_final_for_row = "SUCCESS_T0_NEEDS_NAME_CONFIRM"
+            else: 
+                hcad_status_final_for_row = "DETAIL_PARSE_FAILED"
+            break 
+
+        elif status == "PAGINATION_TOO_LARGE":
+            first_page_summary_if_too_many = data
+            # --- NEW: Skip the legal-only tiers no narrower than the one that overflowed ---
+            if tier_name in HCAD_LEGAL_ONLY_TIERS:
+                print(f"INFO: Tier '{tier_name}' query '{legal_q}' was too broad. Skipping broader legal-only tiers.")
+                legal_tiers_to_skip |= _legal_tiers_at_least_as_broad(tier_name)
+                HCAD_BROAD_SUBDIVISIONS.record(tier_name, legal_q, search_info.get('num_records'))
+            elif row_context.subdivision:
+                print(f"INFO: Tier '{tier_name}' for subdivision '{row_context.subdivision}' was too broad. Flagging it to skip subsequent broader searches.")
+                legal_tiers_to_skip |= set(HCAD_LEGAL_ONLY_TIERS)
+        
+        elif status == "MULTIPLE_HITS":
+            winner_from_multiple = choose_best_from_multiple(data, row_context, tier_name, playwright_page, row_context.confidence_level, local_candidates)
+            if winner_from_multiple and winner_from_multiple.get('hcad_account'): 
+                hcad_winner_detail_data = winner_from_multiple 
+                succeeded_tier_name = tier_name; hcad_status_final_for_row = "SUCCESS" 
+                print(f"INFO: Winner selected by {tier_name}: Acct {hcad_winner_detail_data.get('hcad_account')}")
+                break 
+            else:
+                hcad_status_final_for_row = f"MULTIPLE_HITS_NO_WINNER_TIER_{tier_name}"
+        
+        elif status == "ERROR":
+            hcad_status_final_for_row = f"ERROR_IN_TIER_{tier_name}"; break 
+        
+        elif status in ("NO_HITS", "AMBIGUOUS_COUNT", "NO_HITS_OR_UNKNOWN_PAGE"):
+            pass # Status already updated, continue to next tier
+        
+        if not (query_cache_hit or speculative_hit or bulk_extract_hit): time.sleep(HCAD_TIER_DELAY_S)
+
+    HCAD_SPECULATIVE_POOL.discard(speculative_searches.values())
+    matched = hcad_status_final_for_row in ("SUCCESS", "SUCCESS_T0_NEEDS_NAME_CONFIRM") and succeeded_tier_name != "N/A"
+    HCAD_TIER_PLANNER.record_row(query_shape, tiers_searched, succeeded_tier_name if matched else None)
+
+    search_fields['hcad_search_status'] = hcad_status_final_for_row
+    if hcad_status_final_for_row == "SUCCESS" and hcad_winner_detail_data:
+        search_fields.update(hcad_winner_detail_data) 
+        search_fields['hcad_final_tier_hit'] = succeeded_tier_name
+    elif hcad_winner_detail_data and hcad_winner_detail_data.get('parsing_error'): 
+        search_fields['hcad_search_status'] = "DETAIL_PARSE_ERROR" 
+        search_fields['parsing_error'] = hcad_winner_detail_data.get('parsing_error')
+        search_fields['hcad_final_tier_hit'] = succeeded_tier_name 
+        search_fields.update(hcad_winner_detail_data)
+    elif hcad_status_final_for_row == "PAGINATION_TOO_LARGE" and first_page_summary_if_too_many:
+        search_fields['hcad_first_page_summary_data'] = str(first_page_summary_if_too_many[:3]) 
+        search_fields['hcad_final_tier_hit'] = succeeded_tier_name # Tier that hit pagination
+    elif hcad_status_final_for_row == "SUCCESS_T0_NEEDS_NAME_CONFIRM" and hcad_winner_detail_data: # Handle new T0 status
+        search_fields.update(hcad_winner_detail_data)
+        search_fields['hcad_final_tier_hit'] = "T0_ExactLotBlockSubdivision" # Explicitly set T0
+    else: 
+        search_fields['hcad_final_tier_hit'] = "N/A" 
+    return search_fields, True
 
-            elif status == "SINGLE_ITEM_IN_LIST":
-                single_item_summary = data[0]; found_hcad_url = single_item_summary['hcad_detail_url']
-                account_summary_for_lookup = single_item_summary.get('hcad_account_summary')
-                parsed_acct_from_url = None
-                match_acct_url = re.search(r"acct=(\d+)", found_hcad_url, re.IGNORECASE)
-                if match_acct_url: parsed_acct_from_url = match_acct_url.group(1)
-                cache_key_to_check = parsed_acct_from_url if parsed_acct_from_url else account_summary_for_lookup
 
-                if cache_key_to_check and cache_key_to_check in HCAD_DETAIL_CACHE:
-                    hcad_winner_detail_data = HCAD_DETAIL_CACHE[cache_key_to_check]
-                else:
-                    hcad_winner_detail_data = parse_hcad_detail_page(playwright_page, found_hcad_url)
-                    if hcad_winner_detail_data and not hcad_winner_detail_data.get('parsing_error') and hcad_winner_detail_data.get('hcad_account'):
-                        def_key = hcad_winner_detail_data['hcad_account']
-                        HCAD_DETAIL_CACHE[def_key] = hcad_winner_detail_data
-                        if parsed_acct_from_url and parsed_acct_from_url != def_key and parsed_acct_from_url not in HCAD_DETAIL_CACHE : HCAD_DETAIL_CACHE[parsed_acct_from_url] = hcad_winner_detail_data
-                        if account_summary_for_lookup and account_summary_for_lookup != def_key and account_summary_for_lookup not in HCAD_DETAIL_CACHE: HCAD_DETAIL_CACHE[account_summary_for_lookup] = hcad_winner_detail_data
-                
-                if hcad_winner_detail_data and hcad_winner_detail_data.get('hcad_account'):
-                    succeeded_tier_name = tier_name; hcad_status_final_for_row = "SUCCESS" 
-                    if tier_name == "T0_ExactLotBlockSubdivision":
-                        temp_hcad_owner = str(hcad_winner_detail_data.get('hcad_owner_full_name', '')).upper().strip()
-                        temp_probate_last = str(rp_row.get('probate_lead_decedent_last', '')).upper().strip()
-                        temp_rp_party_last = str(rp_row.get('cleaned_rp_party_last_name', '')).upper().strip()
-                        if temp_hcad_owner and ((temp_probate_last and temp_probate_last in temp_hcad_owner) or (temp_rp_party_last and temp_rp_party_last in temp_hcad_owner)):
-                            print(f"INFO: T0 success with good name signal. Skipping further tiers.")
-                            break 
-                        else:
-                            print(f"INFO: T0 success, but name signal weak. Continuing for confirmation.")
-                            hcad_status_final_for_row = "SUCCESS_T0_NEEDS_NAME_CONFIRM"
-                else: 
-                    hcad_status_final_for_row = "DETAIL_PARSE_FAILED"
-                break 
+def _merge_hcad_search_fields(rp_row, search_fields):
+    """The output row for rp_row: its input columns, every HCAD output column (None until set), and search_fields."""
+    output_row = rp_row.to_dict()
+    for col in HCAD_OUTPUT_COLS_TO_INIT:
+        if col not in output_row: output_row[col] = None
+    # Defaults for binary flags and scores are set within the logic block later
+    output_row.update(search_fields)
+    return output_row
 
-            elif status == "PAGINATION_TOO_LARGE":
-                first_page_summary_if_too_many = data
-                # --- NEW: Add the subdivision to our skip set ---
-                current_subdivision = str(rp_row.get('rp_legal_description_text', '')).upper().strip()
-                if current_subdivision and current_subdivision != 'NAN':
-                    print(f"INFO: Tier '{tier_name}' for subdivision '{current_subdivision}' was too broad. Flagging it to skip subsequent broader searches.")
-                    subdivisions_to_skip.add(current_subdivision)
-            
-            elif status == "MULTIPLE_HITS":
-                current_confidence = str(rp_row.get('match_confidence_level', 'Unknown')).strip()
-                winner_from_multiple = choose_best_from_multiple(data, rp_row, tier_name, playwright_page, current_confidence)
-                if winner_from_multiple and winner_from_multiple.get('hcad_account'): 
-                    hcad_winner_detail_data = winner_from_multiple 
-                    succeeded_tier_name = tier_name; hcad_status_final_for_row = "SUCCESS" 
-                    print(f"INFO: Winner selected by {tier_name}: Acct {hcad_winner_detail_data.get('hcad_account')}")
-                    break 
-                else:
-                    hcad_status_final_for_row = f"MULTIPLE_HITS_NO_WINNER_TIER_{tier_name}"
-            
-            elif status == "ERROR":
-                hcad_status_final_for_row = f"ERROR_IN_TIER_{tier_name}"; break 
-            
-            elif status in ("NO_HITS", "AMBIGUOUS_COUNT", "NO_HITS_OR_UNKNOWN_PAGE"):
-                pass # Status already updated, continue to next tier
-            
-            time.sleep(0.75) 
-
-        output_row['hcad_search_status'] = hcad_status_final_for_row
-        if hcad_status_final_for_row == "SUCCESS" and hcad_winner_detail_data:
-            output_row.update(hcad_winner_detail_data) 
-            output_row['hcad_final_tier_hit'] = succeeded_tier_name
-        elif hcad_winner_detail_data and hcad_winner_detail_data.get('parsing_error'): 
-            output_row['hcad_search_status'] = "DETAIL_PARSE_ERROR" 
-            output_row['parsing_error'] = hcad_winner_detail_data.get('parsing_error')
-            output_row['hcad_final_tier_hit'] = succeeded_tier_name 
-            output_row.update(hcad_winner_detail_data)
-        elif hcad_status_final_for_row == "PAGINATION_TOO_LARGE" and first_page_summary_if_too_many:
-            output_row['hcad_first_page_summary_data'] = str(first_page_summary_if_too_many[:3]) 
-            output_row['hcad_final_tier_hit'] = succeeded_tier_name # Tier that hit pagination
-        elif hcad_status_final_for_row == "SUCCESS_T0_NEEDS_NAME_CONFIRM" and hcad_winner_detail_data: # Handle new T0 status
-            output_row.update(hcad_winner_detail_data)
-            output_row['hcad_final_tier_hit'] = "T0_ExactLotBlockSubdivision" # Explicitly set T0
-        else: 
-            output_row['hcad_final_tier_hit'] = "N/A" 
+
+def _hcad_owner_last_guess(hcad_owner_full_str):
+    # --- Smarter Last Name Guess for HCAD names ---
+    company_indicators = {"LLC", "INC", "LP", "LTD", "CO", "BANK", "TRUST", "ESTATE", "EST"}
+    hcad_name_parts = hcad_owner_full_str.split()
+    is_company = any(part in company_indicators for part in hcad_name_parts)
+    if not is_company and hcad_name_parts:
+        return hcad_name_parts[0] # Assume first word is last name
+    return _extract_potential_last_name(hcad_owner_full_str)
+
+
+def _owner_match_inputs(output_row, add_pair):
+    """
+    Normalized names for one row and the fuzzy comparisons it needs. add_pair(a, b) queues a
+    token_set_ratio comparison and returns its index in the batch score list.
+    """
+    hcad_owner_full_str = str(output_row.get('hcad_owner_full_name', "")).upper().strip()
+    hcad_owner_last_guess = _hcad_owner_last_guess(hcad_owner_full_str)
+
+    probate_dec_first = str(output_row.get('probate_lead_decedent_first', "")).upper().strip()
+    probate_dec_last = str(output_row.get('probate_lead_decedent_last', "")).upper().strip()
+    probate_decedent_full_name = f"{probate_dec_first} {probate_dec_last}".strip()
+    if not probate_decedent_full_name.strip(): probate_decedent_full_name = None
+
+    rp_party_first = str(output_row.get('cleaned_rp_party_first_name', "")).upper().strip()
+    rp_party_last = str(output_row.get('cleaned_rp_party_last_name', "")).upper().strip()
+    rp_party_full_name = f"{rp_party_first} {rp_party_last}".strip()
+    if not rp_party_full_name.strip(): rp_party_full_name = None
+
+    def _name_pairs(full_name):
+        # (last-name pair index or None, full-name pair index) of a name against the HCAD owner
+        last_comp = _extract_potential_last_name(full_name)
+        last_pair = add_pair(last_comp, hcad_owner_last_guess) if last_comp and hcad_owner_last_guess else None
+        return last_pair, add_pair(full_name, hcad_owner_full_str)
+
+    inputs = {'probate_decedent_full_name': probate_decedent_full_name, 'rp_party_full_name': rp_party_full_name,
+              'probate_pairs': None, 'rp_party_pairs': None, 'probate_vs_rp_party_pair': None, 'grantee_pairs': []}
+    if probate_decedent_full_name and hcad_owner_full_str:
+        inputs['probate_pairs'] = _name_pairs(probate_decedent_full_name)
+    if rp_party_full_name and hcad_owner_full_str:
+        inputs['rp_party_pairs'] = _name_pairs(rp_party_full_name)
+    if probate_decedent_full_name and rp_party_full_name:
+        inputs['probate_vs_rp_party_pair'] = add_pair(probate_decedent_full_name, rp_party_full_name)
+
+    rp_grantee_list = output_row.get('rp_grantee_full_names_list', [])
+    if not isinstance(rp_grantee_list, list): rp_grantee_list = []
+    for grantee_obj in rp_grantee_list:
+        grantee_full_name = str(grantee_obj).upper().strip()
+        if grantee_full_name and hcad_owner_full_str:
+            inputs['grantee_pairs'].append(_name_pairs(grantee_full_name))
+    return inputs
+
+
+def score_hcad_owner_matches(output_rows, log_rows=True):
+    """
+    Owner matching and review flagging for merged output rows, as one batch stage: every fuzzy name
+    comparison of every row (grantee lists included) is scored in a single rapidfuzz process.cpdist call
+    over HCAD_OWNER_MATCH_WORKERS threads, then each row is classified. Rows whose status is in
+    HCAD_STATUSES_WITHOUT_OWNER_MATCHING are left as they are. Mutates and returns output_rows.
+    """
+    pair_left, pair_right = [], []
+    def add_pair(left, right):
+        pair_left.append(left); pair_right.append(right)
+        return len(pair_left) - 1
+
+    rows_to_score = [row for row in output_rows if row.get('hcad_search_status') not in HCAD_STATUSES_WITHOUT_OWNER_MATCHING]
+    row_inputs = []
+    for output_row in rows_to_score:
+        has_owner = output_row.get('hcad_search_status') in ["SUCCESS", "SUCCESS_T0_NEEDS_NAME_CONFIRM"] and output_row.get('hcad_owner_full_name')
+        row_inputs.append(_owner_match_inputs(output_row, add_pair) if has_owner else None)
+    scores = process.cpdist(pair_left, pair_right, scorer=fuzz.token_set_ratio, dtype=np.float64,
+                            workers=HCAD_OWNER_MATCH_WORKERS).tolist() if pair_left else []
+
+    match_threshold = 80 # Using the more forgiving threshold
+    for output_row, inputs in zip(rows_to_score, row_inputs):
+        case_id_for_log = output_row.get('probate_lead_case_number', "N/A")
 
         # --- Enhanced Owner Match Typing with Raw Fuzzy Scores ---
         output_row['score_hcad_vs_probate'] = 0; output_row['score_hcad_vs_rp_party'] = 0
@@ -1540,73 +3515,31 @@ def main_hcad_processing_loop(df_processed_input, playwright_page):
         output_row['score_probate_vs_rp_party'] = 0
         output_row['is_owner_grantor'] = 0; output_row['is_owner_grantee'] = 0
 
-        if output_row.get('hcad_search_status') in ["SUCCESS", "SUCCESS_T0_NEEDS_NAME_CONFIRM"] and output_row.get('hcad_owner_full_name'):
-            hcad_owner_full_str = str(output_row.get('hcad_owner_full_name', "")).upper().strip()
-
-            # --- Smarter Last Name Guess for HCAD names ---
-            hcad_owner_last_guess = ""
-            company_indicators = {"LLC", "INC", "LP", "LTD", "CO", "BANK", "TRUST", "ESTATE", "EST"}
-            hcad_name_parts = hcad_owner_full_str.split()
-            is_company = any(part in company_indicators for part in hcad_name_parts)
-
-            if not is_company and hcad_name_parts:
-                hcad_owner_last_guess = hcad_name_parts[0] # Assume first word is last name
-            else:
-                hcad_owner_last_guess = _extract_potential_last_name(hcad_owner_full_str)
-            # --- End of smarter guess ---
-
-            probate_dec_first = str(rp_row.get('probate_lead_decedent_first', "")).upper().strip()
-            probate_dec_last = str(rp_row.get('probate_lead_decedent_last', "")).upper().strip()
-            probate_decedent_full_name = f"{probate_dec_first} {probate_dec_last}".strip()
-            if not probate_decedent_full_name.strip(): probate_decedent_full_name = None
-
-            rp_party_first = str(rp_row.get('cleaned_rp_party_first_name', "")).upper().strip()
-            rp_party_last = str(rp_row.get('cleaned_rp_party_last_name', "")).upper().strip()
-            rp_party_full_name = f"{rp_party_first} {rp_party_last}".strip()
-            if not rp_party_full_name.strip(): rp_party_full_name = None
-
-            match_threshold = 80 # Using the more forgiving threshold
-
-            if probate_decedent_full_name and hcad_owner_full_str:
-                probate_dec_last_comp = _extract_potential_last_name(probate_decedent_full_name)
-                last_name_score_probate = fuzz.token_set_ratio(probate_dec_last_comp, hcad_owner_last_guess) if probate_dec_last_comp and hcad_owner_last_guess else 0
-                full_name_score_probate = fuzz.token_set_ratio(probate_decedent_full_name, hcad_owner_full_str)
+        if inputs is not None:
+            if inputs['probate_pairs']:
+                last_pair, full_pair = inputs['probate_pairs']
                 # Using the 30/70 weights that favor the more robust full name match
-                output_row['score_hcad_vs_probate'] = round((last_name_score_probate * 0.3) + (full_name_score_probate * 0.7))
-
-            if rp_party_full_name and hcad_owner_full_str:
-                rp_party_last_comp = _extract_potential_last_name(rp_party_full_name)
-                last_name_score_rp_party = fuzz.token_set_ratio(rp_party_last_comp, hcad_owner_last_guess) if rp_party_last_comp and hcad_owner_last_guess else 0
-                full_name_score_rp_party = fuzz.token_set_ratio(rp_party_full_name, hcad_owner_full_str)
-                # Applying the 30/70 weights here as well
-                output_row['score_hcad_vs_rp_party'] = round((last_name_score_rp_party * 0.3) + (full_name_score_rp_party * 0.7))
+                output_row['score_hcad_vs_probate'] = round(((scores[last_pair] if last_pair is not None else 0) * 0.3) + (scores[full_pair] * 0.7))
+            if inputs['rp_party_pairs']:
+                last_pair, full_pair = inputs['rp_party_pairs']
+                output_row['score_hcad_vs_rp_party'] = round(((scores[last_pair] if last_pair is not None else 0) * 0.3) + (scores[full_pair] * 0.7))
+            if inputs['probate_vs_rp_party_pair'] is not None:
+                output_row['score_probate_vs_rp_party'] = scores[inputs['probate_vs_rp_party_pair']]
 
-            # (The rest of the owner matching logic continues from here...)
-
-            if probate_decedent_full_name and rp_party_full_name:
-                output_row['score_probate_vs_rp_party'] = fuzz.token_set_ratio(probate_decedent_full_name, rp_party_full_name)
-
-            rp_grantee_list = rp_row.get('rp_grantee_full_names_list', [])
-            if not isinstance(rp_grantee_list, list): rp_grantee_list = []
             current_best_grantee_score = 0
-            for grantee_obj in rp_grantee_list:
-                grantee_full_name = str(grantee_obj).upper().strip()
-                if grantee_full_name and hcad_owner_full_str:
-                    grantee_last_guess = _extract_potential_last_name(grantee_full_name)
-                    last_name_score_grantee = fuzz.token_set_ratio(grantee_last_guess, hcad_owner_last_guess) if grantee_last_guess and hcad_owner_last_guess else 0
-                    full_name_score_grantee = fuzz.token_set_ratio(grantee_full_name, hcad_owner_full_str)
-                    combined_score = round((last_name_score_grantee * 0.6) + (full_name_score_grantee * 0.4))
-                    if combined_score > current_best_grantee_score: current_best_grantee_score = combined_score
+            for last_pair, full_pair in inputs['grantee_pairs']:
+                combined_score = round(((scores[last_pair] if last_pair is not None else 0) * 0.6) + (scores[full_pair] * 0.4))
+                if combined_score > current_best_grantee_score: current_best_grantee_score = combined_score
             output_row['score_hcad_vs_best_rp_grantee'] = current_best_grantee_score
-            
+
             probate_matches_hcad_flag = output_row['score_hcad_vs_probate'] >= match_threshold
             rp_party_matches_hcad_flag = output_row['score_hcad_vs_rp_party'] >= match_threshold
             grantee_matches_hcad_flag = output_row['score_hcad_vs_best_rp_grantee'] >= match_threshold
             probate_is_rp_party_flag = output_row['score_probate_vs_rp_party'] >= match_threshold
-            
-            if not rp_party_full_name and probate_decedent_full_name:
-                rp_party_matches_hcad_flag = probate_matches_hcad_flag 
-                probate_is_rp_party_flag = True 
+
+            if not inputs['rp_party_full_name'] and inputs['probate_decedent_full_name']:
+                rp_party_matches_hcad_flag = probate_matches_hcad_flag
+                probate_is_rp_party_flag = True
 
             if probate_matches_hcad_flag:
                 if probate_is_rp_party_flag: output_row['hcad_owner_match_type'] = "MATCH_PROBATE_DECEDENT_AS_RP_PARTY"
@@ -1619,18 +3552,18 @@ def main_hcad_processing_loop(df_processed_input, playwright_page):
                 output_row['is_owner_grantor'] = 1
             if output_row['hcad_owner_match_type'] == "MATCH_RP_GRANTEE":
                 output_row['is_owner_grantee'] = 1
-        
-        elif output_row.get('hcad_search_status') in ["SUCCESS", "SUCCESS_T0_NEEDS_NAME_CONFIRM"]: 
+
+        elif output_row.get('hcad_search_status') in ["SUCCESS", "SUCCESS_T0_NEEDS_NAME_CONFIRM"]:
             output_row['hcad_owner_match_type'] = "HCAD_OWNER_NAME_MISSING"
-        else: 
+        else:
             output_row['hcad_owner_match_type'] = str(output_row.get('hcad_search_status'))
-        
+
         # --- Refined Needs Review Flag Logic ---
         current_hcad_status_for_review = output_row.get('hcad_search_status', '')
         current_owner_match_type = output_row.get('hcad_owner_match_type', '') 
         output_row['needs_review_flag'] = 0 
         output_row['review_reason'] = None 
-        
+    
         if current_hcad_status_for_review not in ["SUCCESS", "SKIPPED_INSUFFICIENT_DATA", "NO_HITS", "COMMON_SURNAME_TOO_BROAD", "NO_QUERY_FORMED"]: # If not success or a known "benign" non-success
             output_row['needs_review_flag'] = 1
             output_row['review_reason'] = f"HCAD Search Status: {current_hcad_status_for_review}" # This includes SUCCESS_T0_NEEDS_NAME_CONFIRM
@@ -1648,8 +3581,8 @@ def main_hcad_processing_loop(df_processed_input, playwright_page):
             output_row['review_reason'] = "Review: HCAD Owner appears to be an unrelated third party"
         elif current_owner_match_type == "MATCH_RP_GRANTEE": 
             probate_matches_this_grantee = False
-            if probate_decedent_full_name and output_row.get('hcad_owner_full_name'): 
-                if fuzz.token_set_ratio(probate_decedent_full_name, output_row['hcad_owner_full_name']) >= match_threshold:
+            if inputs['probate_decedent_full_name'] and output_row.get('hcad_owner_full_name'): 
+                if fuzz.token_set_ratio(inputs['probate_decedent_full_name'], output_row['hcad_owner_full_name']) >= match_threshold:
                     probate_matches_this_grantee = True
             if not probate_matches_this_grantee: 
                 output_row['needs_review_flag'] = 1
@@ -1657,15 +3590,156 @@ def main_hcad_processing_loop(df_processed_input, playwright_page):
         elif current_owner_match_type == "HCAD_OWNER_NAME_MISSING": 
             output_row['needs_review_flag'] = 1
             output_row['review_reason'] = "HCAD Owner Name Missing After Successful Scrape"
-        
+    
         if output_row['needs_review_flag'] == 1 and (output_row.get('review_reason') is None or output_row.get('review_reason') == ''):
             output_row['review_reason'] = "General Review Needed due to search outcome or complex match type"
 
-        all_enriched_data.append(output_row)
-        print(f"--- Completed: Case# {case_id_for_log}. Final Status: {output_row['hcad_search_status']}, MatchType: {output_row['hcad_owner_match_type']}, Review: {output_row['needs_review_flag']}, Reason: {output_row['review_reason']} ---")
-        time.sleep(1.0) 
+        if log_rows:
+            print(f"--- Completed: Case# {case_id_for_log}. Final Status: {output_row['hcad_search_status']}, MatchType: {output_row['hcad_owner_match_type']}, Review: {output_row['needs_review_flag']}, Reason: {output_row['review_reason']} ---")
+    return output_rows
+
+
+def rescore_hcad_owner_matches_csv(input_csv_path, output_csv_path=None):
+    """
+    Re-runs owner matching and review flagging on a saved enriched CSV without a browser. The grantee
+    list column is read back from its CSV form and empty HCAD output columns become None again, as they
+    were during the run. Returns the rescored DataFrame and writes it to output_csv_path if given.
+    """
+    enriched_df = pd.read_csv(input_csv_path, low_memory=False)
+    output_rows = enriched_df.to_dict('records')
+    hcad_output_cols = set(HCAD_OUTPUT_COLS_TO_INIT)
+    for output_row in output_rows:
+        for col in hcad_output_cols.intersection(output_row):
+            if isinstance(output_row[col], float) and pd.isna(output_row[col]): output_row[col] = None
+        grantees = output_row.get('rp_grantee_full_names_list')
+        if isinstance(grantees, str) and grantees.startswith('['):
+            try:
+                output_row['rp_grantee_full_names_list'] = ast.literal_eval(grantees)
+            except (ValueError, SyntaxError):
+                pass
+    started = time.monotonic()
+    score_hcad_owner_matches(output_rows, log_rows=False)
+    print(f"INFO: Rescored owner matches for {len(output_rows)} row(s) from {input_csv_path} in {time.monotonic() - started:.2f}s.")
+    rescored_df = pd.DataFrame(output_rows, columns=enriched_df.columns)
+    if output_csv_path:
+        rescored_df.to_csv(output_csv_path, index=False)
+        print(f"INFO: Rescored data saved to: {output_csv_path}")
+    return rescored_df
+
+
+def main_hcad_processing_loop(df_processed_input, playwright_page):
+    indexed_rows = list(df_processed_input.iterrows())
+    search_groups = plan_hcad_search_groups(indexed_rows)
+    enriched_rows = [None] * len(indexed_rows)
+    for group_number, member_positions in enumerate(search_groups):
+        if group_number > 0 and not HCAD_BULK_EXTRACT_MODE: time.sleep(HCAD_ROW_DELAY_S)
+        _process_hcad_search_group(indexed_rows, member_positions, playwright_page, enriched_rows)
+    HCAD_SPECULATIVE_POOL.shutdown()
+    HCAD_DETAIL_BACKFILL.apply(enriched_rows)
+    fetch_heavy_hcad_details(enriched_rows)
+    score_hcad_owner_matches(enriched_rows)
+
+    _print_hcad_run_summary(indexed_rows, search_groups)
+    return pd.DataFrame(enriched_rows)
+
+
+def _hcad_error_row(rp_row, status, reason):
+    """Builds an output row for an input row that could not be processed at all."""
+    output_row = rp_row.to_dict()
+    for col in HCAD_OUTPUT_COLS_TO_INIT:
+        if col not in output_row: output_row[col] = None
+    output_row['hcad_search_status'] = status
+    output_row['hcad_final_tier_hit'] = "N/A"
+    output_row['hcad_owner_match_type'] = status
+    output_row['needs_review_flag'] = 1
+    output_row['review_reason'] = reason
+    return output_row
+
+
+def _hcad_worker(worker_id, group_queue, indexed_rows, enriched_rows):
+    """Worker thread: owns one browser and page, and processes queued search groups until the queue is empty."""
+    groups_done = 0
+    try:
+        # Playwright's sync API is bound to the thread that started it, so each worker runs its own instance.
+        with sync_playwright() as p:
+            browser = p.chromium.launch(**HCAD_BROWSER_LAUNCH_OPTIONS)
+            try:
+                page = browser.new_context(**HCAD_BROWSER_CONTEXT_OPTIONS).new_page()
+                while True:
+                    try:
+                        member_positions = group_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if groups_done > 0: time.sleep(HCAD_ROW_DELAY_S)
+                    try:
+                        _process_hcad_search_group(indexed_rows, member_positions, page, enriched_rows)
+                    except Exception as e_row:
+                        index = indexed_rows[member_positions[0]][0]
+                        print(f"ERROR: [Worker {worker_id}] Unhandled exception for input row {index}: {e_row}")
+                        traceback.print_exc()
+                        for position in member_positions:
+                            if enriched_rows[position] is None:
+                                enriched_rows[position] = _hcad_error_row(indexed_rows[position][1], "ERROR_WORKER_EXCEPTION", f"Worker exception: {e_row}")
+                    groups_done += 1
+            finally:
+                browser.close()
+    except Exception as e_worker:
+        print(f"ERROR: [Worker {worker_id}] Worker stopped: {e_worker}")
+        traceback.print_exc()
+    print(f"INFO: [Worker {worker_id}] Finished after {groups_done} search group(s).")
 
-    return pd.DataFrame(all_enriched_data)
+
+def main_hcad_processing_loop_concurrent(df_processed_input, num_workers=None):
+    """
+    Concurrent counterpart of main_hcad_processing_loop. Starts num_workers (default HCAD_NUM_WORKERS)
+    threads that each own a browser, feeds them search groups from a shared queue, and returns the
+    enriched rows in input order. HCAD_REQUEST_THROTTLE bounds the combined request rate.
+    """
+    global HCAD_REQUEST_THROTTLE
+    indexed_rows = list(df_processed_input.iterrows())
+    if not indexed_rows:
+        return pd.DataFrame()
+    search_groups = plan_hcad_search_groups(indexed_rows)
+    num_workers = max(1, min(num_workers or HCAD_NUM_WORKERS, len(search_groups)))
+    request_ceiling = HCAD_MAX_REQUESTS_PER_MINUTE if num_workers > 1 else 0
+    print(f"INFO: Starting {num_workers} HCAD worker(s) for {len(indexed_rows)} row(s). Request ceiling: {request_ceiling or 'none'}/min.")
+    HCAD_REQUEST_THROTTLE = HcadRequestThrottle(request_ceiling)
+
+    group_queue = queue.Queue()
+    for member_positions in search_groups:
+        group_queue.put(member_positions)
+    enriched_rows = [None] * len(indexed_rows)
+
+    workers = [
+        threading.Thread(target=_hcad_worker, args=(worker_id, group_queue, indexed_rows, enriched_rows), name=f"hcad-worker-{worker_id}")
+        for worker_id in range(1, num_workers + 1)
+    ]
+    run_started = time.monotonic()
+    for worker in workers: worker.start()
+    for worker in workers: worker.join()
+    HCAD_SPECULATIVE_POOL.shutdown()
+
+    for row_position, enriched_row in enumerate(enriched_rows):
+        if enriched_row is None:
+            enriched_rows[row_position] = _hcad_error_row(indexed_rows[row_position][1], "ERROR_ROW_NOT_PROCESSED", "No worker was able to process this row")
+    HCAD_DETAIL_BACKFILL.apply(enriched_rows)
+    fetch_heavy_hcad_details(enriched_rows)
+    score_hcad_owner_matches(enriched_rows)
+
+    print(f"INFO: Concurrent run finished in {time.monotonic() - run_started:.1f}s. HCAD requests issued: {HCAD_REQUEST_THROTTLE.requests_issued}.")
+    _print_hcad_run_summary(indexed_rows, search_groups)
+    return pd.DataFrame(enriched_rows)
+
+
+def save_enriched_output(enriched_df, output_folder="HCAD_Enrichment_Extractions"):
+    """Writes the enriched rows to a timestamped CSV and returns its path."""
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_filepath = os.path.join(output_folder, f"script4_hcad_enriched_{timestamp}.csv")
+    enriched_df.to_csv(output_filepath, index=False)
+    print(f"\nINFO: Enriched data saved to: {output_filepath}")
+    return output_filepath
 
 # The if __name__ == '__main__': block should be the one that loads your
 # QA SAMPLE CSV, preprocesses it, and then filters for 'High' confidence records,
@@ -1781,34 +3855,48 @@ if __name__ == '__main__':
         if not df_to_process_final.empty:
             # --- MODIFIED: Updated print statement for clarity ---
             print(f"INFO: Processing {len(df_to_process_final)} records where 'is_potential_decedent_match' is True.")
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True, slow_mo=100)
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
-                    viewport={'width': 1280, 'height': 1024}, locale='en-US',
-                    timezone_id='America/Chicago', java_script_enabled=True,
-                )
-                page = context.new_page()
+            if HCAD_BULK_EXTRACT_MODE:
+                if not HCAD_BULK_EXTRACT.is_loaded():
+                    print(f"ERROR: HCAD_BULK_EXTRACT_MODE is on but {HCAD_BULK_EXTRACT_DB_PATH} holds no accounts. Run scripts/load_hcad_bulk_extract.py first.")
+                else:
+                    try:
+                        enriched_df = main_hcad_processing_loop(df_to_process_final, None)
+                        print("\n\n--- ENRICHED DATA (From 'is_potential_decedent_match' Filter, bulk extract) ---")
+                        if not enriched_df.empty:
+                            save_enriched_output(enriched_df)
+                    except Exception as main_e:
+                        print(f"FATAL ERROR: {main_e}");
+                        import traceback; traceback.print_exc()
+                    finally:
+                        print("Processing finished.")
+            elif HCAD_NUM_WORKERS > 1:
                 try:
-                    enriched_df = main_hcad_processing_loop(df_to_process_final, page)
+                    enriched_df = main_hcad_processing_loop_concurrent(df_to_process_final)
                     print("\n\n--- ENRICHED DATA (From 'is_potential_decedent_match' Filter) ---")
                     if not enriched_df.empty:
-                        # ... (display and output logic) ...
-                        output_folder = "HCAD_Enrichment_Extractions"
-                        if not os.path.exists(output_folder):
-                           os.makedirs(output_folder)
-                        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                        output_filename = f"script4_hcad_enriched_{timestamp}.csv"
-                        output_filepath = os.path.join(output_folder, output_filename)
-                        enriched_df.to_csv(output_filepath, index=False)
-                        print(f"\nINFO: Enriched data saved to: {output_filepath}")
+                        save_enriched_output(enriched_df)
                 except Exception as main_e:
                     print(f"FATAL ERROR: {main_e}");
                     import traceback; traceback.print_exc()
                 finally:
-                    print("Processing finished.");
-                    if os.name != 'posix': input("Press Enter to close browser...")
-                    browser.close()
+                    print("Processing finished.")
+            else:
+                with sync_playwright() as p:
+                    browser = p.chromium.launch(**HCAD_BROWSER_LAUNCH_OPTIONS)
+                    context = browser.new_context(**HCAD_BROWSER_CONTEXT_OPTIONS)
+                    page = context.new_page()
+                    try:
+                        enriched_df = main_hcad_processing_loop(df_to_process_final, page)
+                        print("\n\n--- ENRICHED DATA (From 'is_potential_decedent_match' Filter) ---")
+                        if not enriched_df.empty:
+                            save_enriched_output(enriched_df)
+                    except Exception as main_e:
+                        print(f"FATAL ERROR: {main_e}");
+                        import traceback; traceback.print_exc()
+                    finally:
+                        print("Processing finished.");
+                        if os.name != 'posix': input("Press Enter to close browser...")
+                        browser.close()
         else:
             # --- MODIFIED: Updated print statement for clarity ---
             print("INFO: No records found where 'is_potential_decedent_match' is True. Exiting.")
@@ -0,0 +1,40 @@
+# benchmark_hcad_detail_parse.py
+#
+# Compares per-page parse time of the original locator-based HCAD detail parser with the
+# single-snapshot lxml parser in script4_hcad_enrichment.py, and reports any field that differs.
+#
+#   python scripts/benchmark_hcad_detail_parse.py "https://public.hcad.org/records/details.asp?...&acct=0123456789012"
+#   python scripts/benchmark_hcad_detail_parse.py saved_detail_page_1.html saved_detail_page_2.html --repeats 5
+#
+# Saved .html files are loaded with set_content, so they need no network access. The browser uses the
+# same launch/context options as the enrichment run (including slow_mo), which is what the locator engine pays for.
+
+import argparse
+import os
+import sys
+
+from playwright.sync_api import sync_playwright
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import script4_hcad_enrichment as hcad  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HCAD detail page parsing: locator vs snapshot engine.")
+    parser.add_argument("pages", nargs="+", help="Detail page URLs and/or saved detail page .html files")
+    parser.add_argument("--repeats", type=int, default=3, help="Parses per page and engine; the fastest is reported")
+    args = parser.parse_args()
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(**hcad.HCAD_BROWSER_LAUNCH_OPTIONS)
+        context = browser.new_context(**hcad.HCAD_BROWSER_CONTEXT_OPTIONS)
+        page = context.new_page()
+        try:
+            results = hcad.benchmark_hcad_detail_parse(page, args.pages, repeats=args.repeats)
+        finally:
+            browser.close()
+    return 1 if any(r["mismatched_keys"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# benchmark_rp_results_parse.py
+#
+# Times the RP scraper's results-table parsing on saved results pages (the debug_targetsearch_after_tier_click_*
+# dumps in data/targeted_results). Without --browser only the "snapshot" engine runs: the results table is cut
+# out of each page with lxml and parsed in-process. With --browser each page is loaded into headless Chromium,
+# the table is located the way the scraper does it, and both engines run against it; their records must match.
+# Compressed dumps from the scraper's debug artifact folder (.html.gz, and .html.zst with zstandard) also work.
+#
+#   python scripts/benchmark_rp_results_parse.py
+#   python scripts/benchmark_rp_results_parse.py --browser --repeats 3
+
+import argparse
+import contextlib
+import glob
+import gzip
+import importlib.util
+import io
+import os
+import sys
+import time
+
+import lxml.html
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_FIXTURE_GLOB = os.path.join(REPO_DIR, "data", "targeted_results", "debug_targetsearch_after_tier_click_*.html")
+
+
+def load_rp_scraper():
+    spec = importlib.util.spec_from_file_location("rp_scraper", os.path.join(SCRIPTS_DIR, "harris_property_scraper v3 phase 2 & 3.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_saved_page(path):
+    if path.endswith(".zst"):
+        import zstandard
+        with open(path, "rb") as f:
+            return zstandard.ZstdDecompressor().stream_reader(f).read().decode("utf-8", errors="replace")
+    with (gzip.open(path, "rt", encoding="utf-8", errors="replace") if path.endswith(".gz")
+          else open(path, encoding="utf-8", errors="replace")) as f:
+        return f.read()
+
+
+def results_table_inner_html(page_html):
+    """inner_html of the saved page's results table (the first table with a 'File Number' header row), or None."""
+    tree = lxml.html.fromstring(page_html)
+    for table in tree.xpath("//table[@id='ctl00_ContentPlaceHolder1_gvSearchResults'] | //table[.//tr[contains(., 'File Number')]]"):
+        if len(table.xpath(".//tr")) > 1:
+            inner_html = table.text or ""
+            return inner_html + "".join(lxml.html.tostring(child, encoding="unicode") for child in table)
+    return None
+
+
+def timed(fn, repeats):
+    """(result of the last call, best wall time in ms over repeats calls). Parser logging is swallowed."""
+    best_ms, result = None, None
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = fn()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        best_ms = elapsed_ms if best_ms is None else min(best_ms, elapsed_ms)
+    return result, best_ms
+
+
+def run_snapshot_only(rp, fixture_paths, repeats):
+    total_ms = 0.0
+    for path in fixture_paths:
+        table_html = results_table_inner_html(read_saved_page(path))
+        if table_html is None:
+            print(f"  {os.path.basename(path)}: no results table, skipped")
+            continue
+        records, snapshot_ms = timed(lambda: rp.extract_data_from_results_html(table_html, 1), repeats)
+        total_ms += snapshot_ms
+        print(f"  {os.path.basename(path)}: {len(records)} records, snapshot {snapshot_ms:.1f} ms")
+    print(f"Total snapshot parse time: {total_ms:.1f} ms")
+    return 0
+
+
+def run_with_browser(rp, fixture_paths, repeats):
+    from playwright.sync_api import sync_playwright
+
+    mismatches, totals = 0, {"snapshot": 0.0, "locator": 0.0}
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        for path in fixture_paths:
+            page.set_content(read_saved_page(path), wait_until="domcontentloaded")
+            with contextlib.redirect_stdout(io.StringIO()):
+                table_locator = rp.locate_results_table_rp(page)
+            if table_locator is None:
+                print(f"  {os.path.basename(path)}: no results table, skipped")
+                continue
+            results = {}
+            for engine in ("snapshot", "locator"):
+                rp.RP_RESULTS_PARSE_ENGINE = engine
+                results[engine], engine_ms = timed(lambda: rp.extract_data_from_current_page_rp(table_locator, 1), repeats)
+                totals[engine] += engine_ms
+                results[engine + "_ms"] = engine_ms
+            same = results["snapshot"] == results["locator"]
+            mismatches += 0 if same else 1
+            print(f"  {os.path.basename(path)}: {len(results['locator'])} records, "
+                  f"locator {results['locator_ms']:.1f} ms, snapshot {results['snapshot_ms']:.1f} ms"
+                  f"{'' if same else '  RECORDS DIFFER'}")
+        browser.close()
+    print(f"Total: locator {totals['locator']:.1f} ms, snapshot {totals['snapshot']:.1f} ms")
+    if mismatches:
+        print(f"ERROR: {mismatches} page(s) parsed differently by the two engines.")
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RP results-table parsing on saved results pages.")
+    parser.add_argument("fixtures", nargs="*", help=f"Saved results pages (default: {DEFAULT_FIXTURE_GLOB})")
+    parser.add_argument("--browser", action="store_true", help="Also run the locator engine in headless Chromium and compare")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per page; the best time is reported (default: 5)")
+    args = parser.parse_args()
+
+    fixture_paths = args.fixtures or sorted(glob.glob(DEFAULT_FIXTURE_GLOB))
+    if not fixture_paths:
+        print(f"ERROR: no saved results pages match {DEFAULT_FIXTURE_GLOB}")
+        return 1
+    rp = load_rp_scraper()
+    if args.browser:
+        return run_with_browser(rp, fixture_paths, args.repeats)
+    return run_snapshot_only(rp, fixture_paths, args.repeats)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
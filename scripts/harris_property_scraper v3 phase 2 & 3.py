@@ -8,7 +8,17 @@ from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeo
 import time
 import csv 
 import json 
+import sqlite3
+import sys
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
+from html import escape as html_escape
+import lxml.html
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent)) # Repo root, for debug_artifacts
+from debug_artifacts import DebugArtifactWriter # noqa: E402
 
 # --- Precompiled Regex & Constants ---
 LEGAL_PATTERNS = {
@@ -45,6 +55,60 @@ MAX_ROWS_TO_DEBUG_HTML = 3
 MIN_MAIN_RECORD_CELLS_FLEXIBLE = 5 
 MAX_CONSECUTIVE_EMPTY_PAGES_TARGETED = 2
 
+# --- Results Table Parsing ---
+# "snapshot" captures each results page's table with a single inner_html() call and walks it in-process with
+# lxml; "locator" reads it cell by cell through Playwright locators (a browser round trip per cell). Both
+# should produce the same rp_* records (the snapshot skips hidden and display:none elements the way inner_text
+# does). Switch to "snapshot" once `python scripts/benchmark_rp_results_parse.py --browser` reports no
+# differences on current results pages.
+RP_RESULTS_PARSE_ENGINE = "locator"
+
+# --- Parallel Lead Processing ---
+# RP_NUM_WORKERS > 1 processes leads concurrently: an asyncio loop runs RP_NUM_WORKERS worker threads that each
+# own a sync Playwright browser context (the sync API is bound to the thread that started it) and pull leads
+# from a shared queue. RP_MAX_REQUESTS_PER_MINUTE caps portal loads, searches and Next clicks across all
+# workers (0 = no cap); it only applies when workers run, a single page is paced by RP_DELAY_BETWEEN_LEADS_MS
+# alone. Output rows keep the input lead order either way.
+RP_NUM_WORKERS = 1
+RP_MAX_REQUESTS_PER_MINUTE = 40
+RP_DELAY_BETWEEN_LEADS_MS = 1000 # Per page (per worker)
+STOP_AFTER_FIRST_SUCCESSFUL_LEAD = False # Testing: stop once a lead returns rows (with workers, leads in flight still finish)
+RP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36"
+
+# --- Persistent Search Cache ---
+# Every portal search's parsed rp_* records are stored in SQLite under (standardized search name, date-from,
+# date-to, max pages per tier) with the time they were fetched, so re-runs and leads sharing a search name
+# don't repeat it. A search is answered from the cache when it repeats a stored key exactly, or when its date
+# window lies inside a stored window for the same name whose search ran to the last results page; the stored
+# records are then filtered to the requested window by rp_file_date. Entries older than
+# RP_SEARCH_CACHE_TTL_DAYS are searched again (recent filings keep appearing on the portal).
+RP_SEARCH_CACHE_ENABLED = True
+RP_SEARCH_CACHE_DB_PATH = Path("rp_cache") / "rp_search_cache.sqlite3"
+RP_SEARCH_CACHE_TTL_DAYS = 7
+
+# --- Search Planning ---
+# Each lead searches its filing date +/- RP_SEARCH_WINDOW_DAYS. With RP_COALESCE_LEAD_WINDOWS on (it needs the
+# search cache), the leads are planned before any is processed: their Tier 1 and Tier 2 nickname search names are
+# grouped, each name's lead windows are merged where they overlap (a union is never wider than
+# RP_COALESCE_MAX_UNION_DAYS), and every union window covering two or more distinct lead windows is searched once
+# up front (max_pages_per_tier pages per lead window it covers). Each lead's own searches are then answered from the
+# cache, filtered to its window. A union that stops at its page limit (or fails) cannot serve its leads, which then
+# search their own windows: the end-of-run report counts those unions as wasted searches. Tier 3 names are not
+# planned, as they only run when the earlier tiers find nothing. Off by default until the report shows it pays off.
+RP_SEARCH_WINDOW_DAYS = 365
+RP_COALESCE_LEAD_WINDOWS = False
+RP_COALESCE_MAX_UNION_DAYS = 2 * RP_SEARCH_WINDOW_DAYS + 183 # Merges filings up to ~6 months apart
+
+# --- Debug Artifacts ---
+# Screenshots and HTML dumps go to RP_ARTIFACT_DIR through the background writer in debug_artifacts.py (modes,
+# compression and retention are described there). The after-search screenshot and HTML pair is the routine
+# capture that "sampled" keeps RP_ARTIFACT_SAMPLE_PERCENT % of; everything else is an error capture.
+RP_ARTIFACT_MODE = "on_error"
+RP_ARTIFACT_SAMPLE_PERCENT = 5
+RP_ARTIFACT_DIR = OUTPUT_DIR / "debug_artifacts"
+RP_ARTIFACT_MAX_FILES = 200
+RP_ARTIFACT_QUEUE_SIZE = 32
+
 TIER_SETTINGS = {
     "enable_tier_3": False, 
     "max_pages_per_tier": 2, 
@@ -100,7 +164,139 @@ def _nickname_variants(first_name: str, nickname_map: dict) -> list[str]:
 # --- End of new additions ---
 
 
-def ts_print(message: str): print(f"[{datetime.now().isoformat()}] {message}")
+def ts_print(message: str):
+    thread_name = threading.current_thread().name
+    thread_tag = f"[{thread_name}] " if thread_name.startswith("rp-worker") else ""
+    print(f"[{datetime.now().isoformat()}] {thread_tag}{message}")
+
+
+class RpRequestThrottle:
+    """Shared pacing gate for cclerk.hctx.net: every caller reserves the next free slot, across all worker threads."""
+
+    def __init__(self, max_per_minute: int):
+        self.min_interval_s = 60.0 / max_per_minute if max_per_minute else 0.0
+        self.requests_issued = 0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval_s
+            self.requests_issued += 1
+        if slot > now: time.sleep(slot - now)
+
+
+RP_REQUEST_THROTTLE = RpRequestThrottle(0) # Replaced with the RP_MAX_REQUESTS_PER_MINUTE cap when workers start
+
+
+RP_ARTIFACTS = DebugArtifactWriter(RP_ARTIFACT_DIR, RP_ARTIFACT_MODE, RP_ARTIFACT_SAMPLE_PERCENT, RP_ARTIFACT_MAX_FILES, RP_ARTIFACT_QUEUE_SIZE, log=ts_print)
+
+
+def _parse_rp_date(date_str: str) -> date | None:
+    try: return datetime.strptime(str(date_str).strip(), "%m/%d/%Y").date()
+    except ValueError: return None
+
+
+class RpSearchCache:
+    """
+    SQLite-backed store of portal search results that survives between runs. Rows are keyed on
+    (search name, date-from, date-to, max pages); complete is 1 when the search reached the last
+    results page rather than stopping at the page limit, which is what lets it serve narrower windows.
+    """
+
+    def __init__(self, db_path: Path, ttl_days: float):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_days * 86400
+        self.exact_hits = 0
+        self.window_hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_name(search_name: str) -> str:
+        return " ".join(str(search_name).upper().split())
+
+    def _connection(self):
+        # Opened lazily so importing the script never touches the disk.
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS rp_search_result (
+                    search_name TEXT NOT NULL,
+                    date_from TEXT NOT NULL,
+                    date_to TEXT NOT NULL,
+                    max_pages INTEGER NOT NULL,
+                    complete INTEGER NOT NULL,
+                    records_json TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (search_name, date_from, date_to, max_pages)
+                )
+            """)
+        return self._conn
+
+    def get(self, search_name: str, date_from: date, date_to: date, max_pages: int) -> list | None:
+        """Cached records for the search, filtered to [date_from, date_to] when served from a wider window; else None."""
+        return self.lookup(search_name, date_from, date_to, max_pages)[0]
+
+    def lookup(self, search_name: str, date_from: date, date_to: date, max_pages: int) -> tuple[list | None, bool]:
+        """(get's records, whether the entry they came from is complete). (None, False) on a miss."""
+        name = self._normalize_name(search_name)
+        fresh_after = time.time() - self.ttl_seconds
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT records_json, complete FROM rp_search_result WHERE search_name = ? AND date_from = ? AND date_to = ? "
+                "AND max_pages = ? AND fetched_at >= ?", (name, date_from.isoformat(), date_to.isoformat(), max_pages, fresh_after)).fetchone()
+            if row:
+                self.exact_hits += 1
+                return json.loads(row[0]), bool(row[1])
+            row = conn.execute(
+                "SELECT records_json, date_from, date_to FROM rp_search_result WHERE search_name = ? AND complete = 1 "
+                "AND date_from <= ? AND date_to >= ? AND fetched_at >= ? ORDER BY julianday(date_to) - julianday(date_from) ASC LIMIT 1",
+                (name, date_from.isoformat(), date_to.isoformat(), fresh_after)).fetchone()
+            if not row:
+                self.misses += 1
+                return None, False
+            self.window_hits += 1
+        records = json.loads(row[0])
+        if (row[1], row[2]) == (date_from.isoformat(), date_to.isoformat()):
+            return records, True
+        return [rec for rec in records if (rec_date := _parse_rp_date(rec.get("rp_file_date", ""))) and date_from <= rec_date <= date_to], True
+
+    def put(self, search_name: str, date_from: date, date_to: date, max_pages: int, records: list, complete: bool):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO rp_search_result (search_name, date_from, date_to, max_pages, complete, records_json, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._normalize_name(search_name), date_from.isoformat(), date_to.isoformat(), max_pages,
+                 1 if complete else 0, json.dumps(records), time.time()))
+            conn.execute("DELETE FROM rp_search_result WHERE fetched_at < ?", (time.time() - self.ttl_seconds,))
+            conn.commit()
+
+    def stats_line(self) -> str:
+        return f"exact hits={self.exact_hits}, window hits={self.window_hits}, misses={self.misses}"
+
+
+RP_SEARCH_CACHE = RpSearchCache(RP_SEARCH_CACHE_DB_PATH, RP_SEARCH_CACHE_TTL_DAYS)
+
+RP_SEARCH_COUNTS = {"portal_searches": 0, "cache_served": 0, "union_complete": 0, "union_wasted": 0, "union_cached": 0}
+RP_SEARCH_COUNTS_LOCK = threading.Lock()
+
+
+def _count_rp_search(event: str):
+    with RP_SEARCH_COUNTS_LOCK:
+        RP_SEARCH_COUNTS[event] += 1
+
+
+# Per worker thread (each owns one page): the lead being searched, whether its page has been loaded yet and the
+# outcome of every search it ran. Set by search_rp_for_decedent_and_extract; union searches run without it.
+_RP_LEAD_STATE = threading.local()
+
 
 def clean_cell_text(raw_text: str) -> str:
     if raw_text is None: return ""
@@ -176,6 +372,14 @@ def verify_rp_form_ready(page: Page, timeout_ms: int = DEFAULT_ELEMENT_TIMEOUT)
     except PlaywrightTimeout as pte: ts_print(f"  [WARN] RP Inputs/Btn not vis/enabled (Timeout: {pte})."); _capture_screenshot(page, "form_verify_timeout"); return False
     except Exception as e: ts_print(f"  [ERROR verify_rp_form_ready] Error: {e}"); _capture_screenshot(page, "form_verify_exception"); return False
 
+def rp_no_records_message_shown(page: Page) -> bool:
+    """True if the portal is showing its 'No records found.' message (lblCount) for the last search."""
+    no_records_loc = page.get_by_text("No Records Found", exact=False)
+    try:
+        return no_records_loc.count() > 0 and no_records_loc.first.is_visible(timeout=3000)
+    except Exception:
+        return False
+
 def locate_results_table_rp(page: Page) -> Locator | None: 
     selectors = ["table#ctl00_ContentPlaceHolder1_gvSearchResults","table:has(tr:has-text('File Number'))","table:has(tr:has-text('Instrument Type'))","table:has(tr:has-text('RP-'))","table#ItemPlaceholderContainer","table.table-striped.table-condensed","table.table-striped", "table.grid", "table.results", "table:visible"]
     located_table: Locator | None = None
@@ -191,11 +395,7 @@ def locate_results_table_rp(page: Page) -> Locator | None:
                 except: continue
             if located_table: break 
     if not located_table:
-        no_records_loc = page.get_by_text("No Records Found", exact=False)
-        if no_records_loc.count() > 0:
-            try:
-                if no_records_loc.first.is_visible(timeout=3000): ts_print("    [INFO] 'No Records Found' message detected. No table to return."); return None
-            except: pass 
+        if rp_no_records_message_shown(page): ts_print("    [INFO] 'No Records Found' message detected. No table to return."); return None
         ts_print("    [WARN] No suitable results table found after trying all selectors, and no clear 'No Records' message.");
         return None
     return located_table
@@ -293,17 +493,126 @@ def parse_parties_from_names_column(names_text: str, file_number: str, page_num:
     if matches_found: ts_print(f"{log_prefix} Parsed from Names Column: GTRs={len(grantors)}, GTEs={len(grantees)}, TRs={len(trustees)}")
     return grantors, grantees, trustees
 
+class _LocatorRowRP:
+    """Cell access for one results-table <tr> through Playwright locators: every call is a browser round trip."""
+
+    def __init__(self, tr_locator: Locator):
+        self.tr_locator = tr_locator
+        self.td_locators = tr_locator.locator("td")
+        self._num_tds = None
+
+    @property
+    def num_tds(self) -> int:
+        if self._num_tds is None: self._num_tds = self.td_locators.count()
+        return self._num_tds
+
+    def cell_text(self, cell_idx: int, timeout_ms: int) -> str:
+        return self.td_locators.nth(cell_idx).inner_text(timeout=timeout_ms)
+
+    def cell_html(self, cell_idx: int, timeout_ms: int) -> str:
+        return self.td_locators.nth(cell_idx).inner_html(timeout=timeout_ms)
+
+    def cell_span_text(self, cell_idx: int, timeout_ms: int) -> str | None:
+        """inner_text of the cell's first <span>, or None if it has none."""
+        span_in_td = self.td_locators.nth(cell_idx).locator("span")
+        return span_in_td.first.inner_text(timeout=timeout_ms) if span_in_td.count() > 0 else None
+
+    def row_html(self) -> str:
+        return self.tr_locator.inner_html(timeout=500)
+
+
+_SNAPSHOT_BREAK_TAGS_RP = {"br", "td", "th", "tr", "table", "tbody", "thead", "tfoot", "div", "p", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6"}
+_SNAPSHOT_SKIP_TAGS_RP = {"script", "style", "noscript", "template", "head", "title"}
+
+
+def _snapshot_hidden_rp(element) -> bool:
+    """True for elements the browser does not render: the hidden attribute, or an inline display:none / visibility:hidden."""
+    if element.get("hidden") is not None: return True
+    style = "".join((element.get("style") or "").lower().split())
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def _snapshot_text_rp(element) -> str:
+    """
+    Text of an lxml element as inner_text would give it once passed through clean_cell_text: text is
+    concatenated, with a break at cell, row, block and <br> boundaries, and hidden descendants are left out.
+    Like inner_text, an element that is itself hidden (or inside a hidden ancestor) gives all of its text.
+    """
+    pieces = []
+    skip_hidden = not any(_snapshot_hidden_rp(node) for node in (element, *element.iterancestors()))
+    def collect(node):
+        if not isinstance(node.tag, str) or node.tag in _SNAPSHOT_SKIP_TAGS_RP: return
+        if skip_hidden and node is not element and _snapshot_hidden_rp(node): return
+        is_break = node.tag in _SNAPSHOT_BREAK_TAGS_RP
+        if is_break: pieces.append(" ")
+        if node.text: pieces.append(node.text)
+        for child in node:
+            collect(child)
+            if child.tail: pieces.append(child.tail)
+        if is_break: pieces.append(" ")
+    collect(element)
+    return "".join(pieces)
+
+
+class _SnapshotRowRP:
+    """Cell access for one results-table <tr> parsed with lxml from a single inner_html() capture."""
+
+    def __init__(self, tr_element):
+        self.tr_element = tr_element
+        self.td_elements = tr_element.xpath(".//td")
+        self.num_tds = len(self.td_elements)
+
+    def cell_text(self, cell_idx: int, timeout_ms: int = 0) -> str:
+        return _snapshot_text_rp(self.td_elements[cell_idx])
+
+    def cell_html(self, cell_idx: int, timeout_ms: int = 0) -> str:
+        return _snapshot_inner_html_rp(self.td_elements[cell_idx])
+
+    def cell_span_text(self, cell_idx: int, timeout_ms: int = 0) -> str | None:
+        spans = self.td_elements[cell_idx].xpath(".//span")
+        return _snapshot_text_rp(spans[0]) if spans else None
+
+    def row_html(self) -> str:
+        return _snapshot_inner_html_rp(self.tr_element)
+
+
+def _snapshot_inner_html_rp(element) -> str:
+    inner_html = html_escape(element.text, quote=False) if element.text else ""
+    return inner_html + "".join(lxml.html.tostring(child, encoding="unicode") for child in element)
+
+
+def extract_data_from_results_html(table_inner_html: str, page_num_for_log: int) -> list:
+    """extract_data_from_current_page_rp for a results table captured with inner_html(), parsed in-process with lxml."""
+    table_element = lxml.html.fragment_fromstring(f"<table>{table_inner_html}</table>")
+    return _extract_rp_records([_SnapshotRowRP(tr) for tr in table_element.xpath(".//tr")], page_num_for_log)
+
+
 def extract_data_from_current_page_rp(table_locator: Locator, page_num_for_log: int) -> list:
+    if RP_RESULTS_PARSE_ENGINE == "snapshot":
+        try:
+            table_inner_html = table_locator.inner_html(timeout=SEARCH_RESULTS_TIMEOUT)
+        except Exception as e_snapshot:
+            ts_print(f"  [WARN extract_data_rp] P{page_num_for_log}: Could not capture results table HTML ({e_snapshot}). Reading it cell by cell.")
+        else:
+            return extract_data_from_results_html(table_inner_html, page_num_for_log)
+    return _extract_rp_records([_LocatorRowRP(tr) for tr in table_locator.locator("tr").all()], page_num_for_log)
+
+
+def _extract_rp_records(rows: list, page_num_for_log: int) -> list:
+    """
+    Walks a results table's <tr> rows (every descendant row, nested tables included, in document order) and
+    returns the flattened rp_* records. rows are _LocatorRowRP or _SnapshotRowRP objects.
+    """
     recs = [] 
-    all_trs = table_locator.locator("tr").all(); num_total_trs = len(all_trs)
+    num_total_trs = len(rows)
     if num_total_trs == 0: ts_print(f"[WARN] P{page_num_for_log}: No <tr> elements found"); return []
     k = 0; main_records_on_page_count = 0 
     while k < num_total_trs:
-        current_tr = all_trs[k]; td_elements = current_tr.locator("td"); num_tds = td_elements.count()
+        current_tr = rows[k]; num_tds = current_tr.num_tds
         if main_records_on_page_count < MAX_ROWS_TO_DEBUG_HTML or k < (MAX_ROWS_TO_DEBUG_HTML * 3):
             ts_print(f"  [TR_DEBUG P{page_num_for_log}R{k+1}] Cells: {num_tds}")
             try:
-                for j_debug in range(min(num_tds, 7)): ts_print(f"    Cell {j_debug}: '{clean_cell_text(td_elements.nth(j_debug).inner_text(timeout=500))[:70]}'")
+                for j_debug in range(min(num_tds, 7)): ts_print(f"    Cell {j_debug}: '{clean_cell_text(current_tr.cell_text(j_debug, 500))[:70]}'")
             except Exception as e_dbg_detail: ts_print(f"    Debug error for P{page_num_for_log}R{k+1}: {e_dbg_detail}")
         
         file_number_text = ""; file_number_cell_idx = -1; is_main_record_row = False
@@ -312,7 +621,7 @@ def extract_data_from_current_page_rp(table_locator: Locator, page_num_for_log:
                 for cell_idx_check in [0, 1, 2]:  
                     if cell_idx_check < num_tds: 
                         try:
-                            text = clean_cell_text(td_elements.nth(cell_idx_check).inner_text(timeout=500))
+                            text = clean_cell_text(current_tr.cell_text(cell_idx_check, 500))
                             if any(text.startswith(prefix) for prefix in ["RP-", "RM-", "RT-"]):
                                 file_number_text = text; file_number_cell_idx = cell_idx_check; is_main_record_row=True; break
                         except: continue 
@@ -329,17 +638,16 @@ def extract_data_from_current_page_rp(table_locator: Locator, page_num_for_log:
                 ts_print(f"      [ROW_STRUCTURE_DEBUG P{page_num_for_log}R{k+1}] File#: {file_number_text}. Total cells: {num_tds}")
             try:
                 temp_rp_record = {"rp_file_number": file_number_text, "grantors": [], "grantees": [], "trustees": [] } # Temporary dict for RP data
-                temp_rp_record["rp_file_date"] = clean_cell_text(td_elements.nth(idx_file_date_actual).inner_text(timeout=500)) if num_tds > idx_file_date_actual else ""
-                type_vol_page_raw = clean_cell_text(td_elements.nth(idx_type_vol_page_actual).inner_text(timeout=500)) if num_tds > idx_type_vol_page_actual else ""
+                temp_rp_record["rp_file_date"] = clean_cell_text(current_tr.cell_text(idx_file_date_actual, 500)) if num_tds > idx_file_date_actual else ""
+                type_vol_page_raw = clean_cell_text(current_tr.cell_text(idx_type_vol_page_actual, 500)) if num_tds > idx_type_vol_page_actual else ""
                 temp_rp_record["rp_instrument_type"] = type_vol_page_raw.split()[0] if type_vol_page_raw else ""
                 
                 parsed_legal_data = extract_legal_description_from_html_table("", file_number_text, page_num_for_log, k) # Init with rp_ prefixed empty fields
                 html_content_type_A = ""
                 
                 if num_tds > idx_expected_html_legal_col:
-                    potential_legal_table_cell_loc = td_elements.nth(idx_expected_html_legal_col)
                     try:
-                        html_content_type_A = potential_legal_table_cell_loc.inner_html(timeout=1000)
+                        html_content_type_A = current_tr.cell_html(idx_expected_html_legal_col, 1000)
                         html_lower = html_content_type_A.lower()
                         if "<table" in html_lower and (any(id_marker.lower() in html_lower for id_marker in ['lblDesc', 'lblBlock', 'lblLot', 'lvLegal', 'lblSubDivAdd']) or any(text_marker.lower() in html_lower for text_marker in ['<b>desc:', '<b>lot:', '<b>block:'])):
                             ts_print(f"      [LEGAL_ATTEMPT_1 P{page_num_for_log}R{k+1}] td[{idx_expected_html_legal_col}] HAS HTML TABLE. Parsing with BS4.")
@@ -354,7 +662,7 @@ def extract_data_from_current_page_rp(table_locator: Locator, page_num_for_log:
                     for scan_i in range(scan_start_idx, scan_end_idx):
                         if scan_i == idx_expected_html_legal_col and html_content_type_A and "<table" in html_content_type_A.lower(): continue 
                         try:
-                            plain_text_content = clean_cell_text(td_elements.nth(scan_i).inner_text(timeout=500))
+                            plain_text_content = clean_cell_text(current_tr.cell_text(scan_i, 500))
                             if not plain_text_content or len(plain_text_content) < 5 : continue
                             if any(keyword.lower() in plain_text_content.lower() for keyword in ["Desc:", "Lot:", "Block:", "Sec:", "Subdivision:", "Abstract:", "Survey:", "Tract:"]):
                                 ts_print(f"        [LEGAL_ATTEMPT_2_SCAN P{page_num_for_log}R{k+1}] Found plain text in td[{scan_i}]: '{plain_text_content[:70]}'")
@@ -367,23 +675,23 @@ def extract_data_from_current_page_rp(table_locator: Locator, page_num_for_log:
                 temp_rp_record.update(parsed_legal_data) # Add legal fields to temp_rp_record
                 k_sub_loop_start_index = k + 1; next_outer_k = k_sub_loop_start_index 
                 for k_sub_idx in range(k_sub_loop_start_index, num_total_trs):
-                    sub_tr=all_trs[k_sub_idx]; sub_tds_loc=sub_tr.locator("td"); sub_num_tds=sub_tds_loc.count()
+                    sub_tr=rows[k_sub_idx]; sub_num_tds=sub_tr.num_tds
                     next_outer_k = k_sub_idx + 1 
                     is_next_main_record_sub = False
                     if sub_num_tds >= MIN_MAIN_RECORD_CELLS_FLEXIBLE:
                         try:
                             for sub_cell_idx_check in [0,1,2]:
                                 if sub_cell_idx_check < sub_num_tds:
-                                    text_check = clean_cell_text(sub_tds_loc.nth(sub_cell_idx_check).inner_text(timeout=200))
+                                    text_check = clean_cell_text(sub_tr.cell_text(sub_cell_idx_check, 200))
                                     if any(text_check.startswith(prefix) for prefix in ["RP-", "RM-", "RT-"]): is_next_main_record_sub = True; break
                             if is_next_main_record_sub: next_outer_k=k_sub_idx; break 
                         except: pass 
                     if sub_num_tds == 2:
                         try:
-                            label_text_raw = sub_tds_loc.nth(0).inner_text(timeout=500); label_cleaned = clean_cell_text(label_text_raw).upper()
-                            value_cell_loc = sub_tds_loc.nth(1); value_cleaned = clean_cell_text(value_cell_loc.inner_text(timeout=500))
-                            span_in_td = value_cell_loc.locator("span"); 
-                            if span_in_td.count() > 0: value_cleaned = clean_cell_text(span_in_td.first.inner_text(timeout=500))
+                            label_text_raw = sub_tr.cell_text(0, 500); label_cleaned = clean_cell_text(label_text_raw).upper()
+                            value_cleaned = clean_cell_text(sub_tr.cell_text(1, 500))
+                            span_text = sub_tr.cell_span_text(1, 500)
+                            if span_text is not None: value_cleaned = clean_cell_text(span_text)
                             party_found_in_subrow = False
                             if "GRANTOR" in label_cleaned: temp_rp_record["grantors"].append(parse_party_name(value_cleaned)); party_found_in_subrow = True
                             elif "GRANTEE" in label_cleaned: temp_rp_record["grantees"].append(parse_party_name(value_cleaned)); party_found_in_subrow = True
@@ -403,7 +711,7 @@ def extract_data_from_current_page_rp(table_locator: Locator, page_num_for_log:
                 if not temp_rp_record["grantors"] and not temp_rp_record["grantees"] and not temp_rp_record["trustees"]:
                     names_col_text = ""
                     if num_tds > idx_names_col_actual:
-                        try: names_col_text = clean_cell_text(td_elements.nth(idx_names_col_actual).inner_text(timeout=500))
+                        try: names_col_text = clean_cell_text(current_tr.cell_text(idx_names_col_actual, 500))
                         except Exception as e_names_col: ts_print(f"      [WARN P{page_num_for_log}R{k+1}] Could not read names column for fallback: {e_names_col}")
                     if names_col_text:
                         gtrs, gtes, trs = parse_parties_from_names_column(names_col_text, file_number_text, page_num_for_log, k) 
@@ -530,7 +838,7 @@ def extract_data_from_current_page_rp(table_locator: Locator, page_num_for_log:
             except Exception as e_main_proc:
                 ts_print(f"  [ERROR P{page_num_for_log}R{k+1}] Error processing main record: {e_main_proc}")
                 if main_records_on_page_count <= MAX_ROWS_TO_DEBUG_HTML:
-                    try: ts_print(f"    [DEBUG_HTML P{page_num_for_log}R{k+1}] HTML of problematic main row: {current_tr.inner_html(timeout=500)}")
+                    try: ts_print(f"    [DEBUG_HTML P{page_num_for_log}R{k+1}] HTML of problematic main row: {current_tr.row_html()}")
                     except: pass
         k += 1 
     ts_print(f"  [INFO extract_data_rp] P{page_num_for_log}: Extracted {len(recs)} rows (flattened) from {num_total_trs} TRs."); return recs
@@ -543,12 +851,83 @@ def _execute_single_search(
     search_date_from_str: str, search_date_to_str: str, 
     max_pages_this_tier: int, overall_attempt_num: int 
     ) -> list:
+    return _execute_single_search_with_outcome(page, search_name, tier_label, search_date_from_str, search_date_to_str, max_pages_this_tier, overall_attempt_num)[0]
+
+def _execute_single_search_with_outcome(
+    page: Page, search_name: str, tier_label: str,
+    search_date_from_str: str, search_date_to_str: str, 
+    max_pages_this_tier: int, overall_attempt_num: int 
+    ) -> tuple[list, str]:
+    """
+    _execute_single_search, also returning the _run_portal_search outcome ("CACHED" when served from a complete
+    cache entry, "CACHED_TRUNCATED" from one that stopped at the page limit).
+    """
+    records, search_outcome = _search_cached_or_portal(page, search_name, tier_label, search_date_from_str, search_date_to_str, max_pages_this_tier, overall_attempt_num)
+    search_outcomes = getattr(_RP_LEAD_STATE, "search_outcomes", None)
+    if search_outcomes is not None: search_outcomes.append(search_outcome)
+    return records, search_outcome
+
+def _search_cached_or_portal(
+    page: Page, search_name: str, tier_label: str,
+    search_date_from_str: str, search_date_to_str: str,
+    max_pages_this_tier: int, overall_attempt_num: int
+    ) -> tuple[list, str]:
+    if not RP_SEARCH_CACHE_ENABLED:
+        _ensure_rp_portal_loaded(page)
+        _count_rp_search("portal_searches")
+        return _run_portal_search(page, search_name, tier_label, search_date_from_str, search_date_to_str, max_pages_this_tier, overall_attempt_num)
+    date_from = _parse_rp_date(search_date_from_str); date_to = _parse_rp_date(search_date_to_str)
+    # Retry attempts (search_rp_for_decedent_and_extract) always go back to the portal.
+    cached_records, cached_complete = RP_SEARCH_CACHE.lookup(search_name, date_from, date_to, max_pages_this_tier) if overall_attempt_num <= 1 else (None, False)
+    if cached_records is not None:
+        _count_rp_search("cache_served")
+        for rec in cached_records:
+            rec["rp_found_by_search_term"] = search_name
+            rec["rp_search_tier"] = tier_label
+        ts_print(f"  [{tier_label}] '{search_name}' ({search_date_from_str}-{search_date_to_str}) served from the search cache: {len(cached_records)} rows.")
+        return cached_records, "CACHED" if cached_complete else "CACHED_TRUNCATED"
+    _ensure_rp_portal_loaded(page)
+    _count_rp_search("portal_searches")
+    records, search_outcome = _run_portal_search(page, search_name, tier_label, search_date_from_str, search_date_to_str, max_pages_this_tier, overall_attempt_num)
+    if search_outcome != "FAILED":
+        RP_SEARCH_CACHE.put(search_name, date_from, date_to, max_pages_this_tier, records, complete=search_outcome == "COMPLETE")
+    return records, search_outcome
+
+def _ensure_rp_portal_loaded(page: Page):
+    """The lead's initial portal load, done before its first search that actually needs the portal. Raises RuntimeError on failure."""
+    if getattr(_RP_LEAD_STATE, "portal_loaded", True): return # Loaded already, or not inside a lead (union searches)
+    lead_label = _RP_LEAD_STATE.lead_label
+    ts_print(f"  Initial navigation to {PORTAL_URL} for lead {lead_label}")
+    try:
+        RP_REQUEST_THROTTLE.wait()
+        page.goto(PORTAL_URL, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT_INITIAL); page.wait_for_timeout(1000)
+        if not verify_rp_form_ready(page, timeout_ms=PAGE_LOAD_TIMEOUT_INITIAL // 2):
+            _capture_screenshot(page, f"ts_initial_form_not_ready_{lead_label.replace(' ','_')}")
+            raise RuntimeError("RP Form not ready at initial load for lead.")
+    except Exception as e_initial_nav:
+        ts_print(f"[ERROR] Initial navigation/form ready check failed for lead {lead_label}: {e_initial_nav}")
+        _capture_screenshot(page, f"ts_initial_nav_failed_{lead_label.replace(' ','_')}")
+        raise RuntimeError(f"Initial navigation failed for lead {lead_label}: {e_initial_nav}")
+    _RP_LEAD_STATE.portal_loaded = True
+
+def _run_portal_search(
+    page: Page, search_name: str, tier_label: str,
+    search_date_from_str: str, search_date_to_str: str, 
+    max_pages_this_tier: int, overall_attempt_num: int 
+    ) -> tuple[list, str]:
+    """
+    Runs one Grantor-only portal search and returns (records, outcome). outcome is "COMPLETE" when the results
+    were read to the last page (or the portal said "No records found."), "TRUNCATED" when reading stopped early
+    (page limit, empty pages) and "FAILED" when the search broke off or no results table could be located.
+    """
     ts_print(f"  [{tier_label}] Attempting Grantor-ONLY search with name: '{search_name}'")
     records_for_this_search_term = []
+    search_outcome = "FAILED"
     try:
         ts_print(f"    [{tier_label}] Ensuring clean form state (navigating to portal)...")
         for nav_attempt in range(2): 
             try:
+                RP_REQUEST_THROTTLE.wait()
                 page.goto(PORTAL_URL, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT_HARD_RESET)
                 page.locator('input[name="ctl00$ContentPlaceHolder1$txtOR"]').wait_for(state="visible", timeout=DEFAULT_ELEMENT_TIMEOUT)
                 break
@@ -584,6 +963,7 @@ def _execute_single_search(
 
         search_button = page.locator('input[name="ctl00$ContentPlaceHolder1$btnSearch"]')
         ts_print(f"    [{tier_label}] Clicking search button...")
+        RP_REQUEST_THROTTLE.wait()
         search_button.click()
 
         try: 
@@ -591,19 +971,22 @@ def _execute_single_search(
         except PlaywrightTimeout: 
             ts_print(f"    [WARN {tier_label}] Timeout waiting for network idle for '{search_name}'. Proceeding.")
 
-        _capture_screenshot(page, f"ts_after_tier_click_{search_name.replace(' ','_')}_{tier_label}_att{overall_attempt_num}")
-        try:
-            html_dump_name = OUTPUT_DIR / f"debug_targetsearch_after_tier_click_{search_name.replace(' ','_')}_{tier_label}_att{overall_attempt_num}.html"
-            with open(html_dump_name, "w", encoding="utf-8") as f: f.write(page.content())
-        except Exception as e_html_dump: 
-            ts_print(f"    [WARN {tier_label}] Could not dump HTML: {e_html_dump}")
+        if RP_ARTIFACTS.should_capture(is_error=False): # One decision covers the screenshot and the HTML dump
+            dump_suffix = f"{search_name.replace(' ','_')}_{tier_label}_att{overall_attempt_num}_{datetime.now().strftime('%H%M%S')}"
+            try:
+                RP_ARTIFACTS.save_screenshot(page, f"debug_rp_targeted_ts_after_tier_click_{dump_suffix}")
+                RP_ARTIFACTS.save_html(page.content(), f"debug_targetsearch_after_tier_click_{dump_suffix}")
+            except Exception as e_html_dump: 
+                ts_print(f"    [WARN {tier_label}] Could not dump HTML: {e_html_dump}")
 
         table_l = locate_results_table_rp(page)
         if not table_l:
             ts_print(f"    [{tier_label}] No results table found for '{search_name}'.")
-            return []
+            # Only the portal's own "No records found." makes an empty result final; a table we failed to find is not.
+            return [], "COMPLETE" if rp_no_records_message_shown(page) else "FAILED"
 
         current_page_in_tier = 0; consecutive_empty_pages_this_tier = 0
+        search_outcome = "TRUNCATED"
         prev_first_rec_text_in_tier = f"INITIAL_FOR_TIER_{tier_label}_{search_name}"
         
         while current_page_in_tier < max_pages_this_tier:
@@ -612,7 +995,7 @@ def _execute_single_search(
             current_table_l = locate_results_table_rp(page) 
             if not current_table_l:
                 ts_print(f"    [ERROR {tier_label} P{page_num_for_logging}] Table disappeared for '{search_name}'. Ending tier.")
-                break
+                search_outcome = "FAILED"; break
             first_rec_sel_rel = "tr:not(:has(th)):first-of-type td:first-child"
             if current_table_l.locator("tbody").count() > 0: first_rec_sel_rel = "tbody tr:not(:has(th)):first-of-type td:first-child"
             curr_pg_first_rec_text_in_tier = ""
@@ -622,7 +1005,7 @@ def _execute_single_search(
                 except: pass
             if current_page_in_tier > 0 and curr_pg_first_rec_text_in_tier and curr_pg_first_rec_text_in_tier == prev_first_rec_text_in_tier:
                 ts_print(f"    [{tier_label} P{page_num_for_logging}] First record same as previous. End unique results for '{search_name}'.")
-                break
+                search_outcome = "COMPLETE"; break
             prev_first_rec_text_in_tier = curr_pg_first_rec_text_in_tier
             page_data = extract_data_from_current_page_rp(current_table_l, page_num_for_logging)
             if page_data:
@@ -641,20 +1024,22 @@ def _execute_single_search(
             next_btn = page.locator("#ctl00_ContentPlaceHolder1_BtnNext")
             if next_btn.count() == 0 or is_button_disabled(next_btn):
                 ts_print(f"    [{tier_label} P{page_num_for_logging}] No active Next. End results for '{search_name}'.")
-                break
+                search_outcome = "COMPLETE"; break
             current_page_in_tier += 1
             if current_page_in_tier >= max_pages_this_tier:
                 ts_print(f"    [{tier_label}] Reached max_pages_per_tier ({max_pages_this_tier}) for '{search_name}'.")
                 break
             ts_print(f"    [{tier_label}] Clicking Next for page {current_page_in_tier + 1} for '{search_name}'...")
+            RP_REQUEST_THROTTLE.wait()
             next_btn.click(); page.wait_for_timeout(POLITE_DELAY_AFTER_PAGINATION_CLICK_S * 1000 + 500)
             try: page.wait_for_load_state("domcontentloaded", timeout=SEARCH_RESULTS_TIMEOUT)
             except PlaywrightTimeout: ts_print(f"    [WARN {tier_label}] Timeout waiting for DOM load after Next.")
     except Exception as e:
         ts_print(f"  [ERROR {tier_label}] Search execution failed for '{search_name}': {e}")
+        search_outcome = "FAILED"
         _capture_screenshot(page, f"ts_error_in_tier_search_{search_name.replace(' ','_')}_{tier_label}_att{overall_attempt_num}")
     ts_print(f"  [{tier_label}] Finished Grantor-ONLY search for '{search_name}'. Found {len(records_for_this_search_term)} rows.")
-    return records_for_this_search_term
+    return records_for_this_search_term, search_outcome
 
 def execute_tiered_rp_search(
     page: Page, 
@@ -791,23 +1176,17 @@ def search_rp_for_decedent_and_extract(page: Page, lead_dict: dict, probate_fili
     ts_print(f"--- Starting RP Search Orchestration for: {decedent_last_raw}, {decedent_first_raw or ''} (Probate File Date: {probate_filing_date_obj}) ---")
     if not probate_filing_date_obj: 
         ts_print(f"[WARN] No valid probate filing date for {decedent_last_raw}. Skipping search."); return []
-    search_date_from = probate_filing_date_obj - timedelta(days=365); search_date_to = probate_filing_date_obj + timedelta(days=365)   
+    search_date_from, search_date_to = _rp_search_window(probate_filing_date_obj)
     search_date_from_str = search_date_from.strftime("%m/%d/%Y"); search_date_to_str = search_date_to.strftime("%m/%d/%Y")
     all_properties_for_decedent_this_lead = []
 
-    ts_print(f"  Initial navigation to {PORTAL_URL} for lead {decedent_last_raw}")
-    try:
-        page.goto(PORTAL_URL, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT_INITIAL); page.wait_for_timeout(1000)
-        if not verify_rp_form_ready(page, timeout_ms=PAGE_LOAD_TIMEOUT_INITIAL // 2):
-            _capture_screenshot(page, f"ts_initial_form_not_ready_{decedent_last_raw.replace(' ','_')}")
-            raise RuntimeError("RP Form not ready at initial load for lead.")
-    except Exception as e_initial_nav:
-        ts_print(f"[ERROR] Initial navigation/form ready check failed for lead {decedent_last_raw}: {e_initial_nav}")
-        _capture_screenshot(page, f"ts_initial_nav_failed_{decedent_last_raw.replace(' ','_')}")
-        return [] 
+    # The initial portal load waits for the first search that is not answered by the search cache.
+    _RP_LEAD_STATE.lead_label = decedent_last_raw
+    _RP_LEAD_STATE.portal_loaded = False
 
     for attempt in range(MAX_SEARCH_RETRIES_TARGETED + 1):
         overall_attempt_num_for_log = attempt + 1
+        _RP_LEAD_STATE.search_outcomes = []
         ts_print(f"[ATTEMPT {overall_attempt_num_for_log} of Tiered Search] For {decedent_last_raw}, {decedent_first_raw or ''}")
         try:
             tiered_results = execute_tiered_rp_search(
@@ -836,6 +1215,9 @@ def search_rp_for_decedent_and_extract(page: Page, lead_dict: dict, probate_fili
                 break 
             else:
                 ts_print(f"[ATTEMPT {overall_attempt_num_for_log}] No records found after all tiers for {decedent_last_raw}.")
+                search_outcomes = _RP_LEAD_STATE.search_outcomes
+                if search_outcomes and all(outcome == "CACHED" for outcome in search_outcomes):
+                    ts_print(f"  Every search was answered by a complete search cache entry. Not retrying."); break
                 if overall_attempt_num_for_log <= MAX_SEARCH_RETRIES_TARGETED :
                     ts_print(f"  No results in attempt {overall_attempt_num_for_log}. Will retry if allowed.")
         except RuntimeError as e_runtime:
@@ -853,29 +1235,178 @@ def search_rp_for_decedent_and_extract(page: Page, lead_dict: dict, probate_fili
                  page.wait_for_timeout(3000 * overall_attempt_num_for_log)
             else:
                 ts_print(f"[ERROR] All {MAX_SEARCH_RETRIES_TARGETED + 1} attempts failed for {decedent_last_raw}."); break
-                
+    _RP_LEAD_STATE.__dict__.clear()
+
     ts_print(f"--- Finished RP Search Orchestration for: {decedent_last_raw}, {decedent_first_raw or ''}. Found {len(all_properties_for_decedent_this_lead)} rows. ---")
     return all_properties_for_decedent_this_lead
 
-def _capture_screenshot(page, name_suffix): 
-    if page and not page.is_closed(): 
+def _capture_screenshot(page, name_suffix, is_error=True): 
+    if page and not page.is_closed() and RP_ARTIFACTS.should_capture(is_error): 
         try: 
             timestamp=datetime.now().strftime('%H%M%S')
-            filename = OUTPUT_DIR / f"debug_rp_targeted_{name_suffix}_{timestamp}.png"
-            page.screenshot(path=filename); ts_print(f"  [SCREENSHOT] Saved: {filename.name}")
+            RP_ARTIFACTS.save_screenshot(page, f"debug_rp_targeted_{name_suffix}_{timestamp}"); ts_print(f"  [SCREENSHOT] Queued: debug_rp_targeted_{name_suffix}_{timestamp}.png")
         except Exception as e_ss: ts_print(f"  [WARN _capture_screenshot] Failed: {e_ss}")
 
 # --- MODIFIED search_rp_for_decedent_and_extract to pass lead_dict and add lead data (v12.1) ---
 # ... (other functions remain the same) ...
 
+def _rp_search_window(probate_filing_date_obj: date) -> tuple[date, date]:
+    return probate_filing_date_obj - timedelta(days=RP_SEARCH_WINDOW_DAYS), probate_filing_date_obj + timedelta(days=RP_SEARCH_WINDOW_DAYS)
+
+def _planned_search_names(decedent_last: str, decedent_first: str, tier_settings_dict: dict) -> list[str]:
+    """The Tier 1 and Tier 2 nickname search names execute_tiered_rp_search will run for a lead, in order."""
+    search_names = [standardize_name_for_search(decedent_last, decedent_first)]
+    if decedent_first and decedent_first.strip():
+        max_variants = tier_settings_dict.get("max_nickname_variants_to_search", 3); variants_searched = 0
+        for nick in _nickname_variants(decedent_first, NICKNAME_MAP):
+            if variants_searched >= max_variants: break
+            if not nick.strip(): continue
+            nick_search_name = standardize_name_for_search(decedent_last, nick)
+            if nick_search_name.upper() in {name.upper() for name in search_names}: continue
+            search_names.append(nick_search_name); variants_searched += 1
+    return search_names
+
+def plan_coalesced_rp_searches(leads_to_process: list, tier_settings_dict: dict) -> dict:
+    """
+    Groups the leads' planned searches by search name and merges overlapping date windows. Returns
+    {"lead_searches": searches the leads would run on their own, "union_searches": [...]}, where each union search
+    is a dict of search_name, date_from, date_to, max_pages and lead_windows (distinct lead windows covered).
+    Only union windows covering two or more distinct lead windows are listed.
+    """
+    windows_by_name = {}; lead_searches = 0
+    for lead_dict in leads_to_process:
+        decedent_last = str(lead_dict.get("decedent_last","")).strip()
+        probate_filing_date_obj = parse_probate_filing_date_from_input(str(lead_dict.get("filing_date","")).strip())
+        if not decedent_last or not probate_filing_date_obj: continue
+        lead_window = _rp_search_window(probate_filing_date_obj)
+        for search_name in _planned_search_names(decedent_last, str(lead_dict.get("decedent_first","")).strip(), tier_settings_dict):
+            windows_by_name.setdefault(search_name.upper(), set()).add(lead_window); lead_searches += 1
+
+    max_pages_per_window = tier_settings_dict.get("max_pages_per_tier", 2)
+    union_searches = []
+    for search_name, lead_windows in windows_by_name.items():
+        merged = [] # [date_from, date_to, distinct lead windows]
+        for window_from, window_to in sorted(lead_windows):
+            if merged and window_from <= merged[-1][1] + timedelta(days=1) and (max(merged[-1][1], window_to) - merged[-1][0]).days <= RP_COALESCE_MAX_UNION_DAYS:
+                merged[-1][1] = max(merged[-1][1], window_to); merged[-1][2] += 1
+            else:
+                merged.append([window_from, window_to, 1])
+        for date_from, date_to, window_count in merged:
+            if window_count < 2: continue
+            union_searches.append({"search_name": search_name, "date_from": date_from, "date_to": date_to,
+                                   "max_pages": max_pages_per_window * window_count, "lead_windows": window_count})
+    return {"lead_searches": lead_searches, "union_searches": union_searches}
+
+def _run_union_search(page: Page, union_index: int, total_unions: int, union_search: dict, delay_before_search_ms: int = 0) -> list:
+    """Runs one planned union search so the search cache holds it for the leads it covers. Returns its records."""
+    date_from_str = union_search["date_from"].strftime("%m/%d/%Y"); date_to_str = union_search["date_to"].strftime("%m/%d/%Y")
+    ts_print(f"--- Union search {union_index+1} of {total_unions}: '{union_search['search_name']}' {date_from_str}-{date_to_str} "
+             f"(covers {union_search['lead_windows']} lead windows) ---")
+    if delay_before_search_ms: page.wait_for_timeout(delay_before_search_ms)
+    records, search_outcome = _execute_single_search_with_outcome(page, union_search["search_name"], "PLAN_UNION", date_from_str, date_to_str, union_search["max_pages"], 1)
+    _count_rp_search({"COMPLETE": "union_complete", "CACHED": "union_cached", "CACHED_TRUNCATED": "union_cached"}.get(search_outcome, "union_wasted"))
+    ts_print(f"--- Union search '{union_search['search_name']}' {date_from_str}-{date_to_str}: {search_outcome}, {len(records)} rows"
+             f"{'' if search_outcome in ('COMPLETE', 'CACHED') else ' (its leads will search their own windows)'} ---")
+    return records
+
+def _process_rp_lead(page: Page, lead_index: int, total_leads: int, lead_dict_from_csv: dict, delay_before_search_ms: int = 0) -> list:
+    """Validates one lead and runs its tiered RP search on page. Returns its property rows ([] if skipped or none found)."""
+    ts_print(f"--- Processing lead {lead_index+1} of {total_leads}: {lead_dict_from_csv.get('decedent_last','N/A')}, {lead_dict_from_csv.get('decedent_first','')} (Original Signal: {lead_dict_from_csv.get('signal_strength','N/A')}) ---")
+
+    probate_filing_date_str = str(lead_dict_from_csv.get("filing_date","")).strip()
+    if not str(lead_dict_from_csv.get("decedent_last","")).strip():
+        ts_print(f"[WARN] Lead {lead_index+1} missing last name. Skip.")
+        return []
+
+    probate_filing_date_obj = parse_probate_filing_date_from_input(probate_filing_date_str)
+    if not probate_filing_date_obj:
+        ts_print(f"[WARN] Lead {lead_index+1} ('{lead_dict_from_csv.get('decedent_last')}') invalid/missing filing_date ('{probate_filing_date_str}'). Skip.")
+        return []
+
+    if delay_before_search_ms: page.wait_for_timeout(delay_before_search_ms) # Small polite delay between leads
+
+    property_records_this_lead = search_rp_for_decedent_and_extract(page, lead_dict_from_csv, probate_filing_date_obj)
+
+    if property_records_this_lead:
+        ts_print(f"[LEAD SUCCESS] Found {len(property_records_this_lead)} property rows for {lead_dict_from_csv.get('decedent_last')}, {lead_dict_from_csv.get('decedent_first') or ''}.")
+    else:
+        ts_print(f"--- No property records found for {lead_dict_from_csv.get('decedent_last')}, {lead_dict_from_csv.get('decedent_first') or ''}. Proceeding to next lead. ---")
+    return property_records_this_lead
+
+
+def _rp_worker(worker_id: int, lead_queue: queue.Queue, lead_results: list, total_leads: int, process_item=None,
+               stop_event: threading.Event = None):
+    """
+    Worker thread: owns one browser and page, and processes queued (position, lead) items until the queue is empty.
+    process_item (default _process_rp_lead) is called as process_item(page, position, total, item, delay_ms).
+    With a stop_event, the first lead that returns rows sets it and every worker stops taking new leads.
+    """
+    process_item = process_item or _process_rp_lead
+    leads_done = 0
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            try:
+                page = browser.new_context(user_agent=RP_USER_AGENT).new_page()
+                while not (stop_event and stop_event.is_set()):
+                    try:
+                        lead_position, lead_dict_from_csv = lead_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    try:
+                        lead_results[lead_position] = process_item(page, lead_position, total_leads, lead_dict_from_csv,
+                                                                       RP_DELAY_BETWEEN_LEADS_MS if leads_done else 0)
+                    except Exception as e_lead:
+                        ts_print(f"[ERROR] Worker {worker_id}: lead {lead_position+1} failed: {e_lead}")
+                        _capture_screenshot(page, f"worker{worker_id}_lead{lead_position+1}_error")
+                        lead_results[lead_position] = []
+                    leads_done += 1
+                    if stop_event and lead_results[lead_position]:
+                        ts_print(f"[INFO][TEST_MODE] STOP_AFTER_FIRST_SUCCESSFUL_LEAD is True. Lead {lead_position+1} found records; workers stop taking leads.")
+                        stop_event.set()
+            finally:
+                browser.close()
+    except Exception as e_worker:
+        ts_print(f"[FATAL] Worker {worker_id} stopped: {e_worker}")
+    ts_print(f"[INFO] Worker {worker_id} finished after {leads_done} lead(s).")
+
+
+async def run_rp_leads_concurrently(leads_to_process: list, num_workers: int, process_item=None,
+                                    stop_after_first_success: bool = False) -> list:
+    """
+    Processes leads on num_workers worker threads (see RP_NUM_WORKERS) and returns one list of property rows
+    per lead, in input order. The tiered search and its retries run unchanged inside each worker.
+    process_item replaces _process_rp_lead for other work items (the planned union searches).
+    stop_after_first_success mirrors STOP_AFTER_FIRST_SUCCESSFUL_LEAD: leads already in flight finish, the rest are skipped.
+    """
+    stop_event = threading.Event() if stop_after_first_success else None
+    lead_queue = queue.Queue()
+    for lead_position, lead_dict_from_csv in enumerate(leads_to_process):
+        lead_queue.put((lead_position, lead_dict_from_csv))
+    lead_results = [None] * len(leads_to_process)
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="rp-worker") as executor:
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, _rp_worker, worker_id, lead_queue, lead_results, len(leads_to_process), process_item, stop_event)
+            for worker_id in range(1, num_workers + 1)
+        ))
+
+    for lead_position, records in enumerate(lead_results):
+        if records is None:
+            if not (stop_event and stop_event.is_set()):
+                ts_print(f"[WARN] Lead {lead_position+1} was not processed (no worker could take it).")
+            lead_results[lead_position] = []
+    return lead_results
+
 def run_targeted_rp_scrape() -> pd.DataFrame:
     ts_print(f"--- Starting Harris County RP TARGETED Scraper (v12.1) ---")
     ts_print(f"Reading leads from: {INPUT_PROBATE_LEADS_CSV}")
     ts_print(f"Output CSV: {OUT_TARGETED_CSV}")
     ts_print(f"Tier Settings: Enable Tier 3 = {TIER_SETTINGS['enable_tier_3']}, Max Pages per Tier = {TIER_SETTINGS['max_pages_per_tier']}")
     all_found_property_records_all_leads = []
-    STOP_AFTER_FIRST_SUCCESSFUL_LEAD = False
-    
+    global RP_REQUEST_THROTTLE
+
     try:
         probate_leads_df = pd.read_csv(INPUT_PROBATE_LEADS_CSV, sep=';', dtype=str).fillna("")
         ts_print(f"Loaded {len(probate_leads_df)} leads from CSV.")
@@ -907,58 +1438,73 @@ def run_targeted_rp_scrape() -> pd.DataFrame:
         ts_print(f"[FATAL] Error reading or processing CSV: {e_csv}")
         return pd.DataFrame()
     
-    with sync_playwright() as p:
-        browser = None
-        page_for_screenshot_context = None
-        try:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36")
-            page = context.new_page()
-            page_for_screenshot_context = page # For capturing screenshots in except blocks
-
-            for i, lead_dict_from_csv in enumerate(leads_to_process):
-                ts_print(f"--- Processing lead {i+1} of {len(leads_to_process)}: {lead_dict_from_csv.get('decedent_last','N/A')}, {lead_dict_from_csv.get('decedent_first','')} (Original Signal: {lead_dict_from_csv.get('signal_strength','N/A')}) ---")
-                
-                probate_filing_date_str = str(lead_dict_from_csv.get("filing_date","")).strip()
-                if not str(lead_dict_from_csv.get("decedent_last","")).strip():
-                    ts_print(f"[WARN] Lead {i+1} missing last name. Skip.")
-                    continue
-                
-                probate_filing_date_obj = parse_probate_filing_date_from_input(probate_filing_date_str)
-                if not probate_filing_date_obj:
-                    ts_print(f"[WARN] Lead {i+1} ('{lead_dict_from_csv.get('decedent_last')}') invalid/missing filing_date ('{probate_filing_date_str}'). Skip.")
-                    continue
-                
-                if i > 0 : page.wait_for_timeout(1000) # Small polite delay between leads
-                
-                property_records_this_lead = search_rp_for_decedent_and_extract(page, lead_dict_from_csv, probate_filing_date_obj)
-                
-                if property_records_this_lead:
-                    ts_print(f"[LEAD SUCCESS] Found {len(property_records_this_lead)} property rows for {lead_dict_from_csv.get('decedent_last')}, {lead_dict_from_csv.get('decedent_first') or ''}.")
-                    all_found_property_records_all_leads.extend(property_records_this_lead)
-                    if STOP_AFTER_FIRST_SUCCESSFUL_LEAD:
-                        ts_print(f"[INFO][TEST_MODE] STOP_AFTER_FIRST_SUCCESSFUL_LEAD is True. Stopping processing further leads.")
-                        break
-                else:
-                    ts_print(f"--- No property records found for {lead_dict_from_csv.get('decedent_last')}, {lead_dict_from_csv.get('decedent_first') or ''}. Proceeding to next lead. ---")
-        
-        except PlaywrightTimeout as e_fto:
-            ts_print(f"[FATAL] Playwright Timeout during scraping: {e_fto}")
-            _capture_screenshot(page_for_screenshot_context, "fatal_timeout_in_main_loop")
-        except PlaywrightError as e_fpw:
-            ts_print(f"[FATAL] Playwright Error during scraping: {e_fpw}")
-            _capture_screenshot(page_for_screenshot_context, "fatal_playwright_error_in_main_loop")
-        except Exception as e_main_loop:
-            ts_print(f"[FATAL] Main scraping loop failed: {e_main_loop}")
-            _capture_screenshot(page_for_screenshot_context, "fatal_unexpected_error_in_main_loop")
-        finally:
-            ts_print("Closing browser.")
-            if browser:
-                try:
-                    browser.close()
-                except Exception as e_bc:
-                    ts_print(f"[WARN] Error closing browser: {e_bc}")
-
+    union_searches = []
+    if RP_COALESCE_LEAD_WINDOWS and not RP_SEARCH_CACHE_ENABLED:
+        ts_print("[WARN] RP_COALESCE_LEAD_WINDOWS needs RP_SEARCH_CACHE_ENABLED. Leads will search their own windows.")
+    elif RP_COALESCE_LEAD_WINDOWS:
+        search_plan = plan_coalesced_rp_searches(leads_to_process, TIER_SETTINGS)
+        union_searches = search_plan["union_searches"]
+        ts_print(f"Search plan: {search_plan['lead_searches']} lead searches planned; {len(union_searches)} union searches cover "
+                 f"{sum(u['lead_windows'] for u in union_searches)} overlapping lead windows.")
+
+    num_workers = max(1, min(RP_NUM_WORKERS, len(leads_to_process)))
+    if num_workers > 1:
+        ts_print(f"Starting {num_workers} RP workers for {len(leads_to_process)} leads. Request ceiling: {RP_MAX_REQUESTS_PER_MINUTE or 'none'}/min.")
+        RP_REQUEST_THROTTLE = RpRequestThrottle(RP_MAX_REQUESTS_PER_MINUTE)
+        run_started = time.monotonic()
+        if union_searches:
+            asyncio.run(run_rp_leads_concurrently(union_searches, min(num_workers, len(union_searches)), _run_union_search))
+        for property_records_this_lead in asyncio.run(run_rp_leads_concurrently(leads_to_process, num_workers,
+                                                                                 stop_after_first_success=STOP_AFTER_FIRST_SUCCESSFUL_LEAD)):
+            all_found_property_records_all_leads.extend(property_records_this_lead)
+        ts_print(f"Concurrent run finished in {time.monotonic() - run_started:.1f}s. Portal requests issued: {RP_REQUEST_THROTTLE.requests_issued}.")
+    else:
+        with sync_playwright() as p:
+            browser = None
+            page_for_screenshot_context = None
+            try:
+                browser = p.chromium.launch(headless=True)
+                context = browser.new_context(user_agent=RP_USER_AGENT)
+                page = context.new_page()
+                page_for_screenshot_context = page # For capturing screenshots in except blocks
+
+                for u, union_search in enumerate(union_searches):
+                    _run_union_search(page, u, len(union_searches), union_search, RP_DELAY_BETWEEN_LEADS_MS if u > 0 else 0)
+
+                for i, lead_dict_from_csv in enumerate(leads_to_process):
+                    property_records_this_lead = _process_rp_lead(page, i, len(leads_to_process), lead_dict_from_csv,
+                                                                  RP_DELAY_BETWEEN_LEADS_MS if i > 0 else 0)
+                    if property_records_this_lead:
+                        all_found_property_records_all_leads.extend(property_records_this_lead)
+                        if STOP_AFTER_FIRST_SUCCESSFUL_LEAD:
+                            ts_print(f"[INFO][TEST_MODE] STOP_AFTER_FIRST_SUCCESSFUL_LEAD is True. Stopping processing further leads.")
+                            break
+
+            except PlaywrightTimeout as e_fto:
+                ts_print(f"[FATAL] Playwright Timeout during scraping: {e_fto}")
+                _capture_screenshot(page_for_screenshot_context, "fatal_timeout_in_main_loop")
+            except PlaywrightError as e_fpw:
+                ts_print(f"[FATAL] Playwright Error during scraping: {e_fpw}")
+                _capture_screenshot(page_for_screenshot_context, "fatal_playwright_error_in_main_loop")
+            except Exception as e_main_loop:
+                ts_print(f"[FATAL] Main scraping loop failed: {e_main_loop}")
+                _capture_screenshot(page_for_screenshot_context, "fatal_unexpected_error_in_main_loop")
+            finally:
+                ts_print("Closing browser.")
+                if browser:
+                    try:
+                        browser.close()
+                    except Exception as e_bc:
+                        ts_print(f"[WARN] Error closing browser: {e_bc}")
+
+    if RP_SEARCH_CACHE_ENABLED: ts_print(f"RP search cache: {RP_SEARCH_CACHE.stats_line()}")
+    ts_print(f"RP searches executed on the portal: {RP_SEARCH_COUNTS['portal_searches']} "
+             f"(answered from cache: {RP_SEARCH_COUNTS['cache_served']}).")
+    if union_searches:
+        ts_print(f"RP union searches: {len(union_searches)} planned, {RP_SEARCH_COUNTS['union_complete']} complete, "
+                 f"{RP_SEARCH_COUNTS['union_cached']} already cached, {RP_SEARCH_COUNTS['union_wasted']} wasted (truncated or failed).")
+    RP_ARTIFACTS.flush()
+    ts_print(f"Debug artifacts ({RP_ARTIFACT_MODE}): {RP_ARTIFACTS.stats_line()}")
     if not all_found_property_records_all_leads:
         ts_print("No property records collected overall after processing leads.")
         return pd.DataFrame()
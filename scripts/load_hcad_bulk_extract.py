@@ -0,0 +1,33 @@
+# load_hcad_bulk_extract.py
+#
+# Loads an HCAD real-account bulk extract (the tab-delimited real_acct.txt and owners.txt from HCAD's data
+# downloads) into the local store script4_hcad_enrichment.py reads when HCAD_BULK_EXTRACT_MODE is on.
+# Any previous contents of the store are replaced.
+#
+#   python scripts/load_hcad_bulk_extract.py ~/Downloads/Real_acct_owner
+#   python scripts/load_hcad_bulk_extract.py data/hcad_bulk_fixture --db hcad_cache/hcad_bulk_fixture.sqlite3
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import script4_hcad_enrichment as hcad  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load an HCAD bulk extract into the offline enrichment store.")
+    parser.add_argument("extract_dir", nargs="?", default=hcad.HCAD_BULK_EXTRACT_DIR,
+                        help=f"Folder holding real_acct.txt and owners.txt (default: {hcad.HCAD_BULK_EXTRACT_DIR})")
+    parser.add_argument("--db", help=f"SQLite file to load into (default: {hcad.HCAD_BULK_EXTRACT_DB_PATH})")
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.extract_dir, "real_acct.txt")):
+        print(f"ERROR: {os.path.join(args.extract_dir, 'real_acct.txt')} not found.")
+        return 1
+    store = hcad.HcadBulkExtractStore(args.db) if args.db else hcad.HCAD_BULK_EXTRACT
+    return 0 if store.load(args.extract_dir) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+# rescore_hcad_owner_matches.py
+#
+# Re-runs the owner matching and review flagging stage of script4_hcad_enrichment.py on an already
+# enriched CSV, without a browser or any HCAD requests. Scores, hcad_owner_match_type, needs_review_flag
+# and review_reason are recomputed; every other column is written back unchanged.
+#
+#   python scripts/rescore_hcad_owner_matches.py HCAD_Enrichment_Extractions/script4_hcad_enriched_20250617_224245.csv
+#   python scripts/rescore_hcad_owner_matches.py enriched.csv --output enriched_rescored.csv
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import script4_hcad_enrichment as hcad  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute HCAD owner-match scores and review flags for an enriched CSV.")
+    parser.add_argument("input_csv", help="Enriched CSV written by script4_hcad_enrichment.py")
+    parser.add_argument("--output", help="Where to write the rescored CSV (default: <input>_rescored.csv)")
+    args = parser.parse_args()
+
+    output_csv = args.output or f"{os.path.splitext(args.input_csv)[0]}_rescored.csv"
+    hcad.rescore_hcad_owner_matches_csv(args.input_csv, output_csv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# test_hcad_bulk_extract.py
+#
+# Loads the synthetic extract in data/hcad_bulk_fixture into a temporary store and checks the offline
+# tier searches (queries built by RowContext, as search_hcad_for_row does) and detail records.
+#
+#   python -m pytest tests
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+import script4_hcad_enrichment as hcad  # noqa: E402
+
+FIXTURE_DIR = os.path.join(REPO_DIR, "data", "hcad_bulk_fixture")
+
+TRINITY_ROW = {
+    "rp_legal_description_text": "TRINITY GARDENS", "rp_legal_block": "4", "rp_legal_lot": "1", "rp_legal_sec": "5",
+    "probate_lead_decedent_first": "JANE", "probate_lead_decedent_last": "DOE",
+    "cleaned_rp_party_first_name": "JANE", "cleaned_rp_party_last_name": "DOE",
+    "rp_grantee_full_names_list": ["PETER SMITH"], "match_confidence_level": "High",
+}
+MANDELL_ROW = {
+    "rp_legal_description_text": "MANDELL PLACE", "rp_legal_block": "2", "rp_legal_tract": "15A",
+    "probate_lead_decedent_first": "JOHN", "probate_lead_decedent_last": "MOORE",
+    "rp_grantee_full_names_list": [], "match_confidence_level": "High",
+}
+HEIGHTS_ROW = {
+    "rp_legal_description_text": "HOUSTON HEIGHTS", "rp_legal_block": "100",
+    "probate_lead_decedent_last": "OWNER07", "rp_grantee_full_names_list": [], "match_confidence_level": "Low",
+}
+
+
+@pytest.fixture(scope="module")
+def bulk_store(tmp_path_factory):
+    store = hcad.HcadBulkExtractStore(str(tmp_path_factory.mktemp("bulk") / "hcad_bulk.sqlite3"))
+    assert store.load(FIXTURE_DIR) == 31
+    return store
+
+
+@pytest.fixture(autouse=True)
+def first_page_only(monkeypatch):
+    monkeypatch.setattr(hcad, "HCAD_PAGINATION_HARVEST_MAX_RECORDS", 0)
+
+
+def tier_search(store, rp_row, tier_name):
+    """(status, matching accounts) for the row's query at tier_name."""
+    legal_query, owner_query = hcad.RowContext(pd.Series(rp_row)).tier_queries[tier_name]
+    status, data = store.search(tier_name, legal_query, owner_query)
+    return status, [summary["hcad_account_summary"] for summary in data or []]
+
+
+@pytest.mark.parametrize("rp_row, tier_name, expected_status, expected_accounts", [
+    (TRINITY_ROW, "T0_ExactLotBlockSubdivision", "SINGLE_ITEM_IN_LIST", ["0660160040001"]),
+    (TRINITY_ROW, "T1_GranteeLastName_Subdivision", "SINGLE_ITEM_IN_LIST", ["0660160040002"]),
+    (TRINITY_ROW, "T1_GrantorLastName_Subdivision", "SINGLE_ITEM_IN_LIST", ["0660160040001"]),
+    (TRINITY_ROW, "T2_ExactLegal", "MULTIPLE_HITS", ["0660160040001", "0660160040002", "0660160040003"]),
+    (TRINITY_ROW, "T3_DropSec", "MULTIPLE_HITS", ["0660160040001", "0660160040002", "0660160040003"]),
+    (TRINITY_ROW, "T4_Subdivision_Block", "MULTIPLE_HITS", ["0660160040001", "0660160040002", "0660160040003"]),
+    (MANDELL_ROW, "T2_ExactLegal", "SINGLE_ITEM_IN_LIST", ["0522220000014"]),
+    (MANDELL_ROW, "T4_Subdivision_Block", "SINGLE_ITEM_IN_LIST", ["0522220000014"]),
+    (HEIGHTS_ROW, "T1_GrantorLastName_Subdivision", "SINGLE_ITEM_IN_LIST", ["0031001000007"]),
+    (HEIGHTS_ROW, "Fallback_Owner_SubdivisionContains", "SINGLE_ITEM_IN_LIST", ["0031001000007"]),
+])
+def test_tier_search_statuses(bulk_store, rp_row, tier_name, expected_status, expected_accounts):
+    assert tier_search(bulk_store, rp_row, tier_name) == (expected_status, expected_accounts)
+
+
+def test_broad_block_returns_first_page_as_pagination_too_large(bulk_store):
+    search_info = {}
+    legal_query, owner_query = hcad.RowContext(pd.Series(HEIGHTS_ROW)).tier_queries["T4_Subdivision_Block"]
+    status, data = bulk_store.search("T4_Subdivision_Block", legal_query, owner_query, search_info)
+    assert status == "PAGINATION_TOO_LARGE"
+    assert search_info["num_records"] == 25
+    assert len(data) == hcad.HCAD_RESULTS_PER_PAGE
+
+
+def test_unknown_legal_returns_no_hits(bulk_store):
+    assert bulk_store.search("T4_Subdivision_Block", "BLK 9 NOWHERE ACRES") == ("NO_HITS", None)
+
+
+def test_summary_detail_url_leads_to_detail(bulk_store):
+    _, data = bulk_store.search("T0_ExactLotBlockSubdivision", "LT 1 BLK 4 TRINITY GARDENS")
+    assert data[0]["hcad_owner_summary"] == "DOE JANE"
+    assert data[0]["hcad_address_summary"] == "7710 LANEWOOD ST"
+    assert data[0]["hcad_market_value_summary"] == 85500.0
+    assert data[0]["hcad_detail_url"].endswith("acct=0660160040001")
+
+
+def test_detail_fields(bulk_store):
+    detail = bulk_store.detail("0522220000014")
+    assert detail["hcad_account"] == "0522220000014"
+    assert detail["hcad_owner_full_name"] == "MOORE JOHN THOMAS & LINDA L"
+    assert detail["hcad_legal_desc_detail"] == "TR 15A BLK 2 MANDELL PLACE"
+    assert detail["hcad_site_address"].startswith("1512 W ALABAMA ST")
+    assert detail["hcad_pct_ownership"] == 50.0
+    assert detail["hcad_market_value_detail"] == 50140.0
+    assert detail["hcad_land_area_sf"] == 6250.0
+    assert detail["hcad_detail_level"] == "CORE"
+    assert detail["hcad_land_data_json"] is None # Not in the extract
+    assert bulk_store.detail("0000000000000") is None